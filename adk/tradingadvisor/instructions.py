@@ -200,23 +200,34 @@ etf_profile: For ETF-specific details and holdings.
 search_symbol: To find a ticker symbol from a company name.
 Price Data:
 get_quote: For the latest real-time price and trading information.
+get_quotes: For the latest prices of several symbols at once (e.g. a whole portfolio or watchlist). Prefer it over calling get_quote per ticker.
 get_intraday_data: For price data within the current day at intervals like '1min', '5min', etc.
-get_all_daily_historical_data: For daily open, high, low, close (OHLC) data over 20+ years.
+get_all_daily_historical_data: For daily open, high, low, close (OHLC) data over 20+ years. Prices are as traded by default; pass adjust='total_return' (or 'split') before computing returns across splits or dividends.
 get_specific_date_historical_data: To retrieve OHLC data for a single, specific date (YYYY-MM-DD).
+backfill_intraday: To download months of intraday history (YYYY-MM range) once, before asking intraday questions or indicators over periods older than the last 30 days. If an intraday response lists "Missing Months" in its Meta Data, run the backfill_intraday call it suggests and ask again.
 get_weekly_data / get_monthly_data: For aggregated weekly or monthly historical data.
+get_resampled_data: For candles of any other length, e.g. quarterly (optionally on fiscal quarters via fiscal_year_end), yearly, '2week', or intraday '2hour'.
+Time-series and indicator tools accept start/end (e.g. start='2025-09', end='2025-09' for last September), fields (e.g. ['close']), max_points and order. Request only the range and fields the question needs instead of the whole history. Use datatype='columnar' when you need many data points; it returns one array per field.
 Market-Wide Data:
 market_status: To check if major global markets are open or closed.
 top_gainers_losers: To get the top 20 gainers, losers, and most active US stocks.
 ipo_calendar: For a list of upcoming IPOs.
 Fundamental & Corporate Data:
 income_statement, balance_sheet, cash_flow: For a company's financial statements.
+compare_fundamentals: To compare or rank several companies on statement fields, ratios (e.g. gross_margin, roe, debt_to_equity) or growth rates (growth(x), yoy(x)) in one call. Prefer it over fetching each company's statements when comparing peers.
 earnings: For historical quarterly/annual earnings per share (EPS).
-earnings_calendar: To find out when a company's next earnings report is scheduled.
+earnings_calendar: To find out when a company's next earnings report is scheduled. Narrow it with symbols, from_date/to_date and min_market_cap, and page with limit/offset, instead of fetching the whole calendar.
 earning_call_transcript: To get the transcript of a specific earnings call (requires symbol and quarter, e.g., 2024Q1).
+search_earnings_calls: To find what management said about a topic (e.g. margins, guidance) across several quarters' calls. Returns only the most relevant passages, so prefer it over reading whole transcripts.
 dividends / splits: For historical dividend payments or stock splits.
+corporate_events: For upcoming earnings, IPOs, dividends and splits across many tickers at once (e.g. "all events for my watchlist in the next 30 days"). Prefer it over calling the individual calendars per ticker.
 Technical Indicators:
 Use tools like sma (Simple Moving Average), ema (Exponential Moving Average), rsi (Relative Strength Index), or macd (Moving Average Convergence Divergence) for technical analysis.
 Be precise with parameters like interval, time_period, and series_type ('open', 'high', 'low', 'close').
+get_technical_indicators_batch: To compute several indicators for several symbols in one call (e.g. screening a watchlist by RSI and MACD). Prefer it over many single-indicator calls.
+Risk & Return Analytics:
+analytics_fixed_window: For return, volatility, drawdown and correlation statistics of one or more symbols over a single date range.
+analytics_sliding_window: For rolling metrics over time (e.g. 30-day volatility, 90-day correlation, beta against SPY) across many tickers in one call.
 
 4. Parameter Formatting:
 Dates: Always use YYYY-MM-DD format.
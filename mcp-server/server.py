@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 from starlette.applications import Starlette
 from starlette.routing import Mount
@@ -9,6 +10,7 @@ from tools.stocks_data import mcp as stocks_data_mcp
 from tools.weather import mcp as weather_mcp
 from tools.news import mcp  as news_mcp
 from tools.home_sensors import mcp as home_sensors_mcp
+from tools import http_client
 #from tools.corpora_search import mcp as corpus_tools
 import sys
 from dotenv import load_dotenv
@@ -25,8 +27,17 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+@asynccontextmanager
+async def lifespan(server):
+    try:
+        yield
+    finally:
+        # Close the pooled upstream connections of every tool module.
+        await http_client.aclose_all()
+
+
 # Define main server
-app = FastMCP(name="AdamMCP")
+app = FastMCP(name="AdamMCP", lifespan=lifespan)
 
 
 # Import subserver
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from .ohlcv_store import Bars
+
+# 'none' keeps as-traded prices, 'split' adjusts for splits, 'total_return' for splits and dividends.
+MODES = ("none", "split", "total_return")
+
+
+@dataclass(frozen=True)
+class Adjustment:
+    """
+    Cumulative split and dividend factors for one symbol's daily bars.
+
+    `split` and `total` hold one multiplier per bar in `dates`: the product of the
+    factors of every corporate action dated after that bar. Prices multiplied by
+    `split` are comparable across splits; multiplied by `total` they also fold each
+    dividend back into the earlier prices, so close-to-close changes are total returns.
+    `applied` is the set of (ex-date, kind, value) actions the factors include.
+    """
+
+    dates: np.ndarray
+    split: np.ndarray
+    total: np.ndarray
+    applied: frozenset
+
+    @classmethod
+    def empty(cls) -> "Adjustment":
+        return cls(np.array([], dtype="datetime64[D]"), np.ones(0), np.ones(0), frozenset())
+
+    def update(self, bars: Bars, actions: Iterable[tuple[str, str, float]]) -> "Adjustment":
+        """
+        Factors for `bars` and `actions`, reusing these factors where they still hold.
+
+        Bars appended since the last update get factor 1, since every applied action
+        precedes them, and each newly arrived action multiplies the factors of the bars
+        before its ex-date. The factors are only rebuilt from scratch when earlier bars
+        or actions changed. Actions dated after the last bar wait until a bar on or after
+        their ex-date exists, because a dividend's factor depends on the close before it.
+        :param bars: The symbol's whole daily history.
+        :param actions: (ex-date, 'split' or 'dividend', split factor or amount per share) tuples.
+        """
+        if not len(bars):
+            return Adjustment.empty()
+        last = bars.dates[-1]
+        due = frozenset(action for action in actions if action[2] and np.datetime64(action[0], "D") <= last)
+        base = self
+        n = len(self.dates)
+        if n > len(bars) or not np.array_equal(bars.dates[:n], self.dates) or not self.applied <= due:
+            base = Adjustment.empty()
+        extra = np.ones(len(bars) - len(base.dates))
+        split = np.concatenate([base.split, extra])
+        total = np.concatenate([base.total, extra])
+        for date, kind, value in due - base.applied:
+            # Bars before the first bar on or after the ex-date are the ones the action adjusts.
+            i = int(np.searchsorted(bars.dates, np.datetime64(date, "D")))
+            if not i:
+                continue
+            if kind == "split":
+                split[:i] /= value
+                total[:i] /= value
+            elif bars.close[i - 1] > value:
+                total[:i] *= 1 - value / bars.close[i - 1]
+        return Adjustment(np.array(bars.dates), split, total, due)
+
+    def apply(self, bars: Bars, mode: str) -> Bars:
+        """
+        Adjusted copies of the bars these factors were computed for. Volumes are scaled
+        by the split factors only, so share counts stay comparable across splits.
+        """
+        if mode == "none":
+            return bars
+        factor = self.total if mode == "total_return" else self.split
+        return Bars(bars.dates, bars.open * factor, bars.high * factor, bars.low * factor, bars.close * factor, bars.volume / self.split)
@@ -0,0 +1,218 @@
+import asyncio
+import datetime
+import os
+import re
+import time
+
+from dotenv import load_dotenv
+
+from . import http_client
+from .market_calendar import last_session_date, next_session_close
+from .ttl_cache import TTLCache
+
+load_dotenv()
+BASE_URL = "https://www.alphavantage.co/query"
+API_KEY = os.getenv("ALPHAVANTAGE_KEY")
+# Sustained request rate and burst size allowed by the API key's plan.
+REQUESTS_PER_MINUTE = float(os.getenv("ALPHAVANTAGE_REQUESTS_PER_MINUTE", "60"))
+BURST = int(os.getenv("ALPHAVANTAGE_BURST", "1"))
+# How often a request answered with a rate-limit message is queued again.
+RATE_LIMIT_RETRIES = 2
+# Wording of the rate-limit messages, which arrive under "Note" or "Information".
+_RATE_LIMIT_TEXT = re.compile(r"call frequency|rate limit|requests per (second|minute|day)|spreading out", re.IGNORECASE)
+CACHE_SIZE = int(os.getenv("ALPHAVANTAGE_CACHE_SIZE", "512"))
+# Upper bound on the bytes of the cached responses (as received from upstream).
+CACHE_MAX_MB = float(os.getenv("ALPHAVANTAGE_CACHE_MAX_MB", "64"))
+
+_MINUTE, _HOUR, _DAY = 60, 3600, 86400
+# Daily-or-slower data is good until the next market close.
+_UNTIL_CLOSE = "close"
+# Seconds to keep a response per function. Functions not listed are not cached.
+_TTLS = {
+    "GLOBAL_QUOTE": 15,
+    "REALTIME_BULK_QUOTES": 15,
+    "TOP_GAINERS_LOSERS": _MINUTE,
+    "MARKET_STATUS": _MINUTE,
+    # Daily and intraday bars are kept in the OHLCV store, which decides when to refetch them.
+    "TIME_SERIES_INTRADAY": 0,
+    "TIME_SERIES_DAILY": 0,
+    "NEWS_SENTIMENT": 5 * _MINUTE,
+    "TIME_SERIES_DAILY_ADJUSTED": _UNTIL_CLOSE,
+    "TIME_SERIES_WEEKLY": _UNTIL_CLOSE,
+    "TIME_SERIES_WEEKLY_ADJUSTED": _UNTIL_CLOSE,
+    "TIME_SERIES_MONTHLY": _UNTIL_CLOSE,
+    "TIME_SERIES_MONTHLY_ADJUSTED": _UNTIL_CLOSE,
+    "ANALYTICS_FIXED_WINDOW": _UNTIL_CLOSE,
+    "EARNINGS_CALENDAR": 12 * _HOUR,
+    "IPO_CALENDAR": 12 * _HOUR,
+    "SYMBOL_SEARCH": _DAY,
+    "LISTING_STATUS": _DAY,
+    "OVERVIEW": _DAY,
+    "ETF_PROFILE": _DAY,
+    "DIVIDENDS": _DAY,
+    "SPLITS": _DAY,
+    "EARNINGS": _DAY,
+    "INCOME_STATEMENT": 3 * _DAY,
+    "BALANCE_SHEET": 3 * _DAY,
+    "CASH_FLOW": 3 * _DAY,
+    "EARNINGS_CALL_TRANSCRIPT": 30 * _DAY,
+}
+# A daily series that does not reach the last closed session yet is re-checked this often.
+_PENDING_CLOSE_TTL = 15 * _MINUTE
+_UPPER = {"function", "symbol", "symbols", "tickers", "from_symbol", "to_symbol", "from_currency", "to_currency", "exchange", "SYMBOLS", "INTERVAL", "CALCULATIONS", "OHLC"}
+_LOWER = {"interval", "series_type", "datatype", "outputsize", "horizon", "topics", "sort"}
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every Alpha Vantage call in the process.
+
+    Callers queue on a lock (FIFO), so requests leave in the order they arrived,
+    no faster than `rate` per second once the initial burst is spent.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _queue(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._lock, self._loop = asyncio.Lock(), loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        async with self._queue():
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def drain(self) -> None:
+        """
+        Drop any saved-up tokens, e.g. after the upstream reported a burst.
+        """
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+
+
+bucket = TokenBucket(REQUESTS_PER_MINUTE / 60.0, BURST)
+cache = TTLCache(CACHE_SIZE, int(CACHE_MAX_MB * 1024 * 1024))
+_in_flight: dict[tuple, asyncio.Future] = {}
+
+
+def normalize(params: dict) -> dict:
+    """
+    Canonical form of a parameter set: symbols upper-cased, intervals and other
+    enumerations lower-cased (upper-cased for the analytics endpoints, which use
+    upper-case names), empty values dropped.
+    """
+    out = {}
+    for name, value in params.items():
+        if name == "apikey" or value is None or value == "":
+            continue
+        value = str(value).strip()
+        if name in _UPPER:
+            value = value.upper()
+        elif name in _LOWER:
+            value = value.lower()
+        out[name] = value
+    return out
+
+
+def _key(params: dict) -> tuple:
+    return tuple(sorted(params.items()))
+
+
+def _policy(params: dict):
+    """
+    How long a response to these parameters may be cached: seconds, or _UNTIL_CLOSE.
+    """
+    function = params.get("function", "")
+    if function in _TTLS:
+        return _TTLS[function]
+    if "symbol" in params and "interval" in params:
+        # Technical indicators follow the interval they are computed on.
+        return _MINUTE if params["interval"].endswith("min") else _UNTIL_CLOSE
+    return 0
+
+
+def _ttl(params: dict, data) -> float:
+    if isinstance(data, dict) and {"Error Message", "Note", "Information"} & data.keys():
+        return 0
+    ttl = _policy(params)
+    if ttl != _UNTIL_CLOSE:
+        return ttl
+    meta = data.get("Meta Data", {}) if isinstance(data, dict) else {}
+    refreshed = meta.get("3. Last Refreshed") or meta.get("3: Last Refreshed") or ""
+    if refreshed and refreshed[:10] < last_session_date().isoformat():
+        # Today's bar is not published yet; look again soon rather than tomorrow.
+        return _PENDING_CLOSE_TTL
+    return (next_session_close() - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+
+
+async def _fetch(params: dict):
+    data, size = await _fetch_upstream(params)
+    cache.set(_key(params), data, _ttl(params, data), size)
+    return data
+
+
+def throttled(data) -> bool:
+    """
+    Whether a response is Alpha Vantage's per-minute or daily rate-limit message.
+    Other "Information" messages, such as the premium-endpoint notice, are not.
+    """
+    if not isinstance(data, dict):
+        return False
+    message = data.get("Note") or data.get("Information")
+    return isinstance(message, str) and "premium endpoint" not in message.lower() and bool(_RATE_LIMIT_TEXT.search(message))
+
+
+async def _fetch_upstream(params: dict):
+    """
+    :return: (parsed JSON or CSV text, size of the response body in bytes).
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        await bucket.acquire()
+        response = await http_client.get(BASE_URL, params={**params, "apikey": API_KEY})
+        response.raise_for_status()
+        try:
+            data = response.json()
+        except ValueError:
+            # CSV endpoints (and datatype=csv) come back as text.
+            return response.text, len(response.content)
+        if not throttled(data) or attempt == RATE_LIMIT_RETRIES:
+            return data, len(response.content)
+        bucket.drain()
+
+
+async def query(params: dict):
+    """
+    Call the Alpha Vantage query endpoint through the response cache and the shared rate limiter.
+
+    Parameters are normalized first so equivalent calls share cache entries.
+    Concurrent calls with the same parameters share a single upstream request, so
+    the returned payload may be shared between callers and must not be modified.
+    :param params: Query parameters without the API key.
+    :return: Parsed JSON, or the response text for CSV responses.
+    """
+    params = normalize(params)
+    key = _key(params)
+    if _policy(params):
+        cached = cache.get(key, params.get("function", ""))
+        if cached is not None:
+            return cached
+    pending = _in_flight.get(key)
+    if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+        pending = _in_flight[key] = asyncio.ensure_future(_fetch(params))
+        pending.add_done_callback(lambda done: _in_flight.pop(key, None) if _in_flight.get(key) is done else None)
+    # A caller that is cancelled must not cancel the request for everyone else.
+    return await asyncio.shield(pending)
@@ -0,0 +1,376 @@
+import re
+
+import numpy as np
+
+# Calculations of the Alpha Vantage analytics endpoints and their default options.
+CALCULATIONS = {
+    "MIN": {},
+    "MAX": {},
+    "MEAN": {},
+    "MEDIAN": {},
+    "CUMULATIVE_RETURN": {},
+    "VARIANCE": {"annualized": False},
+    "STDDEV": {"annualized": False},
+    "MAX_DRAWDOWN": {},
+    "HISTOGRAM": {"bins": 10},
+    "AUTOCORRELATION": {"lag": 1},
+    "COVARIANCE": {"annualized": False},
+    "CORRELATION": {"method": "PEARSON"},
+}
+# Calculations of the sliding-window endpoint. Each window is updated from the previous one
+# in O(1), so only statistics that can be maintained incrementally are offered.
+SLIDING_CALCULATIONS = {
+    "MEAN": {},
+    "VARIANCE": {"annualized": False},
+    "STDDEV": {"annualized": False},
+    "CUMULATIVE_RETURN": {},
+    "DRAWDOWN": {},
+    "CORRELATION": {},
+    "BETA": {},
+}
+CORRELATION_METHODS = ("PEARSON", "KENDALL", "SPEARMAN")
+
+
+def parse_calculations(text: str, calculations: dict = CALCULATIONS) -> list[tuple[str, str, dict]]:
+    """
+    Parse a CALCULATIONS argument such as 'MEAN,STDDEV(annualized=True),CORRELATION(method=KENDALL)'.
+    :param calculations: The supported calculations and their default options.
+    :return: (result key, calculation name, options) per calculation, in the order given.
+    """
+    parsed = []
+    for item in re.findall(r"[^,(]+(?:\([^)]*\))?", text):
+        item = item.strip()
+        if not item:
+            continue
+        match = re.fullmatch(r"([A-Za-z_]+)\s*(?:\((.*)\))?", item)
+        name = match.group(1).upper() if match else item.upper()
+        if name not in calculations:
+            raise ValueError(f"Unknown calculation '{item}'. Valid calculations: {', '.join(calculations)}")
+        options = dict(calculations[name])
+        for option in filter(None, (part.strip() for part in (match.group(2) or "").split(","))):
+            key, _, value = option.partition("=")
+            key = key.strip().lower()
+            if key not in options:
+                raise ValueError(f"{name} does not take '{key}'")
+            options[key] = _option(value.strip(), options[key])
+        if options.get("method", "PEARSON") not in CORRELATION_METHODS:
+            raise ValueError(f"Unknown correlation method '{options['method']}'. Valid methods: {', '.join(CORRELATION_METHODS)}")
+        parsed.append((item.upper().replace(" ", ""), name, options))
+    return parsed
+
+
+def _option(value: str, default):
+    if isinstance(default, bool):
+        return value.lower() == "true"
+    if isinstance(default, int):
+        return int(value)
+    return value.upper()
+
+
+def returns(prices: np.ndarray) -> np.ndarray:
+    """
+    Simple period-over-period returns (one shorter than `prices`).
+    """
+    return prices[1:] / prices[:-1] - 1
+
+
+def max_drawdown(prices: np.ndarray) -> tuple[float, int, int]:
+    """
+    Largest peak-to-trough decline.
+    :return: (drawdown as a negative fraction, index of the peak, index of the trough).
+    """
+    peaks = np.maximum.accumulate(prices)
+    drawdowns = prices / peaks - 1
+    trough = int(np.argmin(drawdowns))
+    peak = int(np.argmax(prices[:trough + 1])) if trough else 0
+    return float(drawdowns[trough]), peak, trough
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    """
+    Ranks along the last axis, ties sharing their average rank.
+    """
+    order = np.argsort(values, axis=-1, kind="stable")
+    ranks = np.empty(values.shape)
+    np.put_along_axis(ranks, order, np.arange(values.shape[-1], dtype=np.float64), axis=-1)
+    for row, ranked in zip(values, ranks):
+        unique, inverse, counts = np.unique(row, return_inverse=True, return_counts=True)
+        if len(unique) < len(row):
+            ranked[:] = (np.bincount(inverse, weights=ranked) / counts)[inverse]
+    return ranks
+
+
+def correlation(matrix: np.ndarray, method: str = "PEARSON") -> np.ndarray:
+    """
+    Correlation between the rows of `matrix` (one row per series, aligned columns).
+    """
+    if method == "SPEARMAN":
+        return np.corrcoef(_ranks(matrix))
+    if method == "KENDALL":
+        out = np.eye(len(matrix))
+        for i, j in zip(*np.triu_indices(len(matrix), 1)):
+            out[i, j] = out[j, i] = kendall_tau(matrix[i], matrix[j])
+        return out
+    return np.corrcoef(matrix)
+
+
+def _tied_pairs(values: np.ndarray) -> int:
+    # Pairs of equal values in a sorted array.
+    counts = np.diff(np.flatnonzero(np.concatenate([[True], values[1:] != values[:-1], [True]])))
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def _inversions(values: np.ndarray) -> int:
+    """
+    Pairs i < j with values[i] > values[j], counted by a bottom-up merge sort of
+    integers in [0, n): at every level, each element of a right-hand run counts the
+    elements of its left-hand neighbour that are larger, found by binary search.
+    """
+    n = len(values)
+    values = values.astype(np.int64)
+    count, width = 0, 1
+    while width < n:
+        index = np.arange(n)
+        block = index // (2 * width)
+        right = (index // width) % 2 == 1
+        # Offsetting every merged block by n keeps the runs of all blocks in one sorted array.
+        keys = block * n + values
+        left_keys, right_keys = keys[~right], keys[right]
+        count += int((np.searchsorted(left_keys, (block[right] + 1) * n) - np.searchsorted(left_keys, right_keys, side="right")).sum())
+        values = np.sort(keys) - block * n
+        width *= 2
+    return count
+
+
+def kendall_tau(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Kendall's tau-b in O(n log n) (Knight's algorithm): after sorting by x, the discordant
+    pairs are the inversions of y, and tied pairs are counted from runs of equal values.
+    """
+    n = len(x)
+    pairs = n * (n - 1) // 2
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+    x_ties = _tied_pairs(x)
+    changed = np.concatenate([[True], (x[1:] != x[:-1]) | (y[1:] != y[:-1]), [True]])
+    counts = np.diff(np.flatnonzero(changed))
+    joint_ties = int((counts * (counts - 1) // 2).sum())
+    y_sorted = np.sort(y)
+    y_ties = _tied_pairs(y_sorted)
+    discordant = _inversions(np.searchsorted(y_sorted, y))
+    denominator = ((pairs - x_ties) * (pairs - y_ties)) ** 0.5
+    if not denominator:
+        return float("nan")
+    return (pairs - x_ties - y_ties + joint_ties - 2 * discordant) / denominator
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sums of every `window` consecutive values along the last axis, from prefix sums:
+    each step adds the value entering the window and drops the one leaving it.
+    """
+    sums = np.cumsum(values, axis=-1)
+    out = sums[..., window - 1:].copy()
+    out[..., 1:] -= sums[..., :-window]
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Maxima of every `window` consecutive values (van Herk/Gil-Werman).
+
+    The series is cut into blocks of `window` values with a running maximum from each
+    block's start and one from its end; a window spans at most two blocks, so its
+    maximum is the larger of the two running maxima at its ends.
+    """
+    n = len(values)
+    blocks = -(-n // window)
+    padded = np.full(blocks * window, -np.inf)
+    padded[:n] = values
+    padded = padded.reshape(blocks, window)
+    from_start = np.maximum.accumulate(padded, axis=1).ravel()
+    from_end = np.maximum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(from_end[:n - window + 1], from_start[window - 1:n])
+
+
+def _rolling_moments(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rolling means and sample variances along the last axis.
+    :return: (values minus their overall mean, rolling means, rolling variances).
+    """
+    # Centering first keeps the prefix sums small, so differencing them loses no precision.
+    center = values.mean(axis=-1, keepdims=True)
+    centered = values - center
+    sums = rolling_sum(centered, window)
+    variance = (rolling_sum(centered * centered, window) - sums * sums / window) / (window - 1)
+    return centered, sums / window + center, np.maximum(variance, 0)
+
+
+def _labels(dates: np.ndarray) -> list[str]:
+    labels = np.datetime_as_string(dates)
+    return labels.tolist() if np.datetime_data(dates.dtype)[0] == "D" else np.char.replace(labels, "T", " ").tolist()
+
+
+def _points(labels: list[str], values: np.ndarray) -> dict:
+    return {label: None if value != value else value for label, value in zip(labels, values.tolist())}
+
+
+def lower_triangle(matrix: np.ndarray) -> list[list[float]]:
+    """
+    Rows of the lower triangle (diagonal included), the way Alpha Vantage lists correlation matrices.
+    """
+    return [matrix[i, :i + 1].tolist() for i in range(len(matrix))]
+
+
+def fixed_window(series: dict, calculations: list[tuple[str, str, dict]], periods_per_year: float) -> dict:
+    """
+    Compute the requested analytics over whole price series.
+
+    Univariate statistics use each symbol's own returns. Covariance and correlation
+    use the dates every symbol traded on, so all series are aligned first.
+    :param series: Symbol -> (dates, prices), both sorted by date.
+    :param calculations: Output of parse_calculations.
+    :param periods_per_year: Bars per year, for annualized variance and standard deviation.
+    :return: Result key -> per-symbol values (or an index plus matrix for COVARIANCE/CORRELATION).
+    """
+    symbol_returns = {symbol: returns(prices) for symbol, (dates, prices) in series.items()}
+    out = {}
+    for key, name, options in calculations:
+        if name in ("COVARIANCE", "CORRELATION"):
+            out[key] = _matrix(series, name, options, periods_per_year)
+            continue
+        result = {}
+        for symbol, (dates, prices) in series.items():
+            r = symbol_returns[symbol]
+            if name in ("MIN", "MAX", "MEAN", "MEDIAN"):
+                result[symbol] = float(getattr(np, name.lower())(r)) if len(r) else None
+            elif name == "CUMULATIVE_RETURN":
+                result[symbol] = float(prices[-1] / prices[0] - 1) if len(prices) else None
+            elif name in ("VARIANCE", "STDDEV"):
+                value = float(np.var(r, ddof=1)) if len(r) > 1 else None
+                if value is not None and options["annualized"]:
+                    value *= periods_per_year
+                result[symbol] = value if name == "VARIANCE" or value is None else value ** 0.5
+            elif name == "MAX_DRAWDOWN":
+                if not len(prices):
+                    result[symbol] = None
+                    continue
+                drawdown, peak, trough = max_drawdown(prices)
+                result[symbol] = {
+                    "max_drawdown": drawdown,
+                    "drawdown_range": {"start_drawdown": _date(dates[peak]), "end_drawdown": _date(dates[trough])},
+                }
+            elif name == "HISTOGRAM":
+                counts, edges = np.histogram(r, bins=options["bins"])
+                result[symbol] = {"bin_count": counts.tolist(), "bin_edges": edges.tolist()}
+            elif name == "AUTOCORRELATION":
+                lag = options["lag"]
+                result[symbol] = float(np.corrcoef(r[:-lag], r[lag:])[0, 1]) if len(r) > lag + 1 else None
+        out[key] = result
+    return out
+
+
+def _date(value: np.datetime64) -> str:
+    return str(value).replace("T", " ")
+
+
+def _align(series: dict, symbols: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :return: (dates on which every symbol traded, their returns with one row per symbol).
+    """
+    common = series[symbols[0]][0]
+    for symbol in symbols[1:]:
+        common = np.intersect1d(common, series[symbol][0], assume_unique=True)
+    prices = [series[symbol][1][np.searchsorted(series[symbol][0], common)] for symbol in symbols]
+    return common, np.vstack([returns(row) for row in prices])
+
+
+def _matrix(series: dict, name: str, options: dict, periods_per_year: float) -> dict:
+    symbols = sorted(series)
+    common, aligned = _align(series, symbols)
+    if len(common) < 3:
+        raise ValueError(f"{name} needs at least 3 dates on which every symbol traded")
+    if name == "COVARIANCE":
+        matrix = np.atleast_2d(np.cov(aligned))
+        if options["annualized"]:
+            matrix = matrix * periods_per_year
+        return {"index": symbols, "covariance": lower_triangle(matrix)}
+    return {"index": symbols, "correlation": lower_triangle(np.atleast_2d(correlation(aligned, options["method"])))}
+
+
+def sliding_window(
+    series: dict,
+    calculations: list[tuple[str, str, dict]],
+    window: int,
+    periods_per_year: float,
+    benchmark: tuple = None,
+) -> dict:
+    """
+    Compute the requested analytics over every window of `window` consecutive returns.
+
+    Each statistic is maintained incrementally with prefix sums (or a block-wise running
+    maximum for drawdowns), so a whole run of windows costs O(n) per series regardless
+    of the window size. Values are labelled with the date that closes their window.
+    CORRELATION is computed between every pair of symbols and BETA against `benchmark`,
+    both on the dates the series have in common.
+    :param series: Symbol -> (dates, prices), both sorted by date.
+    :param calculations: Output of parse_calculations with SLIDING_CALCULATIONS.
+    :param window: Returns per window (at least 2).
+    :param periods_per_year: Bars per year, for annualized variance and standard deviation.
+    :param benchmark: (symbol, dates, prices) of the index BETA is measured against.
+    :return: Result key -> {'RUNNING_<NAME>': symbol -> date -> value}.
+    """
+    if window < 2:
+        raise ValueError("window_size must be at least 2")
+    labels = {symbol: _labels(dates[window:]) for symbol, (dates, _) in series.items()}
+    out = {}
+    for key, name, options in calculations:
+        result = {}
+        if name == "CORRELATION":
+            symbols = sorted(series)
+            if len(symbols) > 1:
+                common, aligned = _align(series, symbols)
+                if aligned.shape[1] >= window:
+                    centered, _, variance = _rolling_moments(aligned, window)
+                    common_labels = _labels(common[window:])
+                    sums = rolling_sum(centered, window)
+                    for i, j in zip(*np.triu_indices(len(symbols), 1)):
+                        covariance = (rolling_sum(centered[i] * centered[j], window) - sums[i] * sums[j] / window) / (window - 1)
+                        with np.errstate(divide="ignore", invalid="ignore"):
+                            values = covariance / np.sqrt(variance[i] * variance[j])
+                        result.setdefault(symbols[i], {})[symbols[j]] = _points(common_labels, values)
+        elif name == "BETA":
+            if benchmark is None:
+                raise ValueError("BETA needs a benchmark")
+            index, dates, prices = benchmark
+            for symbol in series:
+                common, aligned = _align({symbol: series[symbol], index: (dates, prices)}, [symbol, index])
+                if aligned.shape[1] < window:
+                    result[symbol] = {}
+                    continue
+                centered, _, variance = _rolling_moments(aligned, window)
+                sums = rolling_sum(centered, window)
+                covariance = (rolling_sum(centered[0] * centered[1], window) - sums[0] * sums[1] / window) / (window - 1)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    result[symbol] = _points(_labels(common[window:]), covariance / variance[1])
+        else:
+            for symbol, (dates, prices) in series.items():
+                if len(prices) <= window:
+                    result[symbol] = {}
+                    continue
+                if name == "CUMULATIVE_RETURN":
+                    values = prices[window:] / prices[:-window] - 1
+                elif name == "DRAWDOWN":
+                    # Distance of each window's closing price below the highest price within it.
+                    values = prices[window:] / rolling_max(prices, window + 1) - 1
+                else:
+                    _, mean, variance = _rolling_moments(returns(prices), window)
+                    if name == "MEAN":
+                        values = mean
+                    else:
+                        if options["annualized"]:
+                            variance = variance * periods_per_year
+                        values = variance if name == "VARIANCE" else np.sqrt(variance)
+                result[symbol] = _points(labels[symbol], values)
+        out[key] = {f"RUNNING_{name}": result}
+    return out
@@ -0,0 +1,96 @@
+import csv
+import io
+from dataclasses import dataclass
+
+import numpy as np
+
+HORIZONS = ("3month", "6month", "12month")
+
+
+@dataclass(frozen=True)
+class EarningsCalendar:
+    """
+    Columnar earnings calendar, sorted by report date.
+
+    `symbol`, `name`, `currency` and `time_of_day` are object arrays of strings,
+    `report_date` and `fiscal_date_ending` datetime64[D] arrays (NaT when missing),
+    `estimate` a float64 array (NaN when there is no consensus estimate).
+    """
+
+    symbol: np.ndarray
+    name: np.ndarray
+    report_date: np.ndarray
+    fiscal_date_ending: np.ndarray
+    estimate: np.ndarray
+    currency: np.ndarray
+    time_of_day: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    def select(self, start=None, end=None, symbols=None) -> np.ndarray:
+        """
+        Rows reporting within [start, end] (dates, optional) for any of `symbols` (optional).
+        :return: Row indices in report-date order.
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.report_date, np.datetime64(start, "D"), "left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.report_date, np.datetime64(end, "D"), "right"))
+        rows = np.arange(lo, hi)
+        if symbols:
+            rows = rows[np.isin(self.symbol[lo:hi], [symbol.upper() for symbol in symbols])]
+        return rows
+
+    def record(self, i: int) -> dict:
+        """
+        One row in the upstream CSV field names, with typed values.
+        """
+        estimate = self.estimate[i]
+        return {
+            "symbol": self.symbol[i],
+            "name": self.name[i],
+            "reportDate": str(self.report_date[i]) if not np.isnat(self.report_date[i]) else None,
+            "fiscalDateEnding": str(self.fiscal_date_ending[i]) if not np.isnat(self.fiscal_date_ending[i]) else None,
+            "estimate": None if np.isnan(estimate) else float(estimate),
+            "currency": self.currency[i],
+            "timeOfTheDay": self.time_of_day[i] or None,
+        }
+
+
+def _number(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+def _date(value: str) -> str:
+    return value if len(value) == 10 else "NaT"
+
+
+def parse(text: str) -> EarningsCalendar:
+    """
+    Parse the EARNINGS_CALENDAR CSV line by line into typed columns, without a dict per row.
+    """
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader, [])
+    index = {name: i for i, name in enumerate(header)}
+    names = ("symbol", "name", "reportDate", "fiscalDateEnding", "estimate", "currency", "timeOfTheDay")
+    columns = {name: [] for name in names}
+    for row in reader:
+        if not row:
+            continue
+        for name in names:
+            i = index.get(name)
+            columns[name].append(row[i].strip() if i is not None and i < len(row) else "")
+    estimate = np.array([_number(value) for value in columns["estimate"]], dtype=np.float64)
+    report_date = np.array([_date(value) for value in columns["reportDate"]], dtype="datetime64[D]")
+    order = np.argsort(report_date, kind="stable")
+    return EarningsCalendar(
+        symbol=np.array(columns["symbol"], dtype=object)[order],
+        name=np.array(columns["name"], dtype=object)[order],
+        report_date=report_date[order],
+        fiscal_date_ending=np.array([_date(value) for value in columns["fiscalDateEnding"]], dtype="datetime64[D]")[order],
+        estimate=estimate[order],
+        currency=np.array(columns["currency"], dtype=object)[order],
+        time_of_day=np.array(columns["timeOfTheDay"], dtype=object)[order],
+    )
@@ -0,0 +1,140 @@
+import csv
+import io
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .earnings_calendar import EarningsCalendar
+
+EVENT_TYPES = ("earnings", "ipo", "dividend", "split")
+
+
+@dataclass(frozen=True)
+class EventIndex:
+    """
+    Corporate events of every kind in one table, sorted by date.
+
+    `dates` is a datetime64[D] array, `symbols` and `types` object arrays of the
+    same length and `details` the per-event fields. `by_symbol` maps each symbol to
+    the indices of its events (in date order), so a query for a few symbols only
+    touches their rows and a query for a date range is a binary search.
+    """
+
+    dates: np.ndarray
+    symbols: np.ndarray
+    types: np.ndarray
+    details: list
+    by_symbol: dict
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @classmethod
+    def build(cls, events: Iterable[tuple[str, str, str, dict]]) -> "EventIndex":
+        """
+        :param events: (date, symbol, type, details) tuples with ISO dates, in any order.
+        """
+        events = list(events)
+        dates = np.array([date for date, _, _, _ in events], dtype="datetime64[D]")
+        order = np.argsort(dates, kind="stable")
+        symbols = np.array([symbol for _, symbol, _, _ in events], dtype=object)[order]
+        rows: dict[str, list[int]] = {}
+        for i, symbol in enumerate(symbols.tolist()):
+            rows.setdefault(symbol, []).append(i)
+        return cls(
+            dates=dates[order],
+            symbols=symbols,
+            types=np.array([kind for _, _, kind, _ in events], dtype=object)[order],
+            details=[events[i][3] for i in order.tolist()],
+            by_symbol={symbol: np.array(indices, dtype=np.int64) for symbol, indices in rows.items()},
+        )
+
+    def select(self, start=None, end=None, symbols=None, types=None) -> np.ndarray:
+        """
+        Events dated within [start, end] (optional) for any of `symbols` and `types` (optional).
+        :return: Row indices in date order.
+        """
+        start = None if start is None else np.datetime64(start, "D")
+        end = None if end is None else np.datetime64(end, "D")
+        if symbols:
+            parts = []
+            for symbol in dict.fromkeys(symbol.upper() for symbol in symbols):
+                rows = self.by_symbol.get(symbol)
+                if rows is not None:
+                    parts.append(rows[self._within(self.dates[rows], start, end)])
+            rows = np.sort(np.concatenate(parts)) if parts else np.arange(0)
+        else:
+            rows = np.arange(len(self))[self._within(self.dates, start, end)]
+        if types:
+            rows = rows[np.isin(self.types[rows], list(types))]
+        return rows
+
+    @staticmethod
+    def _within(dates: np.ndarray, start, end) -> slice:
+        lo = 0 if start is None else int(np.searchsorted(dates, start, "left"))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, end, "right"))
+        return slice(lo, hi)
+
+    def record(self, i: int) -> dict:
+        return {"date": str(self.dates[i]), "symbol": self.symbols[i], "type": self.types[i], **self.details[i]}
+
+
+def _date(value) -> Optional[str]:
+    return value if isinstance(value, str) and len(value) == 10 and value[4] == "-" else None
+
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def earnings_events(calendar: EarningsCalendar):
+    for i in range(len(calendar)):
+        record = calendar.record(i)
+        date, symbol = record.pop("reportDate"), record.pop("symbol")
+        if date:
+            yield date, symbol, "earnings", record
+
+
+def ipo_events(text: str):
+    """
+    Events from the IPO_CALENDAR CSV (symbol, name, ipoDate, priceRangeLow, priceRangeHigh, currency, exchange).
+    """
+    for row in csv.DictReader(io.StringIO(text)):
+        date = _date(row.get("ipoDate"))
+        if date and row.get("symbol"):
+            yield date, row["symbol"], "ipo", {
+                "name": row.get("name"),
+                "priceRangeLow": _number(row.get("priceRangeLow")),
+                "priceRangeHigh": _number(row.get("priceRangeHigh")),
+                "currency": row.get("currency"),
+                "exchange": row.get("exchange"),
+            }
+
+
+def dividend_events(symbol: str, payload: dict):
+    """
+    Events from a DIVIDENDS response, dated by ex-dividend date.
+    """
+    for row in payload.get("data", []):
+        date = _date(row.get("ex_dividend_date"))
+        if date:
+            yield date, symbol, "dividend", {
+                "amount": _number(row.get("amount")),
+                "declaration_date": _date(row.get("declaration_date")),
+                "record_date": _date(row.get("record_date")),
+                "payment_date": _date(row.get("payment_date")),
+            }
+
+
+def split_events(symbol: str, payload: dict):
+    """
+    Events from a SPLITS response, dated by effective date.
+    """
+    for row in payload.get("data", []):
+        date = _date(row.get("effective_date"))
+        if date:
+            yield date, symbol, "split", {"split_factor": _number(row.get("split_factor"))}
@@ -1,4 +1,3 @@
-import requests
 import datetime
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
@@ -7,6 +6,7 @@ import logging
 import sys
 import json
 from fastmcp import FastMCP
+from . import http_client
 
 load_dotenv()
 
@@ -25,7 +25,7 @@ mcp = FastMCP("cashanova")
 
 
 @mcp.tool
-def get_exchange_rates(from_currency: str = "USD") -> dict:
+async def get_exchange_rates(from_currency: str = "USD") -> dict:
     """
     Get exchange rates for a given currency.
     Args:
@@ -35,14 +35,14 @@ def get_exchange_rates(from_currency: str = "USD") -> dict:
 
     """
 
-    response = requests.get(f"{api_url}/latest/{from_currency}")
+    response = await http_client.get(f"{api_url}/latest/{from_currency}")
     if response.status_code == 200:
         return response.json().get("conversion_rates", {})
     else:
         return {}
 
 @mcp.tool
-def convert(
+async def convert(
     amount: float, from_currency: str = "USD", to_currency: str = "EUR"
 ) -> dict:
     """
@@ -57,7 +57,7 @@ def convert(
         ValueError: If the currency is not supported.
     """
 
-    response = requests.get(f"{api_url}/pair/{from_currency}/{to_currency}/{amount}")
+    response = await http_client.get(f"{api_url}/pair/{from_currency}/{to_currency}/{amount}")
     if response.status_code == 200:
         return response.json()
     else:
@@ -66,19 +66,19 @@ def convert(
         )
     
 @mcp.tool
-def get_supported_currencies() -> list:
+async def get_supported_currencies() -> list:
         """
         Get list of all supported currencies.
         Returns:
             list: List of supported currency codes.
         """
-        response = requests.get(f"{api_url}/codes")
+        response = await http_client.get(f"{api_url}/codes")
         if response.status_code == 200:
             return [code[0] for code in response.json().get("supported_codes", [])]
         return []
 
 @mcp.tool
-def bulk_convert(amount: float, from_currency: str, target_currencies = []) -> dict:
+async def bulk_convert(amount: float, from_currency: str, target_currencies = []) -> dict:
         """
         Convert amount to multiple target currencies at once.
         Args:
@@ -88,7 +88,7 @@ def bulk_convert(amount: float, from_currency: str, target_currencies = []) -> d
         Returns:
             dict: Conversion results for all target currencies.
         """
-        response = requests.get(f"{api_url}/latest/{from_currency}")
+        response = await http_client.get(f"{api_url}/latest/{from_currency}")
         if response.status_code == 200:
             rates = response.json().get("conversion_rates", {})
         else:
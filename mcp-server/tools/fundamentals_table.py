@@ -0,0 +1,286 @@
+import ast
+import difflib
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+STATEMENTS = ("INCOME_STATEMENT", "BALANCE_SHEET", "CASH_FLOW")
+FREQUENCIES = ("annual", "quarterly")
+# Periods of history loaded beyond those returned, so growth and yoy have a previous value.
+LOOKBACK = 4
+# Named metrics and the expressions they stand for.
+RATIOS = {
+    "gross_margin": "grossProfit / totalRevenue",
+    "operating_margin": "operatingIncome / totalRevenue",
+    "net_margin": "netIncome / totalRevenue",
+    "ebitda_margin": "ebitda / totalRevenue",
+    "roe": "netIncome / totalShareholderEquity",
+    "roa": "netIncome / totalAssets",
+    "current_ratio": "totalCurrentAssets / totalCurrentLiabilities",
+    "debt_to_equity": "shortLongTermDebtTotal / totalShareholderEquity",
+    "free_cash_flow": "operatingCashflow - capitalExpenditures",
+    "fcf_margin": "(operatingCashflow - capitalExpenditures) / totalRevenue",
+    "revenue_growth": "growth(totalRevenue)",
+    "net_income_growth": "growth(netIncome)",
+    "price_to_sales": "MarketCapitalization / RevenueTTM",
+}
+# Statement of every field Alpha Vantage reports (netIncome, also in CASH_FLOW, is read from
+# INCOME_STATEMENT). Fields not listed here are looked up in all three statements.
+FIELD_STATEMENTS = {
+    **dict.fromkeys(
+        (
+            "grossProfit", "totalRevenue", "costOfRevenue", "costofGoodsAndServicesSold", "operatingIncome",
+            "sellingGeneralAndAdministrative", "researchAndDevelopment", "operatingExpenses", "investmentIncomeNet",
+            "netInterestIncome", "interestIncome", "interestExpense", "nonInterestIncome", "otherNonOperatingIncome",
+            "depreciation", "depreciationAndAmortization", "incomeBeforeTax", "incomeTaxExpense", "interestAndDebtExpense",
+            "netIncomeFromContinuingOperations", "comprehensiveIncomeNetOfTax", "ebit", "ebitda", "netIncome",
+        ),
+        "INCOME_STATEMENT",
+    ),
+    **dict.fromkeys(
+        (
+            "totalAssets", "totalCurrentAssets", "cashAndCashEquivalentsAtCarryingValue", "cashAndShortTermInvestments",
+            "inventory", "currentNetReceivables", "totalNonCurrentAssets", "propertyPlantEquipment",
+            "accumulatedDepreciationAmortizationPPE", "intangibleAssets", "intangibleAssetsExcludingGoodwill", "goodwill",
+            "investments", "longTermInvestments", "shortTermInvestments", "otherCurrentAssets", "otherNonCurrentAssets",
+            "totalLiabilities", "totalCurrentLiabilities", "currentAccountsPayable", "deferredRevenue", "currentDebt",
+            "shortTermDebt", "totalNonCurrentLiabilities", "capitalLeaseObligations", "longTermDebt", "currentLongTermDebt",
+            "longTermDebtNoncurrent", "shortLongTermDebtTotal", "otherCurrentLiabilities", "otherNonCurrentLiabilities",
+            "totalShareholderEquity", "treasuryStock", "retainedEarnings", "commonStock", "commonStockSharesOutstanding",
+        ),
+        "BALANCE_SHEET",
+    ),
+    **dict.fromkeys(
+        (
+            "operatingCashflow", "paymentsForOperatingActivities", "proceedsFromOperatingActivities",
+            "changeInOperatingLiabilities", "changeInOperatingAssets", "depreciationDepletionAndAmortization",
+            "capitalExpenditures", "changeInReceivables", "changeInInventory", "profitLoss", "cashflowFromInvestment",
+            "cashflowFromFinancing", "proceedsFromRepaymentsOfShortTermDebt", "paymentsForRepurchaseOfCommonStock",
+            "paymentsForRepurchaseOfEquity", "paymentsForRepurchaseOfPreferredStock", "dividendPayout",
+            "dividendPayoutCommonStock", "dividendPayoutPreferredStock", "proceedsFromIssuanceOfCommonStock",
+            "proceedsFromIssuanceOfLongTermDebtAndCapitalSecuritiesNet", "proceedsFromIssuanceOfPreferredStock",
+            "proceedsFromRepurchaseOfEquity", "proceedsFromSaleOfTreasuryStock", "changeInCashAndCashEquivalents",
+            "changeInExchangeRate",
+        ),
+        "CASH_FLOW",
+    ),
+}
+# Numeric OVERVIEW fields that can be used in a metric.
+OVERVIEW_FIELDS = frozenset((
+    "MarketCapitalization", "EBITDA", "PERatio", "PEGRatio", "BookValue", "DividendPerShare", "DividendYield", "EPS",
+    "RevenuePerShareTTM", "ProfitMargin", "OperatingMarginTTM", "ReturnOnAssetsTTM", "ReturnOnEquityTTM", "RevenueTTM",
+    "GrossProfitTTM", "DilutedEPSTTM", "QuarterlyEarningsGrowthYOY", "QuarterlyRevenueGrowthYOY", "AnalystTargetPrice",
+    "TrailingPE", "ForwardPE", "PriceToSalesRatioTTM", "PriceToBookRatio", "EVToRevenue", "EVToEBITDA", "Beta",
+    "SharesOutstanding", "SharesFloat", "PercentInsiders", "PercentInstitutions",
+))
+_OPERATORS = {ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply, ast.Div: np.divide}
+
+
+@dataclass(frozen=True)
+class FundamentalsTable:
+    """
+    Fundamentals in long columnar form: one row per (symbol, fiscal period, field).
+
+    `symbol`, `frequency` ('annual', 'quarterly' or 'overview') and `field` are object
+    arrays, `period` a datetime64[D] array (fiscal date ending; the latest quarter for
+    overview fields) and `value` a float64 array, NaN where upstream reported 'None'.
+    """
+
+    symbol: np.ndarray
+    frequency: np.ndarray
+    period: np.ndarray
+    field: np.ndarray
+    value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @classmethod
+    def build(cls, symbol: str, rows: list[tuple[str, str, str, float]]) -> "FundamentalsTable":
+        """
+        :param rows: (frequency, fiscal date ending, field, value) tuples of one symbol.
+        """
+        return cls(
+            symbol=np.full(len(rows), symbol, dtype=object),
+            frequency=np.array([row[0] for row in rows], dtype=object),
+            period=np.array([row[1] for row in rows], dtype="datetime64[D]"),
+            field=np.array([row[2] for row in rows], dtype=object),
+            value=np.array([row[3] for row in rows], dtype=np.float64),
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["FundamentalsTable"]) -> "FundamentalsTable":
+        if not parts:
+            return cls.build("", [])
+        return cls(*(np.concatenate([getattr(part, name) for part in parts]) for name in ("symbol", "frequency", "period", "field", "value")))
+
+    def panel(self, symbols: Sequence[str], frequency: str, fields: Sequence[str], depth: int) -> tuple[np.ndarray, dict]:
+        """
+        Dense (symbol, period offset) matrices of some fields: offset 0 is each symbol's
+        latest fiscal period of `frequency`, offset 1 the one before, and so on, so
+        companies with different fiscal calendars line up by report. Overview fields
+        repeat their current value at every offset.
+        :return: (fiscal dates, shape (len(symbols), depth), NaT where missing;
+            field -> values of the same shape, NaN where missing).
+        """
+        symbols = np.array(symbols, dtype=object)
+        order = np.argsort(symbols)
+        rows = np.flatnonzero(np.isin(self.symbol, symbols) & np.isin(self.field, list(fields)))
+        position = order[np.searchsorted(symbols[order], self.symbol[rows])]
+        periodic = self.frequency[rows] == frequency
+        overview = self.frequency[rows] == "overview"
+        periodic_rows, overview_rows = rows[periodic], rows[overview]
+
+        # Number each symbol's distinct fiscal periods from the latest one down.
+        row_symbols, days = position[periodic], self.period[periodic_rows].astype(np.int64)
+        keys, inverse = np.unique(row_symbols * 2**32 + (2**31 - days), return_inverse=True)
+        key_symbols = keys // 2**32
+        offsets = np.arange(len(keys)) - np.searchsorted(key_symbols, key_symbols)
+        dates = np.full((len(symbols), depth), np.datetime64("NaT"), dtype="datetime64[D]")
+        kept = offsets < depth
+        dates[key_symbols[kept], offsets[kept]] = (2**31 - keys[kept] % 2**32).astype("datetime64[D]")
+
+        row_offsets = offsets[inverse]
+        values = {}
+        for name in fields:
+            matrix = np.full((len(symbols), depth), np.nan)
+            match = (self.field[periodic_rows] == name) & (row_offsets < depth)
+            matrix[row_symbols[match], row_offsets[match]] = self.value[periodic_rows[match]]
+            match = self.field[overview_rows] == name
+            matrix[position[overview][match]] = self.value[overview_rows[match]][:, None]
+            values[name] = matrix
+        return dates, values
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def parse_statement(symbol: str, payload: dict) -> FundamentalsTable:
+    """
+    Rows of an INCOME_STATEMENT, BALANCE_SHEET or CASH_FLOW response.
+    """
+    rows = []
+    for frequency, key in (("annual", "annualReports"), ("quarterly", "quarterlyReports")):
+        for report in payload.get(key, []):
+            period = report.get("fiscalDateEnding") or ""
+            if len(period) != 10:
+                continue
+            rows.extend(
+                (frequency, period, field, _number(value))
+                for field, value in report.items()
+                if field not in ("fiscalDateEnding", "reportedCurrency")
+            )
+    return FundamentalsTable.build(symbol, rows)
+
+
+def parse_overview(symbol: str, payload: dict) -> FundamentalsTable:
+    """
+    Rows of the numeric fields of an OVERVIEW response, dated by its latest quarter.
+    """
+    period = payload.get("LatestQuarter") or "NaT"
+    rows = [("overview", period, field, number) for field, value in payload.items() if not np.isnan(number := _number(value))]
+    return FundamentalsTable.build(symbol, rows)
+
+
+def parse_metric(metric: str) -> ast.Expression:
+    """
+    Parse a metric: a field ('totalRevenue'), a named ratio ('gross_margin'), arithmetic
+    on them ('grossProfit / totalRevenue') or growth(x) / yoy(x) of any of these.
+    """
+    try:
+        tree = ast.parse(RATIOS.get(metric.strip(), metric.strip()), mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Invalid metric '{metric}'") from None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if not (isinstance(node.func, ast.Name) and node.func.id in ("growth", "yoy") and len(node.args) == 1 and not node.keywords):
+                raise ValueError(f"Invalid metric '{metric}': only growth(x) and yoy(x) can be called")
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Invalid metric '{metric}': constants must be numbers")
+        elif not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Constant, ast.Load, ast.USub, *_OPERATORS)):
+            raise ValueError(f"Invalid metric '{metric}': use fields, numbers, + - * / and growth()/yoy()")
+    names = [node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id not in ("growth", "yoy")]
+    if not names:
+        raise ValueError(f"Invalid metric '{metric}': it must use at least one field")
+    for name in names:
+        _check_field(name)
+    return tree
+
+
+def _check_field(name: str) -> None:
+    # A name that is not a known field but nearly spells one is a typo, not an unlisted field.
+    if name in RATIOS or name in FIELD_STATEMENTS or name in OVERVIEW_FIELDS:
+        return
+    known = [*RATIOS, *FIELD_STATEMENTS, *OVERVIEW_FIELDS]
+    spelled = [field for field in known if field.lower() == name.lower()] or difflib.get_close_matches(name, known, n=1, cutoff=0.85)
+    if spelled:
+        raise ValueError(f"Unknown field '{name}', did you mean '{spelled[0]}'?")
+
+
+def unknown_fields(names: set[str], table: FundamentalsTable) -> list[str]:
+    """
+    The fields that are neither known nor reported in any of the loaded tables.
+    """
+    present = set(table.field.tolist())
+    return sorted(name for name in names - present if name not in FIELD_STATEMENTS and name not in OVERVIEW_FIELDS)
+
+
+def fields(tree: ast.Expression) -> set[str]:
+    """
+    The fields a parsed metric reads, with named ratios expanded.
+    """
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id in RATIOS:
+                names |= fields(parse_metric(node.id))
+            elif node.id not in ("growth", "yoy"):
+                names.add(node.id)
+    return names
+
+
+def statements(names: set[str]) -> list[str]:
+    """
+    The fundamentals functions to load for some fields: OVERVIEW for capitalized fields,
+    the statement holding each known lower-case field, or every statement for unfamiliar ones.
+    """
+    functions = {"OVERVIEW" if name[:1].isupper() else FIELD_STATEMENTS.get(name, "*") for name in names}
+    if "*" in functions:
+        functions = (functions - {"*"}) | set(STATEMENTS)
+    return sorted(functions)
+
+
+def evaluate(tree: ast.Expression, values: dict, year: int) -> np.ndarray:
+    """
+    Evaluate a parsed metric over panel matrices.
+
+    growth(x) compares each period with the one before it and yoy(x) with the same
+    period a year earlier (`year` periods back), both relative to the earlier value's size.
+    """
+    return _evaluate(tree.body, values, year)
+
+
+def _evaluate(node, values: dict, year: int):
+    if isinstance(node, ast.BinOp):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return _OPERATORS[type(node.op)](_evaluate(node.left, values, year), _evaluate(node.right, values, year))
+    if isinstance(node, ast.UnaryOp):
+        return -_evaluate(node.operand, values, year)
+    if isinstance(node, ast.Constant):
+        # Broadcast to the panel shape, so growth(x) and yoy(x) of any sub-expression get a matrix.
+        return np.full(next(iter(values.values())).shape, float(node.value))
+    if isinstance(node, ast.Name):
+        if node.id in RATIOS:
+            return evaluate(parse_metric(node.id), values, year)
+        return values[node.id]
+    current = _evaluate(node.args[0], values, year)
+    lag = 1 if node.func.id == "growth" else year
+    previous = np.full_like(current, np.nan)
+    previous[:, :-lag] = current[:, lag:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (current - previous) / np.abs(previous)
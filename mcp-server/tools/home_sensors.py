@@ -6,6 +6,7 @@ import os
 import logging
 import sys
 import json
+from . import http_client
 
 load_dotenv()
 
@@ -21,7 +22,7 @@ logging.basicConfig(
 mcp = FastMCP("homesensor", streamable_http_path="/homesensor")
 
 @mcp.tool
-def get_room_temperature_humidity_with_only_latest(room: str) -> dict:
+async def get_room_temperature_humidity_with_only_latest(room: str) -> dict:
     """
     Get room tenperature and humidity data for the latest available date.
 
@@ -31,16 +32,14 @@ def get_room_temperature_humidity_with_only_latest(room: str) -> dict:
     Returns:
         str: Sensor data in JSON format.
     """
-    import requests
-
-    response = requests.get(f"{os.getenv('SENSOR_URL')}/{room}")
+    response = await http_client.get(f"{os.getenv('SENSOR_URL')}/{room}")
     if response.status_code == 200:
         return response.json()
     else:
         return {}
 
 @mcp.tool
-def get_room_temperature_humidity_with_date_range(room: str,from_date: str, to_date: str) -> dict:
+async def get_room_temperature_humidity_with_date_range(room: str,from_date: str, to_date: str) -> dict:
     """
     Get room tenperature and humidity data for a given date range.
 
@@ -52,9 +51,7 @@ def get_room_temperature_humidity_with_date_range(room: str,from_date: str, to_d
     Returns:
         str: Sensor data in JSON format.
     """
-    import requests
-
-    response = requests.get(f"{os.getenv('SENSOR_URL')}/{room}?from={from_date}&to={to_date}")
+    response = await http_client.get(f"{os.getenv('SENSOR_URL')}/{room}?from={from_date}&to={to_date}")
     if response.status_code == 200:
         return response.json()
     else:
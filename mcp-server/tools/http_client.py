@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import os
+from urllib.parse import urlsplit
+
+import httpx
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+# Requests in flight per upstream host; extra requests wait for a free slot.
+HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", "8"))
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+logger = logging.getLogger(__name__)
+_clients: dict[str, httpx.AsyncClient] = {}
+_slots: dict[str, asyncio.Semaphore] = {}
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _close(clients: list[httpx.AsyncClient]) -> None:
+    await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+def _for_host(origin: str) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    global _loop
+    loop = asyncio.get_running_loop()
+    if loop is not _loop:
+        # Pooled connections belong to the loop that opened them, so they are closed there.
+        if _clients and _loop is not None and _loop.is_running():
+            asyncio.run_coroutine_threadsafe(_close(list(_clients.values())), _loop)
+        elif _clients:
+            logger.warning("Dropping %d HTTP clients of a stopped event loop; call aclose_all() before it stops", len(_clients))
+        _clients.clear()
+        _slots.clear()
+        _loop = loop
+    if origin not in _clients:
+        _clients[origin] = httpx.AsyncClient(
+            http2=HTTP2,
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONCURRENCY, max_keepalive_connections=HTTP_MAX_CONCURRENCY),
+            follow_redirects=True,
+        )
+        _slots[origin] = asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+    return _clients[origin], _slots[origin]
+
+
+async def get(url: str, params: dict | None = None, **kwargs) -> httpx.Response:
+    """
+    GET a URL through the shared client of its host.
+
+    Each upstream host gets one keep-alive connection pool (HTTP/2 when `h2` is
+    installed), so repeated calls skip the TCP and TLS handshakes.
+    :param url: Absolute URL.
+    :param params: Query parameters.
+    :return: The response; status errors are left to the caller.
+    """
+    parts = urlsplit(url)
+    client, slots = _for_host(f"{parts.scheme}://{parts.netloc}")
+    async with slots:
+        return await client.get(url, params=params, **kwargs)
+
+
+async def aclose_all() -> None:
+    """
+    Close every pooled client and its connections, e.g. when the server shuts down.
+    """
+    clients = list(_clients.values())
+    _clients.clear()
+    _slots.clear()
+    await _close(clients)
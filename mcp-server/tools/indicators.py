@@ -0,0 +1,493 @@
+import functools
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Bars solved per closed-form step in _recurrence; small enough that the running
+# product of decay factors cannot underflow.
+_BLOCK = 64
+
+
+def _check_period(period: int, minimum: int = 2) -> int:
+    period = int(period)
+    if period < minimum:
+        raise ValueError(f"Period must be at least {minimum}, got {period}")
+    return period
+
+
+def _on_valid(fn):
+    """
+    Run an indicator on the part of the input after its leading NaNs.
+
+    This lets indicators be chained (e.g. an EMA of an EMA) without each one
+    having to know the warm-up length of its input.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(values, *args, **kwargs):
+        values = np.asarray(values, dtype=np.float64)
+        out = np.full(len(values), np.nan)
+        valid = np.flatnonzero(~np.isnan(values))
+        if len(valid):
+            out[valid[0]:] = fn(values[valid[0]:], *args, **kwargs)
+        return out
+
+    return wrapper
+
+
+def _recurrence(a, b: np.ndarray, y0: float) -> np.ndarray:
+    """
+    Solve y[t] = a[t] * y[t-1] + b[t] with y[-1] = y0.
+
+    Each block is solved in closed form from cumulative products and sums, so the
+    Python-level loop runs once per block rather than once per bar. `a` must be
+    positive (it is a decay factor for every caller).
+    :param a: Decay factor, scalar or per-step array.
+    :param b: Input term per step.
+    :param y0: Value before the first step.
+    :return: Array of y values, same length as b.
+    """
+    a = np.broadcast_to(np.asarray(a, dtype=np.float64), b.shape)
+    out = np.empty(len(b))
+    y = y0
+    for start in range(0, len(b), _BLOCK):
+        stop = min(start + _BLOCK, len(b))
+        growth = np.cumprod(a[start:stop])
+        out[start:stop] = growth * (y + np.cumsum(b[start:stop] / growth))
+        y = out[stop - 1]
+    return out
+
+
+@_on_valid
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average.
+    :param values: Input series.
+    :param period: Window length.
+    :return: Series aligned with the input, NaN during warm-up.
+    """
+    period = _check_period(period)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        total = np.cumsum(np.concatenate(([0.0], values)))
+        out[period - 1:] = (total[period:] - total[:-period]) / period
+    return out
+
+
+@_on_valid
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average with smoothing 2 / (period + 1), seeded with the SMA of the first window.
+    :param values: Input series.
+    :param period: Window length.
+    :return: Series aligned with the input, NaN during warm-up.
+    """
+    period = _check_period(period)
+    return _smooth(values, period, 2.0 / (period + 1))
+
+
+def _smooth(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        seed = values[:period].mean()
+        out[period - 1] = seed
+        out[period:] = _recurrence(1.0 - alpha, alpha * values[period:], seed)
+    return out
+
+
+@_on_valid
+def wma(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Linearly weighted moving average (weights 1..period, newest heaviest).
+    :param values: Input series.
+    :param period: Window length.
+    :return: Series aligned with the input, NaN during warm-up.
+    """
+    period = _check_period(period)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        weights = np.arange(1, period + 1, dtype=np.float64)
+        out[period - 1:] = sliding_window_view(values, period) @ weights / weights.sum()
+    return out
+
+
+def dema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Double exponential moving average: 2 * EMA - EMA(EMA).
+    """
+    first = ema(values, period)
+    return 2.0 * first - ema(first, period)
+
+
+def tema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Triple exponential moving average: 3 * EMA - 3 * EMA(EMA) + EMA(EMA(EMA)).
+    """
+    first = ema(values, period)
+    second = ema(first, period)
+    return 3.0 * first - 3.0 * second + ema(second, period)
+
+
+def trima(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Triangular moving average: an SMA of an SMA whose lengths add up to period + 1.
+    """
+    period = _check_period(period)
+    first = (period + 1) // 2 if period % 2 else period // 2
+    smoothed = sma(values, first) if first > 1 else np.asarray(values, dtype=np.float64)
+    return sma(smoothed, period + 1 - first)
+
+
+@_on_valid
+def kama(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Kaufman adaptive moving average (fast = 2, slow = 30).
+
+    The smoothing constant follows the efficiency ratio of the last `period` bars,
+    so the average speeds up in trends and flattens in noise.
+    :param values: Input series.
+    :param period: Efficiency ratio window.
+    :return: Series aligned with the input, NaN during warm-up.
+    """
+    period = _check_period(period)
+    out = np.full(len(values), np.nan)
+    if len(values) <= period:
+        return out
+    steps = np.abs(np.diff(values))
+    total = np.cumsum(np.concatenate(([0.0], steps)))
+    noise = total[period:] - total[:-period]
+    change = np.abs(values[period:] - values[:-period])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where((noise > 0) & (change < noise), change / noise, 1.0)
+    fast, slow = 2.0 / 3.0, 2.0 / 31.0
+    constant = (ratio * (fast - slow) + slow) ** 2
+    out[period:] = _recurrence(1.0 - constant, constant * values[period:], values[period - 1])
+    return out
+
+
+def t3(values: np.ndarray, period: int, vfactor: float = 0.7) -> np.ndarray:
+    """
+    Tillson T3: a weighted sum of six chained EMAs.
+    :param values: Input series.
+    :param period: EMA length.
+    :param vfactor: Volume factor between 0 and 1.
+    :return: Series aligned with the input, NaN during warm-up.
+    """
+    chain = [ema(values, period)]
+    for _ in range(5):
+        chain.append(ema(chain[-1], period))
+    v2, v3 = vfactor * vfactor, vfactor ** 3
+    return (
+        -v3 * chain[5]
+        + (3 * v2 + 3 * v3) * chain[4]
+        + (-6 * v2 - 3 * vfactor - 3 * v3) * chain[3]
+        + (1 + 3 * vfactor + v3 + 3 * v2) * chain[2]
+    )
+
+
+# Moving average types as numbered by Alpha Vantage (7 = MAMA is not computed locally; callers route it upstream).
+MA_TYPES = {0: sma, 1: ema, 2: wma, 3: dema, 4: tema, 5: trima, 6: kama, 8: t3}
+
+
+def ma_lookback(period: int, matype: int = 0) -> int:
+    """
+    Number of leading bars a moving average needs before its first value.
+    """
+    if period <= 1:
+        return 0
+    return {3: 2, 4: 3, 8: 6}.get(matype, 1) * (period - 1) + (1 if matype == 6 else 0)
+
+
+def moving_average(values: np.ndarray, period: int, matype: int = 0) -> np.ndarray:
+    """
+    Dispatch to a moving average by its Alpha Vantage MA type number.
+    :param values: Input series.
+    :param period: Window length (a period of 1 returns the input unchanged).
+    :param matype: 0=SMA, 1=EMA, 2=WMA, 3=DEMA, 4=TEMA, 5=TRIMA, 6=KAMA, 8=T3.
+    :return: Series aligned with the input, NaN during warm-up.
+    """
+    if matype not in MA_TYPES:
+        raise ValueError(f"Unsupported moving average type {matype}")
+    if period == 1:
+        return np.array(values, dtype=np.float64)
+    return MA_TYPES[matype](values, period)
+
+
+def _rolling(values: np.ndarray, period: int, reduce) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = reduce(sliding_window_view(values, period), axis=1)
+    return out
+
+
+@_on_valid
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Relative strength index with Wilder smoothing of average gains and losses.
+    :param values: Input series.
+    :param period: Smoothing length.
+    :return: Values between 0 and 100, NaN during warm-up.
+    """
+    period = _check_period(period)
+    out = np.full(len(values), np.nan)
+    if len(values) <= period:
+        return out
+    change = np.diff(values)
+    gains, losses = np.clip(change, 0, None), np.clip(-change, 0, None)
+    decay = (period - 1) / period
+    gain = np.concatenate(([gains[:period].mean()], _recurrence(decay, gains[period:] / period, gains[:period].mean())))
+    loss = np.concatenate(([losses[:period].mean()], _recurrence(decay, losses[period:] / period, losses[:period].mean())))
+    total = gain + loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(total != 0, 100.0 * gain / total, 0.0)
+    return out
+
+
+def _fast_k(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    highest = _rolling(high, period, np.max)
+    lowest = _rolling(low, period, np.min)
+    span = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(span != 0, 100.0 * (close - lowest) / span, np.where(np.isnan(span), np.nan, 0.0))
+
+
+def stochf(high, low, close, fastk_period: int = 5, fastd_period: int = 3, fastd_matype: int = 0):
+    """
+    Fast stochastic oscillator.
+    :return: (FastK, FastD) aligned with the input.
+    """
+    fast_k = _fast_k(*(np.asarray(x, dtype=np.float64) for x in (high, low, close)), _check_period(fastk_period, 1))
+    return fast_k, moving_average(fast_k, fastd_period, fastd_matype)
+
+
+def stoch(high, low, close, fastk_period: int = 5, slowk_period: int = 3, slowk_matype: int = 0, slowd_period: int = 3, slowd_matype: int = 0):
+    """
+    Slow stochastic oscillator: FastK smoothed into SlowK, then SlowK smoothed into SlowD.
+    :return: (SlowK, SlowD) aligned with the input.
+    """
+    fast_k, _ = stochf(high, low, close, fastk_period, 1)
+    slow_k = moving_average(fast_k, slowk_period, slowk_matype)
+    return slow_k, moving_average(slow_k, slowd_period, slowd_matype)
+
+
+def stochrsi(values, period: int = 14, fastk_period: int = 5, fastd_period: int = 3, fastd_matype: int = 0):
+    """
+    Stochastic oscillator applied to the RSI.
+    :return: (FastK, FastD) aligned with the input.
+    """
+    strength = rsi(values, period)
+    return stochf(strength, strength, strength, fastk_period, fastd_period, fastd_matype)
+
+
+def macdext(values, fast_period: int = 12, fast_matype: int = 0, slow_period: int = 26, slow_matype: int = 0, signal_period: int = 9, signal_matype: int = 0):
+    """
+    MACD with a configurable moving average type for each line.
+
+    As in TA-Lib, the fast average is started late so that its first value lines
+    up with the first value of the slow average.
+    :return: (MACD, signal, histogram) aligned with the input.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if slow_period < fast_period:
+        fast_period, slow_period = slow_period, fast_period
+        fast_matype, slow_matype = slow_matype, fast_matype
+    offset = max(ma_lookback(slow_period, slow_matype) - ma_lookback(fast_period, fast_matype), 0)
+    fast = np.full(len(values), np.nan)
+    fast[offset:] = moving_average(values[offset:], fast_period, fast_matype)
+    line = fast - moving_average(values, slow_period, slow_matype)
+    signal = moving_average(line, signal_period, signal_matype)
+    return line, signal, line - signal
+
+
+def macd(values, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+    """
+    Moving average convergence / divergence over exponential moving averages.
+    :return: (MACD, signal, histogram) aligned with the input.
+    """
+    return macdext(values, fast_period, 1, slow_period, 1, signal_period, 1)
+
+
+def volume_volatility(high, low, close, volume, time_period: int = 14, fastperiod: int = 3, slowperiod: int = 10) -> dict:
+    """
+    Volume and volatility indicators computed together from one OHLCV array.
+
+    True range feeds ATR and NATR, and the accumulation/distribution line feeds
+    ADOSC, so each intermediate is computed once for the whole family.
+    :param time_period: ATR / NATR smoothing length.
+    :param fastperiod: ADOSC fast EMA length.
+    :param slowperiod: ADOSC slow EMA length.
+    :return: Dict with TRANGE, ATR, NATR, AD, ADOSC and OBV arrays aligned with the input.
+    """
+    high, low, close, volume = (np.asarray(x, dtype=np.float64) for x in (high, low, close, volume))
+    n = len(close)
+    time_period = _check_period(time_period, 1)
+
+    trange = np.full(n, np.nan)
+    if n > 1:
+        previous = close[:-1]
+        trange[1:] = np.maximum(high[1:], previous) - np.minimum(low[1:], previous)
+    atr = np.full(n, np.nan)
+    if time_period == 1:
+        atr = trange.copy()
+    elif n > time_period:
+        seed = trange[1:time_period + 1].mean()
+        atr[time_period] = seed
+        atr[time_period + 1:] = _recurrence((time_period - 1) / time_period, trange[time_period + 1:] / time_period, seed)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        natr = np.where(close != 0, 100.0 * atr / close, 0.0)
+        span = high - low
+        flow = np.where(span > 0, ((close - low) - (high - close)) / span * volume, 0.0)
+    ad = np.cumsum(flow)
+
+    adosc = np.full(n, np.nan)
+    if n >= max(fastperiod, slowperiod):
+        # ADOSC seeds both EMAs with the first A/D value rather than an SMA.
+        fast_k, slow_k = 2.0 / (fastperiod + 1), 2.0 / (slowperiod + 1)
+        fast = np.concatenate(([ad[0]], _recurrence(1 - fast_k, fast_k * ad[1:], ad[0])))
+        slow = np.concatenate(([ad[0]], _recurrence(1 - slow_k, slow_k * ad[1:], ad[0])))
+        start = max(fastperiod, slowperiod) - 1
+        adosc[start:] = fast[start:] - slow[start:]
+
+    direction = np.sign(np.diff(close)) if n else np.array([])
+    obv = np.cumsum(np.concatenate((volume[:1], direction * volume[1:])))
+    return {"TRANGE": trange, "ATR": atr, "NATR": natr, "AD": ad, "ADOSC": adosc, "OBV": obv}
+
+
+def session_vwap(dates: np.ndarray, high, low, close, volume) -> np.ndarray:
+    """
+    Intraday VWAP of the typical price, reset at the start of every trading day.
+    :param dates: Intraday timestamps (datetime64, ascending).
+    :return: Running VWAP at every bar.
+    """
+    high, low, close, volume = (np.asarray(x, dtype=np.float64) for x in (high, low, close, volume))
+    traded = (high + low + close) / 3.0 * volume
+    day = dates.astype("datetime64[D]")
+    first = np.flatnonzero(np.concatenate(([True], day[1:] != day[:-1])))
+    counts = np.diff(np.append(first, len(dates)))
+    traded_total = np.cumsum(traded)
+    volume_total = np.cumsum(volume)
+    # Subtract what had accumulated before each day started.
+    traded_before = np.repeat(np.concatenate(([0.0], traded_total))[first], counts)
+    volume_before = np.repeat(np.concatenate(([0.0], volume_total))[first], counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (traded_total - traded_before) / (volume_total - volume_before)
+
+
+# Hilbert transform filter coefficients (Ehlers, as used by TA-Lib).
+_HT_A, _HT_B = 0.0962, 0.5769
+# TA-Lib primes the cycle period and phasor with 12 bars of smoothed price and the
+# phase-based outputs with 37; the period estimate is a feedback loop, so the two
+# warm-ups give different values for a few hundred bars and both are kept.
+_HT_CYCLE_START, _HT_CYCLE_LOOKBACK = 12, 32
+_HT_PHASE_START, _HT_PHASE_LOOKBACK = 37, 63
+_DEGREES = 180.0 / np.pi
+
+
+def _hilbert_cycle(smooth: np.ndarray, start: int):
+    """
+    Run Ehlers' homodyne discriminator over a smoothed price series from bar `start`.
+
+    The filter gains depend on the previous bar's period estimate, so this is the
+    one part of the family that has to be solved bar by bar.
+    :return: (detrended price, quadrature, smoothed dominant cycle period), zero before `start`.
+    """
+    n = len(smooth)
+    s = np.where(np.arange(n) >= start, smooth, 0.0).tolist()
+    detrender, quadrature, cycle = [0.0] * n, [0.0] * n, np.zeros(n)
+    a, b = _HT_A, _HT_B
+    period = smooth_period = i2 = q2 = re = im = 0.0
+    for t in range(start, n):
+        gain = 0.075 * period + 0.54
+        d = detrender[t] = (a * s[t] + b * s[t - 2] - b * s[t - 4] - a * s[t - 6]) * gain
+        q = quadrature[t] = (a * d + b * detrender[t - 2] - b * detrender[t - 4] - a * detrender[t - 6]) * gain
+        # The in-phase component is the detrended price three bars back.
+        i = detrender[t - 3]
+        ji = (a * i + b * detrender[t - 5] - b * detrender[t - 7] - a * detrender[t - 9]) * gain
+        jq = (a * q + b * quadrature[t - 2] - b * quadrature[t - 4] - a * quadrature[t - 6]) * gain
+        i2, prev_i2 = 0.2 * (i - jq) + 0.8 * i2, i2
+        q2, prev_q2 = 0.2 * (q + ji) + 0.8 * q2, q2
+        re = 0.2 * (i2 * prev_i2 + q2 * prev_q2) + 0.8 * re
+        im = 0.2 * (i2 * prev_q2 - q2 * prev_i2) + 0.8 * im
+        previous = period
+        if im != 0.0 and re != 0.0:
+            period = 360.0 / (np.arctan(im / re) * _DEGREES)
+        period = max(min(period, 1.5 * previous), 0.67 * previous)
+        period = min(max(period, 6.0), 50.0)
+        period = 0.2 * period + 0.8 * previous
+        smooth_period = cycle[t] = 0.33 * period + 0.67 * smooth_period
+    return np.array(detrender), np.array(quadrature), cycle
+
+
+def hilbert_transform(values) -> dict:
+    """
+    The Hilbert transform indicator family computed together from one price series.
+
+    The dominant cycle comes out of a single bar-by-bar loop; the phase, sine wave,
+    trendline and trend mode are then derived from it with array operations.
+    :param values: Input series.
+    :return: Dict with DCPERIOD, INPHASE, QUADRATURE, DCPHASE, SINE, LEADSINE,
+        TRENDLINE and TRENDMODE arrays aligned with the input, NaN during warm-up.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    index = np.arange(n)
+    smooth = np.nan_to_num(wma(values, 4)) if n >= 4 else np.zeros(n)
+
+    detrender, quadrature, cycle = _hilbert_cycle(smooth, _HT_CYCLE_START)
+    in_phase = np.concatenate((np.zeros(3), detrender[:-3]))[:n]
+
+    start = _HT_PHASE_START
+    active = index >= start
+    _, _, period = _hilbert_cycle(smooth, start)
+    length = (period + 0.5).astype(int)
+
+    # Correlate the last `length` smoothed prices with one cycle of sine and cosine,
+    # grouping bars by cycle length so each group is a single matrix product.
+    real, imag = np.zeros(n), np.zeros(n)
+    padded = np.concatenate((np.zeros(50), np.where(active, smooth, 0.0)))
+    for size in np.unique(length[active]):
+        if size == 0:
+            continue
+        rows = np.flatnonzero(active & (length == size))
+        windows = sliding_window_view(padded, size)[rows + 51 - size][:, ::-1]
+        angle = 2.0 * np.pi * np.arange(size) / size
+        real[rows] = windows @ np.sin(angle)
+        imag[rows] = windows @ np.cos(angle)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        phase = np.arctan(real / imag) * _DEGREES + 90.0 + 360.0 / period + np.where(imag < 0, 180.0, 0.0)
+    phase = np.where(phase > 315.0, phase - 360.0, phase)
+    # With no quadrature the phase is a quarter turn on from the previous bar's.
+    for t in np.flatnonzero(active & (imag == 0)):
+        value = (phase[t - 1] if t > start else 0.0) + 90.0 * np.sign(real[t]) + 90.0 + 360.0 / period[t]
+        phase[t] = value - 360.0 if value > 315.0 else value
+    phase[~active] = 0.0
+    sine = np.sin(phase / _DEGREES)
+    lead_sine = np.sin((phase + 45.0) / _DEGREES)
+
+    total = np.concatenate(([0.0], np.cumsum(values)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        instantaneous = np.where(active & (length > 0), (total[index + 1] - total[np.maximum(index + 1 - length, 0)]) / length, 0.0)
+    lagged = np.concatenate((np.zeros(3), instantaneous))
+    trendline = (4.0 * lagged[3:] + 3.0 * lagged[2:-1] + 2.0 * lagged[1:-2] + lagged[:-3]) / 10.0
+
+    # Trend mode: cycling while the sine wave keeps crossing its lead and the phase
+    # advances at the cycle's rate, trending once price strays from the trendline.
+    prev_sine = np.concatenate(([0.0], sine[:-1]))
+    prev_lead = np.concatenate(([0.0], lead_sine[:-1]))
+    crossed = active & (((sine > lead_sine) & (prev_sine <= prev_lead)) | ((sine < lead_sine) & (prev_sine >= prev_lead)))
+    days_in_trend = index - np.maximum.accumulate(np.where(crossed, index, start)) + 1
+    advance = phase - np.concatenate(([0.0], phase[:-1]))
+    trend_mode = np.ones(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        trend_mode[crossed | (days_in_trend < 0.5 * period)] = 0.0
+        trend_mode[(period != 0) & (advance > 0.67 * 360.0 / period) & (advance < 1.5 * 360.0 / period)] = 0.0
+        trend_mode[(trendline != 0) & (np.abs((smooth - trendline) / trendline) >= 0.015)] = 1.0
+
+    out = {"DCPERIOD": cycle, "INPHASE": in_phase, "QUADRATURE": quadrature}
+    for name in out:
+        out[name][:_HT_CYCLE_LOOKBACK] = np.nan
+    phased = {"DCPHASE": phase, "SINE": sine, "LEADSINE": lead_sine, "TRENDLINE": trendline, "TRENDMODE": trend_mode}
+    for name, series in phased.items():
+        series[:_HT_PHASE_LOOKBACK] = np.nan
+        out[name] = series
+    return out
@@ -0,0 +1,106 @@
+import datetime
+import functools
+from zoneinfo import ZoneInfo
+
+EASTERN = ZoneInfo("America/New_York")
+MARKET_OPEN = datetime.time(9, 30)
+MARKET_CLOSE = datetime.time(16, 0)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> datetime.date:
+    # n-th (1-based) given weekday of a month; n = -1 is the last one.
+    if n > 0:
+        first = datetime.date(year, month, 1)
+        return first + datetime.timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> datetime.date:
+    # Anonymous Gregorian algorithm.
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return datetime.date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+
+def _observed(day: datetime.date) -> datetime.date:
+    # Saturday holidays are observed on Friday, Sunday holidays on Monday.
+    if day.weekday() == 5:
+        return day - datetime.timedelta(days=1)
+    if day.weekday() == 6:
+        return day + datetime.timedelta(days=1)
+    return day
+
+
+@functools.lru_cache(maxsize=None)
+def holidays(year: int) -> frozenset[datetime.date]:
+    """
+    NYSE full-day holidays of a year, by the exchange's standing rules.
+
+    Early closes (e.g. the day after Thanksgiving) and one-off closures are not included.
+    """
+    days = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - datetime.timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(datetime.date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(datetime.date(year, 12, 25)),
+    }
+    if year >= 2022:
+        days.add(_observed(datetime.date(year, 6, 19)))
+    # New Year's Day falling on a Saturday is not observed on the Friday before.
+    if datetime.date(year, 1, 1).weekday() != 5:
+        days.add(_observed(datetime.date(year, 1, 1)))
+    return frozenset(days)
+
+
+def is_session(day: datetime.date) -> bool:
+    """
+    Whether the US equity market trades on a date (a weekday that is not an NYSE holiday).
+    """
+    return day.weekday() < 5 and day not in holidays(day.year)
+
+
+def _now(now: datetime.datetime | None = None) -> datetime.datetime:
+    return (now or datetime.datetime.now(EASTERN)).astimezone(EASTERN)
+
+
+def last_session_date(now: datetime.datetime | None = None) -> datetime.date:
+    """
+    Return the date of the most recent US equity session whose close has passed.
+
+    Weekends and NYSE holidays are skipped; early closes are treated as full sessions.
+    :param now: Reference time (defaults to the current time).
+    :return: Session date in US/Eastern.
+    """
+    now = _now(now)
+    day = now.date()
+    if now.time() < MARKET_CLOSE:
+        day -= datetime.timedelta(days=1)
+    while not is_session(day):
+        day -= datetime.timedelta(days=1)
+    return day
+
+
+def next_session_close(now: datetime.datetime | None = None) -> datetime.datetime:
+    """
+    Return the next US equity market close (16:00 US/Eastern on a trading day).
+    :param now: Reference time (defaults to the current time).
+    :return: Timezone-aware datetime of the next close.
+    """
+    now = _now(now)
+    day = now.date()
+    if now.time() >= MARKET_CLOSE:
+        day += datetime.timedelta(days=1)
+    while not is_session(day):
+        day += datetime.timedelta(days=1)
+    return datetime.datetime.combine(day, MARKET_CLOSE, tzinfo=EASTERN)
@@ -1,10 +1,9 @@
-import requests
 import os
 from fastmcp import FastMCP
 from dotenv import load_dotenv
 from typing import Optional
-import requests
 from langchain_community.utilities import GoogleSerperAPIWrapper
+from . import alphavantage, http_client
 
 load_dotenv()
 
@@ -14,7 +13,6 @@ if not API_KEY:
     raise ValueError(
         "API key for NEWS API is not set. Please set the NEWS_API_KEY environment variable."
     )
-AV_BASE_URL = "https://www.alphavantage.co/query"
 AV_API_KEY = os.getenv("ALPHAVANTAGE_KEY")
 if not AV_API_KEY:
     raise ValueError(
@@ -22,11 +20,8 @@ if not AV_API_KEY:
     )
 
 
-def _make_request(params):
-    params["apikey"] = AV_API_KEY
-    response = requests.get(AV_BASE_URL, params=params)
-    response.raise_for_status()
-    return response.json()
+async def _make_request(params):
+    return await alphavantage.query(params)
 
 mcp = FastMCP("news")
 
@@ -48,7 +43,7 @@ def google_search(query: str) -> str:
         return "I couldn't perform the search due to a technical issue."
 
 @mcp.tool
-def get_news(query: str, from_date: Optional[str] = None, sort_by: str = "popularity"):
+async def get_news(query: str, from_date: Optional[str] = None, sort_by: str = "popularity"):
     """Fetches news articles based on the provided query and date range.
     Args:
         query (str): The search query for news articles.
@@ -67,7 +62,7 @@ def get_news(query: str, from_date: Optional[str] = None, sort_by: str = "popula
         "apiKey": API_KEY
     }
     
-    response = requests.get(BASE_URL, params=params)
+    response = await http_client.get(BASE_URL, params=params)
     
     if response.status_code != 200:
         raise Exception(f"Error fetching news: {response.status_code} - {response.text}")
@@ -76,7 +71,7 @@ def get_news(query: str, from_date: Optional[str] = None, sort_by: str = "popula
 
 
 @mcp.tool()
-def get_news_and_sentiment(
+async def get_news_and_sentiment(
     tickers: str = "",
     time_from: str = "",
     time_to: str = "",
@@ -115,4 +110,4 @@ def get_news_and_sentiment(
         "time_to": time_to,
         "sort": sort,
     }
-    return _make_request(params)
\ No newline at end of file
+    return await _make_request(params)
\ No newline at end of file
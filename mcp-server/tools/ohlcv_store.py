@@ -0,0 +1,209 @@
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+DATA_DIR = os.getenv("ADAM_DATA_DIR", "data")
+FIELDS = ("open", "high", "low", "close", "volume")
+# datetime64 units from coarsest to finest.
+_UNITS = ("Y", "M", "W", "D", "h", "m", "s")
+
+
+@dataclass(frozen=True)
+class Bars:
+    """
+    Columnar OHLCV bars for one symbol and interval, sorted by ascending timestamp.
+
+    `dates` is a datetime64 array ('D' for daily and coarser, 'm' for intraday);
+    the price and volume columns are float64 arrays of the same length.
+    """
+
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in FIELDS:
+            raise ValueError(f"Unknown OHLCV field '{name}'. Valid fields: {', '.join(FIELDS)}")
+        return getattr(self, name)
+
+    def index_of(self, when) -> Optional[int]:
+        """
+        Locate a single timestamp with a binary search.
+        :param when: Date or timestamp (string or datetime64).
+        :return: Row index, or None if there is no bar at that timestamp.
+        """
+        when = np.datetime64(when).astype(self.dates.dtype)
+        i = int(np.searchsorted(self.dates, when))
+        if i < len(self.dates) and self.dates[i] == when:
+            return i
+        return None
+
+    def between(self, start=None, end=None) -> "Bars":
+        """
+        Slice the bars to the closed range [start, end].
+        :param start: First timestamp to keep (optional).
+        :param end: Last timestamp to keep (optional).
+        :return: A view over the selected rows.
+        """
+        return self[date_range(self.dates, start, end)]
+
+    def __getitem__(self, key) -> "Bars":
+        return Bars(*(getattr(self, name)[key] for name in ("dates",) + FIELDS))
+
+    def merge(self, other: "Bars") -> "Bars":
+        """
+        Union two bar sets by timestamp; rows from `other` win on overlap.
+        :param other: Newer bars to merge in.
+        :return: Merged bars sorted by timestamp.
+        """
+        if not len(self):
+            return other
+        if not len(other):
+            return self
+        keep = ~np.isin(self.dates, other.dates)
+        merged = Bars(*(np.concatenate([getattr(self, name)[keep], getattr(other, name)]) for name in ("dates",) + FIELDS))
+        return merged[np.argsort(merged.dates, kind="stable")]
+
+
+def date_range(dates: np.ndarray, start=None, end=None) -> slice:
+    """
+    Rows of a sorted timestamp array within the closed range [start, end].
+    :param start: First timestamp to keep (optional).
+    :param end: Last timestamp to keep (optional); a date or month includes the whole period.
+    """
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start).astype(dates.dtype), "left"))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, _end_of(dates, end), "right"))
+    return slice(lo, hi)
+
+
+def _end_of(dates: np.ndarray, end) -> np.datetime64:
+    # A coarser end than the data (a date for intraday bars, a month for daily ones)
+    # means "through the whole of that period".
+    end = np.datetime64(end)
+    unit, end_unit = np.datetime_data(dates.dtype)[0], np.datetime_data(end.dtype)[0]
+    if _UNITS.index(end_unit) < _UNITS.index(unit):
+        return (end + np.timedelta64(1, end_unit)).astype(dates.dtype) - np.timedelta64(1, unit)
+    return end.astype(dates.dtype)
+
+
+def empty_bars(unit: str = "D") -> Bars:
+    return Bars(np.array([], dtype=f"datetime64[{unit}]"), *(np.array([], dtype=np.float64) for _ in FIELDS))
+
+
+def concat_bars(parts: list[Bars]) -> Bars:
+    """
+    Join bar sets that cover consecutive, non-overlapping periods (e.g. month partitions) in order.
+    """
+    return Bars(*(np.concatenate([getattr(part, name) for part in parts]) for name in ("dates",) + FIELDS))
+
+
+class OHLCVStore:
+    """
+    Persistent columnar OHLCV store.
+
+    Each (symbol, interval) lives in its own directory holding one `.npy` file per
+    column, opened with `mmap_mode="r"` so lookups only touch the pages they read.
+    Writes go to a fresh version directory and are committed by atomically
+    replacing `meta.json`, so readers never see a half-written series.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        self._open: dict[tuple[str, str], tuple[str, Bars]] = {}
+
+    def _dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def meta(self, symbol: str, interval: str) -> dict:
+        """
+        Return the metadata stored alongside a series ({} if it was never written).
+        """
+        try:
+            with open(os.path.join(self._dir(symbol, interval), "meta.json")) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def read(self, symbol: str, interval: str) -> Optional[Bars]:
+        """
+        Memory-map the stored bars for a symbol and interval.
+        :return: Bars, or None if nothing is stored yet.
+        """
+        key = (symbol.upper(), interval)
+        version = self.meta(symbol, interval).get("version")
+        if version is None:
+            return None
+        cached = self._open.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+        path = os.path.join(self._dir(symbol, interval), version)
+        try:
+            bars = Bars(*(np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in ("dates",) + FIELDS))
+        except FileNotFoundError:
+            return None
+        self._open[key] = (version, bars)
+        return bars
+
+    def write(self, symbol: str, interval: str, bars: Bars, **meta) -> Bars:
+        """
+        Replace the stored series for a symbol and interval.
+        :param meta: Extra metadata to record (merged into the existing metadata).
+        :return: The stored bars, memory-mapped from disk.
+        """
+        base = self._dir(symbol, interval)
+        with self._lock:
+            os.makedirs(base, exist_ok=True)
+            previous = self.meta(symbol, interval)
+            version = f"v{time.time_ns()}"
+            path = os.path.join(base, version)
+            os.makedirs(path)
+            for name in ("dates",) + FIELDS:
+                np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(getattr(bars, name)))
+            tmp = os.path.join(base, f"meta.json.{version}")
+            with open(tmp, "w") as f:
+                json.dump({**previous, **meta, "version": version, "rows": len(bars)}, f)
+            os.replace(tmp, os.path.join(base, "meta.json"))
+            # Readers that still hold maps of the old files keep working after unlink.
+            old = previous.get("version")
+            if old and old != version:
+                shutil.rmtree(os.path.join(base, old), ignore_errors=True)
+        return self.read(symbol, interval)
+
+    def merge(self, symbol: str, interval: str, bars: Bars, **meta) -> Bars:
+        """
+        Merge new bars into the stored series (new rows win on overlap).
+        :return: The merged bars, memory-mapped from disk.
+        """
+        stored = self.read(symbol, interval)
+        merged = bars if stored is None else stored.merge(bars)
+        return self.write(symbol, interval, merged, **meta)
+
+    def touch(self, symbol: str, interval: str, **meta) -> None:
+        """
+        Update metadata without rewriting the columns.
+        """
+        base = self._dir(symbol, interval)
+        with self._lock:
+            previous = self.meta(symbol, interval)
+            if not previous:
+                return
+            tmp = os.path.join(base, f"meta.json.{time.time_ns()}")
+            with open(tmp, "w") as f:
+                json.dump({**previous, **meta}, f)
+            os.replace(tmp, os.path.join(base, "meta.json"))
+
+
+store = OHLCVStore(os.path.join(DATA_DIR, "ohlcv"))
@@ -0,0 +1,96 @@
+import re
+
+import numpy as np
+
+from .ohlcv_store import FIELDS, Bars
+
+# Named periods and the counted form they stand for.
+PERIOD_ALIASES = {
+    "daily": "1day",
+    "weekly": "1week",
+    "monthly": "1month",
+    "quarterly": "1quarter",
+    "yearly": "1year",
+    "annual": "1year",
+}
+# Units whose buckets are labelled by their start time (intraday); coarser buckets are
+# labelled with the date of their last bar, like Alpha Vantage's weekly and monthly series.
+INTRADAY_UNITS = ("min", "hour")
+
+
+def parse_period(period: str) -> tuple[int, str]:
+    """
+    Parse a period such as '5min', '2hour', '10day', 'weekly', '3month' or 'quarterly'.
+    :return: (count, unit) with unit one of min, hour, day, week, month, quarter, year.
+    """
+    text = period.strip().lower()
+    text = PERIOD_ALIASES.get(text, text)
+    match = re.fullmatch(r"(\d*)\s*(min|hour|day|week|month|quarter|year)s?", text)
+    if not match or int(match.group(1) or 1) == 0:
+        raise ValueError(f"Unsupported period '{period}'. Use e.g. '5min', '2hour', 'weekly', '2week', 'monthly', 'quarterly' or 'yearly'")
+    return int(match.group(1) or 1), match.group(2)
+
+
+def bucket_keys(dates: np.ndarray, count: int, unit: str, fiscal_year_end: int = 12) -> np.ndarray:
+    """
+    Bucket number of every timestamp; consecutive bars with the same key form one bar.
+
+    Minute and hour buckets are aligned to midnight, day buckets to the epoch, weeks run
+    Monday to Sunday, and quarters and years end with the month `fiscal_year_end` (1-12).
+    """
+    if unit in INTRADAY_UNITS:
+        return dates.astype("datetime64[m]").astype(np.int64) // (count * (60 if unit == "hour" else 1))
+    days = dates.astype("datetime64[D]")
+    if unit == "day":
+        return days.astype(np.int64) // count
+    if unit == "week":
+        # numpy weeks start on Thursday (the weekday of 1970-01-01); shifting by three days makes them start on Monday.
+        return (days + np.timedelta64(3, "D")).astype("datetime64[W]").astype(np.int64) // count
+    months = days.astype("datetime64[M]").astype(np.int64)
+    if unit == "month":
+        return months // count
+    if unit == "quarter":
+        return (months - fiscal_year_end + 3) // (3 * count)
+    return (months - fiscal_year_end) // (12 * count)
+
+
+def aggregate(bars: Bars, starts: np.ndarray, dates: np.ndarray) -> Bars:
+    """
+    Merge the runs of consecutive bars beginning at `starts` into one bar each: first open,
+    highest high, lowest low, last close and total volume, labelled with `dates`.
+    """
+    ends = np.append(starts[1:], len(bars)) - 1
+    return Bars(
+        dates,
+        bars.open[starts],
+        np.maximum.reduceat(bars.high, starts),
+        np.minimum.reduceat(bars.low, starts),
+        bars.close[ends],
+        np.add.reduceat(bars.volume, starts),
+    )
+
+
+def resample(bars: Bars, period: str, fiscal_year_end: int = 12) -> Bars:
+    """
+    Resample bars into candles of a longer period.
+
+    Intraday buckets are labelled with their start time (the 09:35 bar of a '5min'
+    series covers 09:35-09:39); daily and longer buckets with the date of their last bar.
+    :param period: See parse_period.
+    :param fiscal_year_end: Month (1-12) that ends the fiscal year, for quarters and years.
+    """
+    count, unit = parse_period(period)
+    if not 1 <= fiscal_year_end <= 12:
+        raise ValueError("fiscal_year_end must be a month number from 1 to 12")
+    intraday = unit in INTRADAY_UNITS
+    if not len(bars):
+        return bars if intraday else Bars(bars.dates.astype("datetime64[D]"), *(bars.column(name) for name in FIELDS))
+    keys = bucket_keys(bars.dates, count, unit, fiscal_year_end)
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(keys)) + 1])
+    if intraday:
+        minutes = count * (60 if unit == "hour" else 1)
+        dates = (keys[starts] * minutes).astype("datetime64[m]")
+    else:
+        ends = np.append(starts[1:], len(bars)) - 1
+        dates = bars.dates[ends].astype("datetime64[D]")
+    return aggregate(bars, starts, dates)
@@ -0,0 +1,86 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from .ohlcv_store import DATA_DIR
+
+
+class ResponseStore:
+    """
+    Upstream responses persisted in SQLite, keyed by function and symbol.
+
+    Each row records when its content was last fetched and when upstream was last
+    checked, so callers can serve a stored response immediately and decide for
+    themselves whether it is stale enough to revalidate.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " function TEXT NOT NULL, symbol TEXT NOT NULL, payload TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL, checked_at REAL NOT NULL,"
+                " PRIMARY KEY (function, symbol))"
+            )
+            self._db = db
+        return self._db
+
+    def get(self, function: str, symbol: str) -> Optional[dict]:
+        """
+        :return: Dict with payload, fetched_at and checked_at, or None if nothing is stored.
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, fetched_at, checked_at FROM responses WHERE function = ? AND symbol = ?",
+                (function, symbol.upper()),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"payload": json.loads(row[0]), "fetched_at": row[1], "checked_at": row[2]}
+
+    def put(self, function: str, symbol: str, payload) -> None:
+        """
+        Store a fresh response; `fetched_at` only moves when the content changed.
+        """
+        text = json.dumps(payload)
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO responses (function, symbol, payload, fetched_at, checked_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (function, symbol) DO UPDATE SET"
+                " fetched_at = CASE WHEN payload = excluded.payload THEN fetched_at ELSE excluded.fetched_at END,"
+                " payload = excluded.payload, checked_at = excluded.checked_at",
+                (function, symbol.upper(), text, now, now),
+            )
+
+    def symbols(self, function: str) -> list[str]:
+        """
+        :return: Every symbol with a stored response for `function`.
+        """
+        with self._lock:
+            rows = self._connect().execute("SELECT symbol FROM responses WHERE function = ?", (function,)).fetchall()
+        return [row[0] for row in rows]
+
+    def touch(self, function: str, symbol: str) -> None:
+        """
+        Record an upstream check that did not produce a usable response.
+        """
+        with self._lock:
+            self._connect().execute(
+                "UPDATE responses SET checked_at = ? WHERE function = ? AND symbol = ?",
+                (time.time(), function, symbol.upper()),
+            )
+
+
+store = ResponseStore(os.path.join(DATA_DIR, "responses.sqlite3"))
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .ohlcv_store import Bars, date_range
+from .resample import aggregate
+
+ORDERS = ("desc", "asc")
+
+
+@dataclass(frozen=True)
+class SeriesView:
+    """
+    How much of a time series a tool returns, applied before it is rendered.
+
+    `start`/`end` bound the timestamps (inclusive), `fields` keeps only some
+    columns, `max_points` downsamples what is left and `order` is 'desc' (newest
+    first, like Alpha Vantage) or 'asc'. The defaults return the whole series.
+    """
+
+    start: Optional[str] = None
+    end: Optional[str] = None
+    fields: Optional[Sequence[str]] = None
+    max_points: Optional[int] = None
+    order: str = "desc"
+
+    def __post_init__(self):
+        if self.order.lower() not in ORDERS:
+            raise ValueError(f"Unsupported order '{self.order}'. Valid orders: {', '.join(ORDERS)}")
+        if self.max_points is not None and self.max_points < 3:
+            raise ValueError("max_points must be at least 3")
+        for value in (self.start, self.end):
+            if value:
+                try:
+                    np.datetime64(value)
+                except ValueError:
+                    raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD or YYYY-MM-DD HH:MM") from None
+
+    def columns(self, names: Sequence[str]) -> list[str]:
+        """
+        The requested subset of `names` (matched case-insensitively), in the series' own order.
+        """
+        if not self.fields:
+            return list(names)
+        wanted = {field.lower() for field in self.fields}
+        unknown = wanted - {name.lower() for name in names}
+        if unknown:
+            raise ValueError(f"Unknown field '{sorted(unknown)[0]}'. Valid fields: {', '.join(names)}")
+        return [name for name in names if name.lower() in wanted]
+
+    def window(self, dates: np.ndarray) -> slice:
+        return date_range(dates, self.start or None, self.end or None)
+
+    def rows(self, dates: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Indices of the rows to return (ascending): those within [start, end], thinned to
+        `max_points` with Largest-Triangle-Three-Buckets on `values`.
+        """
+        window = self.window(dates)
+        rows = np.arange(len(dates))[window]
+        if self.max_points and len(rows) > self.max_points:
+            rows = rows[lttb(values[window], self.max_points)]
+        return rows
+
+    def bars(self, bars: Bars) -> Bars:
+        """
+        The bars within [start, end], merged into at most `max_points` OHLC buckets.
+        """
+        bars = bars[self.window(bars.dates)]
+        if self.max_points and len(bars) > self.max_points:
+            bars = ohlc_buckets(bars, self.max_points)
+        return bars
+
+    def ordered(self, rows):
+        return rows[::-1] if self.order.lower() == "desc" else rows
+
+
+def lttb(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling of an evenly spaced series.
+
+    Keeps the first and last points and, from each of `points - 2` equal buckets in
+    between, the point forming the largest triangle with the previously kept point
+    and the average of the next bucket, which preserves peaks and troughs.
+    :return: Indices of the kept points, ascending.
+    """
+    n = len(values)
+    if points >= n or points < 3:
+        return np.arange(n)
+    values = np.nan_to_num(values.astype(np.float64))
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    kept = np.empty(points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_lo, next_hi = hi, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = (next_lo + next_hi - 1) / 2
+        next_y = values[next_lo:next_hi].mean()
+        x = np.arange(lo, hi)
+        area = np.abs((previous - next_x) * (values[lo:hi] - values[previous]) - (previous - x) * (next_y - values[previous]))
+        previous = kept[bucket + 1] = lo + int(np.argmax(area))
+    return kept
+
+
+def ohlc_buckets(bars: Bars, points: int) -> Bars:
+    """
+    Merge consecutive bars into `points` buckets of (nearly) equal size, labelled with
+    the timestamp of their first bar.
+    """
+    starts = np.unique(np.arange(points) * len(bars) // points)
+    return aggregate(bars, starts, bars.dates[starts])
@@ -1,14 +1,32 @@
-import requests
+import asyncio
 import os
-import csv
-import io
+import dataclasses
+import datetime
+import functools
+import inspect
+import itertools
+import logging
+import re
+import time
+import numpy as np
 from fastmcp import FastMCP
 from dotenv import load_dotenv
 from typing import Optional
-import requests
+from . import alphavantage, analytics, fundamentals_table, indicators
+from .adjustment import MODES as ADJUSTMENTS, Adjustment
+from .earnings_calendar import HORIZONS as EARNINGS_HORIZONS, EarningsCalendar, parse as parse_earnings_calendar
+from .event_calendar import EVENT_TYPES, EventIndex, dividend_events, earnings_events, ipo_events, split_events
+from .market_calendar import EASTERN, last_session_date
+from .ohlcv_store import FIELDS, Bars, concat_bars, store as _store
+from .resample import parse_period, resample
+from .response_store import store as _responses
+from .series_view import SeriesView
+from .symbol_index import listings
+from .ticker_universe import universe
+from .transcript_index import transcripts
 
 load_dotenv()
-BASE_URL = "https://www.alphavantage.co/query"
+logger = logging.getLogger(__name__)
 API_KEY = os.getenv("ALPHAVANTAGE_KEY")
 if not API_KEY:
     raise ValueError(
@@ -16,16 +34,648 @@ if not API_KEY:
     )
 
 
-def _make_request(params):
-    params["apikey"] = API_KEY
-    response = requests.get(BASE_URL, params=params)
-    response.raise_for_status()
-    return response.json()
+async def _make_request(params):
+    return await alphavantage.query(params)
+
+# A stale daily series is re-checked upstream at most this often (covers late prints and unscheduled closures).
+DAILY_RECHECK_SECONDS = int(os.getenv("DAILY_RECHECK_SECONDS", "900"))
+INTRADAY_RECHECK_SECONDS = int(os.getenv("INTRADAY_RECHECK_SECONDS", "60"))
+# Missing intraday months a read tool downloads on its own; longer histories need backfill_intraday.
+INTRADAY_READ_MONTHS = int(os.getenv("INTRADAY_READ_MONTHS", "2"))
+INTRADAY_INTERVALS = ("1min", "5min", "15min", "30min", "60min")
+# Seconds after which a stored fundamentals response is revalidated in the background.
+FUNDAMENTALS_MAX_AGE = {
+    "OVERVIEW": 86400,
+    "EARNINGS": 86400,
+    "DIVIDENDS": 86400,
+    "ETF_PROFILE": 7 * 86400,
+    "SPLITS": 7 * 86400,
+    "INCOME_STATEMENT": 7 * 86400,
+    "BALANCE_SHEET": 7 * 86400,
+    "CASH_FLOW": 7 * 86400,
+}
+# Seconds before a quarter whose transcript was not published yet is asked for again.
+EMPTY_TRANSCRIPT_MAX_AGE = int(os.getenv("EMPTY_TRANSCRIPT_MAX_AGE", "86400"))
+# Seconds after which the corporate event index is rebuilt in the background.
+EVENTS_MAX_AGE = int(os.getenv("EVENTS_MAX_AGE", "43200"))
+_SERIES_KEYS = ("1. open", "2. high", "3. low", "4. close", "5. volume")
+
+
+def _bars_from_payload(data: dict, unit: str = "D") -> Optional[Bars]:
+    """
+    Convert an Alpha Vantage time-series payload into columnar bars.
+    :param data: Upstream JSON response.
+    :param unit: datetime64 unit of the timestamps ('D' for daily and coarser, 'm' for intraday).
+    :return: Bars sorted by timestamp, or None if the payload holds no time series (e.g. an error note).
+    """
+    series = next((value for key, value in data.items() if "Time Series" in key), None)
+    if not series:
+        return None
+    dates = np.array(list(series.keys()), dtype=f"datetime64[{unit}]")
+    values = np.array([[row[key] for key in _SERIES_KEYS] for row in series.values()], dtype=np.float64)
+    order = np.argsort(dates, kind="stable")
+    return Bars(dates[order], *np.ascontiguousarray(values[order].T))
+
+
+def _format_dates(dates: np.ndarray) -> list[str]:
+    if np.datetime_data(dates.dtype)[0] == "D":
+        return np.datetime_as_string(dates).tolist()
+    return np.char.replace(np.datetime_as_string(dates.astype("datetime64[s]")), "T", " ").tolist()
+
+
+def _series_rows(bars: Bars, view: SeriesView = SeriesView()) -> dict:
+    """
+    Render bars in the Alpha Vantage dict-of-dicts shape, newest first unless the view asks otherwise.
+    """
+    names = view.columns(FIELDS)
+    keys = [_SERIES_KEYS[FIELDS.index(name)] for name in names]
+    bars = view.ordered(bars)
+    columns = [np.char.mod("%d" if name == "volume" else "%.4f", bars.column(name)).tolist() for name in names]
+    return {date: dict(zip(keys, values)) for date, *values in zip(_format_dates(bars.dates), *columns)}
+
+
+def _series_payload(meta: dict, series_key: str, bars: Bars, view: SeriesView = SeriesView(), datatype: str = "json") -> dict:
+    """
+    Render a price series response; the view's date range and downsampling are applied here.
+    :param datatype: 'json' for the nested Alpha Vantage shape, 'columnar' for one array per field.
+    """
+    if datatype not in ("json", "columnar"):
+        raise ValueError(f"Unsupported datatype '{datatype}'. Valid datatypes: json, columnar")
+    bars = view.bars(bars)
+    if datatype == "columnar":
+        names = view.columns(FIELDS)
+        bars = view.ordered(bars)
+        return _columnar_payload(meta, series_key, _format_dates(bars.dates), {name: bars.column(name) for name in names}, view.order)
+    return {"Meta Data": meta, series_key: _series_rows(bars, view)}
+
+
+def _columnar_payload(meta: dict, series_key: str, dates: list[str], columns: dict, order: str = "desc") -> dict:
+    """
+    Render a series column by column: a schema header, one dates array and one
+    numeric array per field, instead of a dict of strings per row.
+    """
+    integers = {name for name in columns if name == "volume" or name in _INTEGER_OUTPUTS}
+    return {
+        "Meta Data": meta,
+        "schema": {
+            "series": series_key,
+            "order": "newest first" if order.lower() == "desc" else "oldest first",
+            "fields": {"dates": "string", **{name: "int" if name in integers else "float" for name in columns}},
+        },
+        "dates": dates,
+        "columns": {
+            name: values.astype(np.int64).tolist() if name in integers else np.round(values, 4).tolist()
+            for name, values in columns.items()
+        },
+    }
+
+
+async def _daily_bars(symbol: str, through: Optional[datetime.date] = None):
+    """
+    Daily bars for a symbol, served from the local store.
+
+    Alpha Vantage is only contacted when the stored history does not reach `through`
+    (default: the last closed session) and the symbol was not re-checked recently.
+    Once the full history is stored, refreshes fetch the compact series (last 100
+    bars) and merge it in; the full series is only re-downloaded to close a gap
+    longer than the compact window.
+    :param symbol: Stock symbol (e.g., 'AAPL').
+    :param through: Last date the caller needs.
+    :return: Bars (the stored ones when a refresh fails), or the upstream payload when
+        Alpha Vantage returned an error and nothing is stored yet.
+    """
+    symbol = symbol.upper()
+    session = last_session_date()
+    through = min(through or session, session)
+    bars = _store.read(symbol, "daily")
+    stored = bars is not None and len(bars) > 0
+    if stored:
+        meta = _store.meta(symbol, "daily")
+        if bars.dates[-1] >= np.datetime64(through, "D") or time.time() - meta.get("checked_at", 0) < DAILY_RECHECK_SECONDS:
+            return bars
+        if meta.get("full"):
+            data = await _make_request({"function": "TIME_SERIES_DAILY", "symbol": symbol, "outputsize": "compact"})
+            update = _bars_from_payload(data)
+            if update is None:
+                return _keep_stored(symbol, "daily", bars, data)
+            if update.dates[0] <= bars.dates[-1]:
+                if _already_stored(bars, update):
+                    # Nothing new (e.g. today's bar is not out yet): record the check without rewriting the columns.
+                    _store.touch(symbol, "daily", checked_at=time.time())
+                    return bars
+                return _store.merge(symbol, "daily", update, checked_at=time.time())
+    data = await _make_request({"function": "TIME_SERIES_DAILY", "symbol": symbol, "outputsize": "full"})
+    fetched = _bars_from_payload(data)
+    if fetched is None:
+        return _keep_stored(symbol, "daily", bars, data) if stored else data
+    return _store.write(symbol, "daily", fetched, full=True, checked_at=time.time())
+
+
+def _already_stored(bars: Bars, update: Bars) -> bool:
+    """
+    Whether every bar of `update` is already stored with the same values.
+    """
+    if update.dates[-1] > bars.dates[-1]:
+        return False
+    rows = np.searchsorted(bars.dates, update.dates)
+    if not np.array_equal(bars.dates[rows], update.dates):
+        return False
+    return all(np.array_equal(bars.column(name)[rows], update.column(name)) for name in FIELDS)
+
+
+def _keep_stored(symbol: str, key: str, bars: Bars, data) -> Bars:
+    """
+    Serve the stored bars after a refresh came back with an error or rate-limit note,
+    and wait for the next re-check period before asking Alpha Vantage again.
+    """
+    note = next((data[name] for name in ("Error Message", "Note", "Information") if name in data), data) if isinstance(data, dict) else data
+    logger.warning("Refreshing %s %s failed, serving the stored bars: %s", symbol, key, note)
+    _store.touch(symbol, key, checked_at=time.time())
+    return bars
+
+
+
+async def _stored_bars(symbol: str, key: str, params: dict, unit: str, max_age: float, through=None, merge: bool = False):
+    """
+    Bars stored under `key`, refreshed from Alpha Vantage with `params` once they are older than `max_age` seconds.
+    :param through: Timestamp that, once stored, makes the series fresh regardless of its age.
+    :param merge: Merge the fetched bars into the stored ones instead of replacing them. Like the daily
+        series, a stored series is then refreshed with the compact output (last 100 bars), and `params`
+        (the full output) is only fetched again to close a gap longer than that.
+    :return: Bars (the stored ones when a refresh fails), or the upstream payload when
+        Alpha Vantage returned an error and nothing is stored yet.
+    """
+    bars = _store.read(symbol, key)
+    stored = bars is not None and len(bars) > 0
+    if stored:
+        checked_at = _store.meta(symbol, key).get("checked_at", 0)
+        if (through is not None and bars.dates[-1] >= through) or time.time() - checked_at < max_age:
+            return bars
+        if merge:
+            data = await _make_request({**params, "outputsize": "compact"})
+            update = _bars_from_payload(data, unit)
+            if update is None:
+                return _keep_stored(symbol, key, bars, data)
+            if update.dates[0] <= bars.dates[-1]:
+                if _already_stored(bars, update):
+                    _store.touch(symbol, key, checked_at=time.time())
+                    return bars
+                return _store.merge(symbol, key, update, checked_at=time.time())
+    data = await _make_request(params)
+    fetched = _bars_from_payload(data, unit)
+    if fetched is None:
+        return _keep_stored(symbol, key, bars, data) if stored else data
+    save = _store.merge if merge else _store.write
+    return save(symbol, key, fetched, checked_at=time.time())
+
+
+async def _bars(symbol: str, interval: str = "daily", month: Optional[str] = None):
+    """
+    OHLCV bars for any interval the indicator tools accept, served from the local store.
+    :param symbol: Stock symbol (e.g., 'AAPL').
+    :param interval: '1min', '5min', '15min', '30min', '60min', 'daily', 'weekly' or 'monthly'.
+    :param month: Optional month in YYYY-MM format for intraday intervals.
+    :return: Bars, or the upstream payload when Alpha Vantage returned an error.
+    """
+    symbol = symbol.upper()
+    interval = interval.lower()
+    if interval == "daily":
+        return await _daily_bars(symbol)
+    if interval in ("weekly", "monthly"):
+        # Resampled from the daily series instead of being fetched separately.
+        daily = await _daily_bars(symbol)
+        return resample(daily, interval) if isinstance(daily, Bars) else daily
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"Unsupported interval '{interval}'")
+    if interval != "1min" and _store.read(symbol, f"1min-{month}" if month else "1min") is not None:
+        # Stored 1-minute bars serve every coarser interval without another upstream series.
+        minutes = await _bars(symbol, "1min", month)
+        return resample(minutes, interval) if isinstance(minutes, Bars) else minutes
+    params = {"function": "TIME_SERIES_INTRADAY", "symbol": symbol, "interval": interval, "outputsize": "full"}
+    if not month:
+        return await _stored_bars(symbol, interval, params, "m", INTRADAY_RECHECK_SECONDS, merge=True)
+    params["month"] = month
+    # Past months are immutable, so once stored they are never fetched again.
+    max_age = INTRADAY_RECHECK_SECONDS if month >= _open_month() else float("inf")
+    return await _stored_bars(symbol, f"{interval}-{month}", params, "m", max_age)
+
+
+def _open_month() -> str:
+    """
+    The oldest month whose intraday bars can still change: that of the last closed US session,
+    so a month only counts as past once a session of the next one has closed in New York.
+    """
+    return last_session_date().strftime("%Y-%m")
+
+
+def _months(start: str, end: Optional[str] = None) -> list[str]:
+    """
+    Months from `start` through `end` (default: this month in New York), as YYYY-MM strings.
+    """
+    first = np.datetime64(start, "M")
+    last = np.datetime64(end, "M") if end else np.datetime64(datetime.datetime.now(EASTERN).date(), "M")
+    return [str(month) for month in np.arange(first, last + 1)]
+
+
+async def _intraday_months(symbol: str, interval: str, months: list[str]):
+    """
+    Month partitions of an intraday series, loaded concurrently.
+
+    Stored past months are read from disk; missing ones are fetched in parallel,
+    paced by the shared Alpha Vantage rate limiter.
+    :return: (bars of the months that loaded, {month: error payload} for the ones that did not).
+    """
+    loaded = await asyncio.gather(*(_bars(symbol, interval, month) for month in months))
+    parts = [bars for bars in loaded if isinstance(bars, Bars)]
+    errors = {month: data for month, data in zip(months, loaded) if not isinstance(data, Bars)}
+    return concat_bars(parts) if parts else None, errors
+
+
+def _month_stored(symbol: str, interval: str, month: str) -> bool:
+    # Stored 1-minute partitions also serve the coarser intervals.
+    return any(_store.meta(symbol, f"{name}-{month}").get("version") for name in {interval, "1min"})
+
+
+async def _intraday_bars(symbol: str, interval: str, start=None, end=None):
+    """
+    Intraday bars covering [start, end]: the recent series from the store, preceded by
+    stored month partitions for whatever part of the range is older than it.
+
+    Only the INTRADAY_READ_MONTHS missing months nearest the recent series are
+    downloaded here; older ones are left to backfill_intraday and reported back.
+    :return: (Bars, or the upstream payload when Alpha Vantage returned an error;
+        months of the range that could not be loaded, oldest first).
+    """
+    symbol = symbol.upper()
+    recent = await _bars(symbol, interval)
+    if not isinstance(recent, Bars) or not start:
+        return recent, []
+    start = np.datetime64(start, "m")
+    if len(recent) and start >= recent.dates[0]:
+        return recent, []
+    # The recent series starts part-way through a month, so that month's partition is loaded too.
+    through = recent.dates[0] if len(recent) else np.datetime64(end or datetime.datetime.now(EASTERN).date(), "m")
+    if end:
+        through = min(through, np.datetime64(end, "m"))
+    months = _months(str(start), str(through))
+    if len(recent):
+        # The current month is still growing and the recent series already covers it.
+        months = [month for month in months if month < datetime.datetime.now(EASTERN).strftime("%Y-%m")]
+    missing = [month for month in months if not _month_stored(symbol, interval, month)]
+    fetch = set(missing[-INTRADAY_READ_MONTHS:]) if INTRADAY_READ_MONTHS > 0 else set()
+    history, errors = await _intraday_months(symbol, interval, [month for month in months if month in fetch or month not in missing])
+    for month, data in errors.items():
+        logger.warning("Loading %s %s bars for %s failed: %s", symbol, interval, month, data)
+    unloaded = sorted((set(missing) - fetch) | set(errors))
+    if history is None:
+        return recent, unloaded
+    return history.merge(recent), unloaded
+
+
+def _month_ranges(months: list[str]) -> list[str]:
+    """
+    Sorted YYYY-MM months as runs of consecutive months ('2024-01..2024-06', '2024-09').
+    """
+    numbers = np.array(months, dtype="datetime64[M]").astype(np.int64)
+    breaks = np.flatnonzero(np.diff(numbers) != 1)
+    firsts, lasts = np.concatenate([[0], breaks + 1]), np.append(breaks, len(months) - 1)
+    return [months[a] if a == b else f"{months[a]}..{months[b]}" for a, b in zip(firsts.tolist(), lasts.tolist())]
+
+
+def _note_missing(payload, symbol: str, interval: str, missing: list[str]):
+    """
+    Record in a response's Meta Data which intraday months it lacks, and how to download them.
+    """
+    if missing and isinstance(payload, dict) and isinstance(payload.get("Meta Data"), dict):
+        payload["Meta Data"]["Missing Months"] = _month_ranges(missing)
+        payload["Meta Data"]["Backfill"] = (
+            f"backfill_intraday(symbol='{symbol.upper()}', start_month='{missing[0]}', end_month='{missing[-1]}', interval='{interval}')"
+        )
+    return payload
+
+
+def _usable(data) -> bool:
+    return isinstance(data, dict) and bool(data) and not {"Error Message", "Note", "Information"} & data.keys()
+
+
+_revalidating: dict[tuple[str, str], asyncio.Task] = {}
+
+
+async def _fundamentals(function: str, symbol: str):
+    """
+    Fundamentals served from the persistent response store (stale-while-revalidate).
+
+    A stored response is returned immediately; once it is older than
+    FUNDAMENTALS_MAX_AGE, one background request refreshes it for later callers.
+    Only the first request for a symbol waits for Alpha Vantage.
+    :return: JSON response.
+    """
+    symbol = symbol.upper()
+    stored = _responses.get(function, symbol)
+    if stored is None:
+        return await _refresh_fundamentals(function, symbol)
+    key = (function, symbol)
+    if time.time() - stored["checked_at"] > FUNDAMENTALS_MAX_AGE[function] and key not in _revalidating:
+        task = _revalidating[key] = asyncio.ensure_future(_refresh_fundamentals(function, symbol))
+        task.add_done_callback(functools.partial(_revalidated, key))
+    return stored["payload"]
+
+
+def _revalidated(key: tuple[str, str], task: asyncio.Task) -> None:
+    _revalidating.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background refresh of %s failed: %s", key, task.exception())
+
+
+async def _refresh_fundamentals(function: str, symbol: str):
+    try:
+        data = await _make_request({"function": function, "symbol": symbol})
+    except Exception:
+        # Keep serving the stored copy; try again after another max-age period.
+        _responses.touch(function, symbol)
+        raise
+    if _usable(data):
+        _responses.put(function, symbol, data)
+    else:
+        _responses.touch(function, symbol)
+    return data
+
+
+def _indicator_meta(symbol: str, indicator: str, bars: Bars, interval: str, params: dict, series_type: Optional[str] = None) -> dict:
+    """
+    Build the "Meta Data" block of an Alpha Vantage technical indicator response.
+    """
+    meta = {
+        "1: Symbol": symbol.upper(),
+        "2: Indicator": indicator,
+        "3: Last Refreshed": _format_dates(bars.dates[-1:])[0] if len(bars) else None,
+        "4: Interval": interval.lower(),
+    }
+    if len(params) == 1:
+        meta.update({f"5: {name}": value for name, value in params.items()})
+    else:
+        meta.update({f"5.{i}: {name}": value for i, (name, value) in enumerate(params.items(), 1)})
+    number = 6 if params else 5
+    if series_type:
+        meta[f"{number}: Series Type"] = series_type.lower()
+        number += 1
+    meta[f"{number}: Time Zone"] = "US/Eastern"
+    return meta
+
+
+def _indicator_payload(function: str, meta: dict, dates: np.ndarray, outputs: dict, datatype: str = "json", view: SeriesView = SeriesView()):
+    """
+    Render locally computed indicator values like Alpha Vantage does, newest first.
+
+    Warm-up rows (where any output is still NaN) are dropped. The view's range is
+    applied next, and its downsampling (LTTB on the first output kept) last.
+    :param function: Alpha Vantage function name (e.g. 'SMA').
+    :param dates: Ascending timestamps of the values.
+    :param outputs: Output name -> values aligned with `dates`.
+    :param datatype: 'json' for the nested JSON shape, 'csv' for CSV text, 'columnar' for one array per output.
+    :param view: Date range, outputs, number of points and order to return.
+    """
+    names = view.columns(list(outputs))
+    rows = np.flatnonzero(~np.isnan(np.vstack(list(outputs.values()))).any(axis=0))
+    rows = view.ordered(rows[view.rows(dates[rows], outputs[names[0]][rows])])
+    dates = _format_dates(dates[rows])
+    if datatype == "columnar":
+        return _columnar_payload(meta, f"Technical Analysis: {function}", dates, {name: outputs[name][rows] for name in names}, view.order)
+    columns = [np.char.mod("%d" if name in _INTEGER_OUTPUTS else "%.4f", outputs[name][rows]).tolist() for name in names]
+    if datatype == "csv":
+        lines = [",".join(("time", *names))]
+        lines.extend(",".join(row) for row in zip(dates, *columns))
+        return "\r\n".join(lines) + "\r\n"
+    return {
+        "Meta Data": meta,
+        f"Technical Analysis: {function}": {date: dict(zip(names, values)) for date, *values in zip(dates, *columns)},
+    }
+
+
+def _price(bars: Bars, series_type: str) -> np.ndarray:
+    return bars.column(series_type.lower())
+
+
+def _volume_volatility(bars: Bars, **params) -> dict:
+    return indicators.volume_volatility(bars.high, bars.low, bars.close, bars.volume, **params)
+
+
+def _hilbert(bars: Bars, series_type: str, labels: dict) -> dict:
+    # Every HT_* function computes the whole family once and keeps its own outputs.
+    family = indicators.hilbert_transform(_price(bars, series_type))
+    return {label: family[name] for label, name in labels.items()}
+
+
+# Alpha Vantage function -> (indicator name, compute(bars, **tool params) -> {output name: values}).
+_INDICATORS = {
+    "SMA": ("Simple Moving Average (SMA)", lambda bars, series_type, time_period: {"SMA": indicators.sma(_price(bars, series_type), time_period)}),
+    "EMA": ("Exponential Moving Average (EMA)", lambda bars, series_type, time_period: {"EMA": indicators.ema(_price(bars, series_type), time_period)}),
+    "WMA": ("Weighted Moving Average (WMA)", lambda bars, series_type, time_period: {"WMA": indicators.wma(_price(bars, series_type), time_period)}),
+    "DEMA": ("Double Exponential Moving Average (DEMA)", lambda bars, series_type, time_period: {"DEMA": indicators.dema(_price(bars, series_type), time_period)}),
+    "TEMA": ("Triple Exponential Moving Average (TEMA)", lambda bars, series_type, time_period: {"TEMA": indicators.tema(_price(bars, series_type), time_period)}),
+    "TRIMA": ("Triangular Exponential Moving Average (TRIMA)", lambda bars, series_type, time_period: {"TRIMA": indicators.trima(_price(bars, series_type), time_period)}),
+    "KAMA": ("Kaufman Adaptive Moving Average (KAMA)", lambda bars, series_type, time_period: {"KAMA": indicators.kama(_price(bars, series_type), time_period)}),
+    "T3": ("Triple Exponential Moving Average (T3)", lambda bars, series_type, time_period: {"T3": indicators.t3(_price(bars, series_type), time_period)}),
+    "RSI": ("Relative Strength Index (RSI)", lambda bars, series_type, time_period: {"RSI": indicators.rsi(_price(bars, series_type), time_period)}),
+    "STOCH": (
+        "Stochastic (STOCH)",
+        lambda bars, fastkperiod=5, slowkperiod=3, slowdperiod=3, slowkmatype=0, slowdmatype=0: dict(zip(
+            ("SlowK", "SlowD"),
+            indicators.stoch(bars.high, bars.low, bars.close, fastkperiod, slowkperiod, slowkmatype, slowdperiod, slowdmatype),
+        )),
+    ),
+    "STOCHF": (
+        "Stochastic Fast (STOCHF)",
+        lambda bars, fastkperiod=5, fastdperiod=3, fastdmatype=0: dict(zip(
+            ("FastK", "FastD"),
+            indicators.stochf(bars.high, bars.low, bars.close, fastkperiod, fastdperiod, fastdmatype),
+        )),
+    ),
+    "STOCHRSI": (
+        "Stochastic Relative Strength Index (STOCHRSI)",
+        lambda bars, series_type, time_period, fastkperiod=5, fastdperiod=3, fastdmatype=0: dict(zip(
+            ("FastK", "FastD"),
+            indicators.stochrsi(_price(bars, series_type), time_period, fastkperiod, fastdperiod, fastdmatype),
+        )),
+    ),
+    "MACD": (
+        "Moving Average Convergence/Divergence (MACD)",
+        lambda bars, series_type, fastperiod=12, slowperiod=26, signalperiod=9: dict(zip(
+            ("MACD", "MACD_Signal", "MACD_Hist"),
+            indicators.macd(_price(bars, series_type), fastperiod, slowperiod, signalperiod),
+        )),
+    ),
+    "MACDEXT": (
+        "MACD with Controllable MA Type (MACDEXT)",
+        lambda bars, series_type, fastperiod=12, slowperiod=26, signalperiod=9, fastmatype=0, slowmatype=0, signalmatype=0: dict(zip(
+            ("MACD", "MACD_Signal", "MACD_Hist"),
+            indicators.macdext(_price(bars, series_type), fastperiod, fastmatype, slowperiod, slowmatype, signalperiod, signalmatype),
+        )),
+    ),
+    "TRANGE": ("True Range (TRANGE)", lambda bars: {"TRANGE": _volume_volatility(bars)["TRANGE"]}),
+    "ATR": ("Average True Range (ATR)", lambda bars, time_period: {"ATR": _volume_volatility(bars, time_period=time_period)["ATR"]}),
+    "NATR": ("Normalized Average True Range (NATR)", lambda bars, time_period: {"NATR": _volume_volatility(bars, time_period=time_period)["NATR"]}),
+    "AD": ("Chaikin A/D Line", lambda bars: {"Chaikin A/D": _volume_volatility(bars)["AD"]}),
+    "ADOSC": (
+        "Chaikin A/D Oscillator (ADOSC)",
+        lambda bars, fastperiod=3, slowperiod=10: {"ADOSC": _volume_volatility(bars, fastperiod=fastperiod, slowperiod=slowperiod)["ADOSC"]},
+    ),
+    "OBV": ("On Balance Volume (OBV)", lambda bars: {"OBV": _volume_volatility(bars)["OBV"]}),
+    "HT_TRENDLINE": (
+        "Hilbert Transform, Instantaneous Trendline (HT_TRENDLINE)",
+        lambda bars, series_type: _hilbert(bars, series_type, {"HT_TRENDLINE": "TRENDLINE"}),
+    ),
+    "HT_SINE": (
+        "Hilbert Transform, Sine Wave (HT_SINE)",
+        lambda bars, series_type: _hilbert(bars, series_type, {"LEAD SINE": "LEADSINE", "SINE": "SINE"}),
+    ),
+    "HT_TRENDMODE": (
+        "Hilbert Transform, Trend vs Cycle Mode (HT_TRENDMODE)",
+        lambda bars, series_type: _hilbert(bars, series_type, {"TRENDMODE": "TRENDMODE"}),
+    ),
+    "HT_DCPERIOD": (
+        "Hilbert Transform, Dominant Cycle Period (HT_DCPERIOD)",
+        lambda bars, series_type: _hilbert(bars, series_type, {"DCPERIOD": "DCPERIOD"}),
+    ),
+    "HT_DCPHASE": (
+        "Hilbert Transform, Dominant Cycle Phase (HT_DCPHASE)",
+        lambda bars, series_type: _hilbert(bars, series_type, {"HT_DCPHASE": "DCPHASE"}),
+    ),
+    "HT_PHASOR": (
+        "Hilbert Transform, Phasor Components (HT_PHASOR)",
+        lambda bars, series_type: _hilbert(bars, series_type, {"PHASE": "INPHASE", "QUADRATURE": "QUADRATURE"}),
+    ),
+}
+
+# Fixed parameters of the local engine that Alpha Vantage reports in the Meta Data.
+_FIXED_PARAMS = {"T3": {"Volume Factor (vFactor)": 0.7}}
+# MA type number the local engine does not compute (MAMA); indicators asking for it are served by Alpha Vantage.
+_UPSTREAM_MATYPE = 7
+
+# Outputs that are flags rather than prices, rendered without decimals.
+_INTEGER_OUTPUTS = {"TRENDMODE"}
+_DATATYPES = ("json", "csv", "columnar")
+
+_PARAM_LABELS = {
+    "time_period": "Time Period",
+    "fastperiod": "Fast Period",
+    "slowperiod": "Slow Period",
+    "signalperiod": "Signal Period",
+    "fastmatype": "Fast MA Type",
+    "slowmatype": "Slow MA Type",
+    "signalmatype": "Signal MA Type",
+    "fastkperiod": "FastK Period",
+    "fastdperiod": "FastD Period",
+    "fastdmatype": "FastD MA Type",
+    "slowkperiod": "SlowK Period",
+    "slowkmatype": "SlowK MA Type",
+    "slowdperiod": "SlowD Period",
+    "slowdmatype": "SlowD MA Type",
+}
+
+
+async def _technical_indicator(
+    function: str, symbol: str, interval: str, month: Optional[str] = None, datatype: str = "json", view: SeriesView = SeriesView(), **params
+):
+    """
+    Compute a technical indicator locally from stored bars instead of calling the Alpha Vantage indicator endpoint.
+
+    Parameters use the Alpha Vantage names, so a configuration the local engine does
+    not implement (MAMA as an MA type) is passed through to Alpha Vantage unchanged.
+    :param function: Alpha Vantage function name (e.g. 'SMA').
+    :param view: Date range, outputs, number of points and order to return.
+    :param params: Indicator parameters (series_type, time_period, fastperiod, ...).
+    :return: JSON response in the Alpha Vantage indicator shape (or CSV text).
+    """
+    if datatype not in _DATATYPES:
+        raise ValueError(f"Unsupported datatype '{datatype}'. Valid datatypes: {', '.join(_DATATYPES)}")
+    if _needs_upstream(params):
+        return await _upstream_indicator(function, symbol, interval, month, datatype, params, view)
+    missing = []
+    if view.start and not month and interval.lower() in INTRADAY_INTERVALS:
+        # Start a month early so the indicator has warmed up by the first returned bar.
+        bars, missing = await _intraday_bars(symbol, interval.lower(), str(np.datetime64(view.start, "M") - 1), view.end)
+    else:
+        bars = await _bars(symbol, interval, month)
+    if not isinstance(bars, Bars):
+        return bars
+    payload = await _indicator_from_bars(function, symbol, interval, bars, month, datatype, view, **params)
+    return _note_missing(payload, symbol, interval.lower(), missing)
+
+
+async def _indicator_from_bars(
+    function: str, symbol: str, interval: str, bars: Bars, month: Optional[str] = None, datatype: str = "json", view: SeriesView = SeriesView(), **params
+):
+    """
+    Compute a technical indicator from bars that have already been loaded.
+    Callers route configurations that need Alpha Vantage (see _needs_upstream) before loading bars.
+    """
+    if datatype not in _DATATYPES:
+        raise ValueError(f"Unsupported datatype '{datatype}'. Valid datatypes: {', '.join(_DATATYPES)}")
+    indicator, compute = _INDICATORS[function]
+    outputs = compute(bars, **params)
+    labels = {_PARAM_LABELS[name]: value for name, value in params.items() if name != "series_type"}
+    labels.update(_FIXED_PARAMS.get(function, {}))
+    meta = _indicator_meta(symbol, indicator, bars, interval, labels, params.get("series_type"))
+    return _indicator_payload(function, meta, bars.dates, outputs, datatype, view)
+
+
+def _needs_upstream(params: dict) -> bool:
+    return any(name.endswith("matype") and int(value) == _UPSTREAM_MATYPE for name, value in params.items())
+
+
+async def _upstream_indicator(
+    function: str, symbol: str, interval: str, month: Optional[str], datatype: str, params: dict, view: SeriesView = SeriesView()
+):
+    """
+    Request an indicator from the Alpha Vantage endpoint, for configurations the local engine does not compute.
+
+    The JSON response is rendered like a local indicator, so the view and datatype apply the same way.
+    :return: JSON response in the Alpha Vantage indicator shape (or CSV text), or the upstream error payload.
+    """
+    if datatype not in _DATATYPES:
+        raise ValueError(f"Unsupported datatype '{datatype}'. Valid datatypes: {', '.join(_DATATYPES)}")
+    upstream = {"function": function, "symbol": symbol, "interval": interval, **params, "datatype": "json"}
+    if month:
+        upstream["month"] = month
+    data = await _make_request(upstream)
+    series = data.get(f"Technical Analysis: {function}") if isinstance(data, dict) else None
+    if not series:
+        return data
+    dates = np.array(list(series), dtype="datetime64[m]" if interval.lower() in INTRADAY_INTERVALS else "datetime64[D]")
+    order = np.argsort(dates, kind="stable")
+    names = list(next(iter(series.values())))
+    outputs = {name: np.array([row.get(name) for row in series.values()], dtype=np.float64)[order] for name in names}
+    return _indicator_payload(function, data.get("Meta Data", {}), dates[order], outputs, datatype, view)
+
+
+async def _vwap(symbol: str, interval: str, month: Optional[str] = None, datatype: str = "json", view: SeriesView = SeriesView()):
+    """
+    Session VWAP computed from stored 1-minute bars and sampled at the last minute of each `interval` bar.
+
+    Bars are labelled with their start time, like the Alpha Vantage intraday series.
+    """
+    interval = interval.lower()
+    if datatype not in _DATATYPES:
+        raise ValueError(f"Unsupported datatype '{datatype}'. Valid datatypes: {', '.join(_DATATYPES)}")
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"VWAP is only available for intraday intervals ({', '.join(INTRADAY_INTERVALS)})")
+    bars = await _bars(symbol, "1min", month)
+    if not isinstance(bars, Bars):
+        return bars
+    values = indicators.session_vwap(bars.dates, bars.high, bars.low, bars.close, bars.volume)
+    size = np.timedelta64(int(interval.removesuffix("min")), "m")
+    day = bars.dates.astype("datetime64[D]")
+    starts = day + (bars.dates - day) // size * size
+    last = np.flatnonzero(np.append(starts[1:] != starts[:-1], True))
+    sampled = dataclasses.replace(bars[last], dates=starts[last])
+    meta = _indicator_meta(symbol, "Volume Weighted Average Price (VWAP)", sampled, interval, {})
+    return _indicator_payload("VWAP", meta, sampled.dates, {"VWAP": values[last]}, datatype, view)
 
 mcp = FastMCP("stockwhisperer")   
 
 @mcp.tool()
-def get_all_tickers_in_exchange(exchanges: set[str])-> list[str]:
+async def get_all_tickers_in_exchange(exchanges: set[str])-> list[str]:
     """
     Get a list with all the symbols filtered by a given exchange.
     
@@ -35,128 +685,364 @@ def get_all_tickers_in_exchange(exchanges: set[str])-> list[str]:
     :return: list of symbols
     """
 
-    exchanges = {x.upper() for x in exchanges}
-    r = requests.get('https://scanner.tradingview.com/america/scan')
-    data = r.json()['data']  # [{'s': 'NYSE:HKD', 'd': []}, {'s': 'NASDAQ:ALTY', 'd': []}...]
-    
-    symbols = []
-    for dct in data:
-        exchange, symbol = dct['s'].split(':')
-        if exchange in exchanges:
-            symbols.append(symbol)
-    return symbols
+    return await universe.symbols(exchanges)
 
 @mcp.tool()
-def get_intraday_data(
-    symbol: str, interval: str = "1min", output_size: str = "compact"
+async def get_intraday_data(
+    symbol: str,
+    interval: str = "1min",
+    output_size: str = "compact",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+    datatype: str = "json",
 ):
     """
     Fetch intraday stock data.
     :param symbol: Stock symbol (e.g., 'AAPL').
     :param interval: Time interval between data points (e.g., '1min', '5min').
-    :param output_size: 'compact' or 'full'.
-    :return: JSON response.
-    """
-    params = {
-        "function": "TIME_SERIES_INTRADAY",
-        "symbol": symbol,
-        "interval": interval,
-        "outputsize": output_size,
+    :param output_size: 'compact' (latest 100 bars) or 'full'. Ignored when start or end is given.
+    :param start: First timestamp to return (optional, e.g. '2025-10-01 09:30'; a date means from that day on).
+        Older history comes from months stored with backfill_intraday; months not stored yet are listed
+        under "Missing Months" in the Meta Data.
+    :param end: Last timestamp to return (optional; a date means through that day).
+    :param fields: Fields to keep (optional, e.g. ['close', 'volume']).
+    :param max_points: At most this many bars; longer ranges are merged into OHLC buckets (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
+    :param datatype: 'json' (default) or 'columnar' (a dates array plus one numeric array per field).
+    :return: JSON response.
+    """
+    view = SeriesView(start, end, fields, max_points, order)
+    bars, missing = await _intraday_bars(symbol, interval.lower(), start, end)
+    if not isinstance(bars, Bars):
+        return bars
+    if output_size != "full" and not (start or end):
+        bars = bars[-100:]
+    meta = {
+        "1. Information": f"Intraday ({interval.lower()}) open, high, low, close prices and volume",
+        "2. Symbol": symbol.upper(),
+        "3. Last Refreshed": _format_dates(bars.dates[-1:])[0] if len(bars) else None,
+        "4. Interval": interval.lower(),
+        "5. Output Size": "Full size" if output_size == "full" else "Compact",
+        "6. Time Zone": "US/Eastern",
     }
-    return _make_request(params)
+    return _note_missing(_series_payload(meta, f"Time Series ({interval.lower()})", bars, view, datatype), symbol, interval.lower(), missing)
 
 @mcp.tool()
-def get_all_daily_historical_data(symbol: str, output_size: str = "compact"):
+async def backfill_intraday(symbol: str, start_month: str, end_month: Optional[str] = None, interval: str = "1min"):
     """
-    Returns raw (as-traded) daily time series (date, daily open, daily high, daily low, daily close, daily volume) of the global equity specified, covering 20+ years of historical data. The OHLCV data is sometimes called "candles" in finance literature.
+    Download intraday history month by month into the local store, so intraday data and indicators
+    over long periods are served from disk. Months are fetched concurrently within the Alpha Vantage
+    rate limit; past months that are already stored are never downloaded again.
     :param symbol: Stock symbol (e.g., 'AAPL').
-    :param output_size: 'compact' or 'full'.
-    :return: JSON response.
+    :param start_month: First month to backfill, YYYY-MM (e.g., '2024-01').
+    :param end_month: Last month to backfill, YYYY-MM. Defaults to the current month.
+    :param interval: Intraday interval ('1min', '5min', '15min', '30min', '60min'). Defaults to '1min'.
+    :return: JSON response with the number of bars stored per month, or the upstream message for months that failed.
+    """
+    symbol, interval = symbol.upper(), interval.lower()
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"Unsupported interval '{interval}'")
+    months = _months(start_month, end_month)
+    bars, errors = await _intraday_months(symbol, interval, months)
+    counts = dict.fromkeys(months, 0)
+    if bars is not None:
+        stored, sizes = np.unique(bars.dates.astype("datetime64[M]"), return_counts=True)
+        counts.update(zip(stored.astype(str).tolist(), sizes.tolist()))
+    for month, data in errors.items():
+        counts[month] = (data.get("Error Message") or data.get("Information") or data) if isinstance(data, dict) else data
+    return {"symbol": symbol, "interval": interval, "months": counts, "total_bars": 0 if bars is None else len(bars)}
+
+_adjustments: dict[str, Adjustment] = {}
+
+
+async def _adjusted_bars(symbol: str, bars: Bars, mode: str):
+    """
+    A symbol's whole daily history adjusted for splits ('split') or splits and dividends ('total_return').
+
+    Corporate actions come from the stored SPLITS and DIVIDENDS responses. The factors
+    are kept per symbol and only extended when new bars or actions arrive.
+    :return: Bars, or the upstream payload when the corporate actions could not be loaded.
+    """
+    if mode not in ADJUSTMENTS:
+        raise ValueError(f"Unsupported adjustment '{mode}'. Valid adjustments: {', '.join(ADJUSTMENTS)}")
+    if mode == "none":
+        return bars
+    symbol = symbol.upper()
+    loaded = await asyncio.gather(*(_fundamentals(function, symbol) for function, _ in _CORPORATE_ACTIONS.values()))
+    actions = []
+    for (kind, (_, extract)), data in zip(_CORPORATE_ACTIONS.items(), loaded):
+        if not _usable(data):
+            return data
+        value = "split_factor" if kind == "split" else "amount"
+        actions += [(date, kind, details[value]) for date, _, _, details in extract(symbol, data)]
+    adjustment = _adjustments[symbol] = _adjustments.get(symbol, Adjustment.empty()).update(bars, actions)
+    return adjustment.apply(bars, mode)
+
+
+@mcp.tool()
+async def get_all_daily_historical_data(
+    symbol: str,
+    output_size: str = "compact",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+    datatype: str = "json",
+    adjust: str = "none",
+):
     """
-    params = {
-        "function": "TIME_SERIES_DAILY",
-        "symbol": symbol,
-        "outputsize": output_size,
+    Returns daily time series (date, daily open, daily high, daily low, daily close, daily volume) of the global equity specified, covering 20+ years of historical data. The OHLCV data is sometimes called "candles" in finance literature.
+    Prices are raw (as-traded) unless `adjust` asks for split- or total-return-adjusted prices, which multi-year return calculations need.
+    :param symbol: Stock symbol (e.g., 'AAPL').
+    :param output_size: 'compact' (latest 100 days) or 'full'. Ignored when start or end is given.
+    :param start: First date to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date to return (optional, same formats).
+    :param fields: Fields to keep (optional, e.g. ['close', 'volume']).
+    :param max_points: At most this many bars; longer ranges are merged into OHLC buckets (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
+    :param datatype: 'json' (default) or 'columnar' (a dates array plus one numeric array per field).
+    :param adjust: 'none' (as traded, default), 'split' (earlier prices and volumes scaled by later splits)
+        or 'total_return' (also adjusted for dividends, so close-to-close changes are total returns).
+    :return: JSON response.
+    """
+    view = SeriesView(start, end, fields, max_points, order)
+    bars = await _daily_bars(symbol)
+    if not isinstance(bars, Bars):
+        return bars
+    bars = await _adjusted_bars(symbol, bars, adjust)
+    if not isinstance(bars, Bars):
+        return bars
+    if output_size != "full" and not (start or end):
+        bars = bars[-100:]
+    information = {"split": ", adjusted for splits", "total_return": ", adjusted for splits and dividends"}
+    meta = {
+        "1. Information": f"Daily Prices (open, high, low, close) and Volumes{information.get(adjust, '')}",
+        "2. Symbol": symbol.upper(),
+        "3. Last Refreshed": _format_dates(bars.dates[-1:])[0] if len(bars) else None,
+        "4. Output Size": "Full size" if output_size == "full" else "Compact",
+        "5. Time Zone": "US/Eastern",
     }
-    return _make_request(params)
+    return _series_payload(meta, "Time Series (Daily)", bars, view, datatype)
 
 @mcp.tool()
-def get_specific_date_historical_data(symbol: str, date: str):
+async def get_specific_date_historical_data(symbol: str, date: str):
     """
     Returns raw (as-traded) daily time series (date, daily open, daily high, daily low, daily close, daily volume) of the global equity specified, for a specific date.
     :param symbol: Stock symbol (e.g., 'AAPL').
     :param date: Date in YYYY-MM-DD format. example: 2025-10-31
     :return: JSON response.
     """
-    params = {
-        "function": "TIME_SERIES_DAILY",
-        "symbol": symbol,
-        "outputsize": "full",
-    }
-    data = _make_request(params)
+    bars = await _daily_bars(symbol, datetime.date.fromisoformat(date))
+    if not isinstance(bars, Bars):
+        return bars
 
-    time_series = data.get("Time Series (Daily)", {})
-    historical_data = time_series.get(date, {})
+    i = bars.index_of(date)
+    if i is None:
+        return {date: {}}
+    return _series_rows(bars[i:i + 1])
 
-    return {date: historical_data} if historical_data else {date: {}}
 
+async def _aggregated_series(symbol: str, interval: str, view: SeriesView, datatype: str = "json") -> dict:
+    """
+    Weekly or monthly bars in the Alpha Vantage response shape, served from the local store.
+    """
+    bars = await _bars(symbol, interval)
+    if not isinstance(bars, Bars):
+        return bars
+    label = interval.capitalize()
+    meta = {
+        "1. Information": f"{label} Prices (open, high, low, close) and Volumes",
+        "2. Symbol": symbol.upper(),
+        "3. Last Refreshed": _format_dates(bars.dates[-1:])[0] if len(bars) else None,
+        "4. Time Zone": "US/Eastern",
+    }
+    return _series_payload(meta, f"{label} Time Series", bars, view, datatype)
 
 @mcp.tool()
-def get_weekly_data(symbol: str):
+async def get_weekly_data(
+    symbol: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+    datatype: str = "json",
+):
     """
     Fetch weekly stock data.
     :param symbol: Stock symbol (e.g., 'AAPL').
+    :param start: First week to return, by date (optional, e.g. '2025-01-01').
+    :param end: Last week to return, by date (optional).
+    :param fields: Fields to keep (optional, e.g. ['close', 'volume']).
+    :param max_points: At most this many bars; longer ranges are merged into OHLC buckets (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
+    :param datatype: 'json' (default) or 'columnar' (a dates array plus one numeric array per field).
     :return: JSON response.
     """
-    params = {"function": "TIME_SERIES_WEEKLY", "symbol": symbol}
-    return _make_request(params)
+    return await _aggregated_series(symbol, "weekly", SeriesView(start, end, fields, max_points, order), datatype)
 
 @mcp.tool()
-def get_monthly_data(symbol: str):
+async def get_monthly_data(
+    symbol: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+    datatype: str = "json",
+):
     """
     Fetch monthly stock data.
     :param symbol: Stock symbol (e.g., 'AAPL').
+    :param start: First month to return, by date (optional, e.g. '2020-01').
+    :param end: Last month to return, by date (optional).
+    :param fields: Fields to keep (optional, e.g. ['close', 'volume']).
+    :param max_points: At most this many bars; longer ranges are merged into OHLC buckets (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
+    :param datatype: 'json' (default) or 'columnar' (a dates array plus one numeric array per field).
     :return: JSON response.
     """
-    params = {"function": "TIME_SERIES_MONTHLY", "symbol": symbol}
-    return _make_request(params)
+    return await _aggregated_series(symbol, "monthly", SeriesView(start, end, fields, max_points, order), datatype)
+
+@mcp.tool()
+async def get_resampled_data(
+    symbol: str,
+    period: str,
+    fiscal_year_end: int = 12,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+    datatype: str = "json",
+):
+    """
+    Fetch candles of any period, resampled locally from stored bars (first open, highest high, lowest low, last close, total volume).
+    Minute and hour periods are built from 1-minute bars, longer ones from daily bars.
+    :param symbol: Stock symbol (e.g., 'AAPL').
+    :param period: Candle length: e.g. '5min', '15min', '2hour', '10day', 'weekly', '2week', 'monthly', 'quarterly' or 'yearly'.
+    :param fiscal_year_end: Month (1-12) that ends the company's fiscal year, so 'quarterly' and 'yearly' follow fiscal quarters (e.g. 9 for a September year end). Default 12.
+    :param start: First candle to return (optional, e.g. '2025-01-01'; intraday history older than 30 days comes from months
+        stored with backfill_intraday, and months not stored yet are listed under "Missing Months" in the Meta Data).
+    :param end: Last candle to return (optional).
+    :param fields: Fields to keep (optional, e.g. ['close', 'volume']).
+    :param max_points: At most this many candles; longer ranges are merged into OHLC buckets (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
+    :param datatype: 'json' (default) or 'columnar' (a dates array plus one numeric array per field).
+    :return: JSON response.
+    """
+    view = SeriesView(start, end, fields, max_points, order)
+    _, unit = parse_period(period)
+    missing = []
+    if unit in ("min", "hour"):
+        bars, missing = await _intraday_bars(symbol, "1min", start, end)
+    else:
+        bars = await _daily_bars(symbol)
+    if not isinstance(bars, Bars):
+        return bars
+    bars = resample(bars, period, fiscal_year_end)
+    meta = {
+        "1. Information": f"{period} Prices (open, high, low, close) and Volumes",
+        "2. Symbol": symbol.upper(),
+        "3. Last Refreshed": _format_dates(bars.dates[-1:])[0] if len(bars) else None,
+        "4. Interval": period,
+        "5. Time Zone": "US/Eastern",
+    }
+    return _note_missing(_series_payload(meta, f"Time Series ({period})", bars, view, datatype), symbol, "1min", missing)
 
 @mcp.tool()
-def get_quote(symbol: str):
+async def get_quote(symbol: str):
     """
     Fetch real-time stock quote.
     :param symbol: Stock symbol (e.g., 'AAPL').
     :return: JSON response.
     """
     params = {"function": "GLOBAL_QUOTE", "symbol": symbol}
-    return _make_request(params)
+    return await _make_request(params)
+
+# Columns of the get_quotes table, in GLOBAL_QUOTE field order.
+QUOTE_FIELDS = ("symbol", "open", "high", "low", "price", "volume", "latest_trading_day", "previous_close", "change", "change_percent")
+
+
+def _quote_row(quote: dict) -> list:
+    """
+    One GLOBAL_QUOTE record ('01. symbol', '05. price', ...) as a row of typed QUOTE_FIELDS values.
+    """
+    fields = {key.partition(". ")[2].replace(" ", "_"): value for key, value in quote.items()}
+    row = []
+    for field in QUOTE_FIELDS:
+        value = fields.get(field)
+        if field not in ("symbol", "latest_trading_day") and value is not None:
+            try:
+                value = int(value) if field == "volume" else float(value.rstrip("%"))
+            except ValueError:
+                value = None
+        row.append(value)
+    return row
+
+
+@mcp.tool()
+async def get_quotes(symbols: list[str]):
+    """
+    Fetch real-time quotes for several symbols in one call.
+
+    Quotes are requested concurrently through the shared rate limiter; repeated symbols
+    are fetched once and quotes seen in the last few seconds come from the cache.
+    :param symbols: Ticker symbols (e.g., ['AAPL', 'MSFT', 'IBM']).
+    :return: JSON with 'fields' (column names), 'quotes' (one row per symbol, in the order
+        given) and 'errors' (symbol -> message for symbols without a quote).
+    """
+    symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+    responses = await asyncio.gather(
+        *(_make_request({"function": "GLOBAL_QUOTE", "symbol": symbol}) for symbol in symbols), return_exceptions=True
+    )
+    quotes, errors = [], {}
+    for symbol, data in zip(symbols, responses):
+        if isinstance(data, Exception):
+            errors[symbol] = str(data) or type(data).__name__
+        elif not _usable(data) or not data.get("Global Quote"):
+            notes = [data[key] for key in ("Error Message", "Note", "Information") if key in data] if isinstance(data, dict) else []
+            errors[symbol] = notes[0] if notes else f"No quote found for '{symbol}'"
+        else:
+            quotes.append(_quote_row(data["Global Quote"]))
+    return {"fields": list(QUOTE_FIELDS), "quotes": quotes, "errors": errors}
 
 @mcp.tool()
-def search_symbol(keywords: str):
+async def search_symbol(keywords: str):
     """
     Search for stock symbols based on keywords.
     :param keywords: Search keywords (e.g., 'Microsoft').
     :return: JSON response.
     """
+    matches = await listings.search(keywords)
+    if matches is not None:
+        return matches
     params = {"function": "SYMBOL_SEARCH", "keywords": keywords}
-    return _make_request(params)
+    return await _make_request(params)
 
 @mcp.tool()
-def symbol_search(keywords: str):
+async def symbol_search(keywords: str):
     """
     Search for best-matching symbols and market information based on keywords.
     :param keywords: Search keywords (e.g., 'Microsoft').
     :return: JSON response.
     """
+    matches = await listings.search(keywords)
+    if matches is not None:
+        return matches
     params = {
         "function": "SYMBOL_SEARCH",
         "keywords": keywords,
         "datatype": "json"
     }
-    return _make_request(params)
+    return await _make_request(params)
 
 @mcp.tool()
-def market_status():
+async def market_status():
     """
     Global Market Open & Close Status Utility
 
@@ -166,27 +1052,87 @@ def market_status():
     params = {
         "function": "MARKET_STATUS"
     }
-    return _make_request(params)
+    return await _make_request(params)
+
+async def _transcript(symbol: str, quarter: str):
+    """
+    An earnings call transcript from the persistent store, fetched from Alpha Vantage
+    only the first time, and added to the passage index once loaded.
+    :return: JSON response.
+    """
+    key = f"{symbol}-{quarter}"
+    stored = _responses.get("EARNINGS_CALL_TRANSCRIPT", key)
+    # Published transcripts do not change; an empty one is asked for again once it is EMPTY_TRANSCRIPT_MAX_AGE old.
+    if stored is not None and (stored["payload"].get("transcript") or time.time() - stored["checked_at"] < EMPTY_TRANSCRIPT_MAX_AGE):
+        data = stored["payload"]
+    else:
+        data = await _make_request({"function": "EARNINGS_CALL_TRANSCRIPT", "symbol": symbol, "quarter": quarter})
+        if _usable(data):
+            _responses.put("EARNINGS_CALL_TRANSCRIPT", key, data)
+    if (symbol, quarter) not in transcripts and _usable(data) and data.get("transcript"):
+        await asyncio.to_thread(transcripts.add, symbol, quarter, data)
+    return data
+
+
+def _recent_quarters(count: int) -> list[str]:
+    """
+    The last `count` completed calendar quarters, newest first, in YYYYQM format.
+    The current quarter's call has not taken place yet, so it is not included.
+    """
+    today = datetime.datetime.now(EASTERN).date()
+    last = today.year * 4 + (today.month - 1) // 3 - 1
+    return [f"{q // 4}Q{q % 4 + 1}" for q in range(last, last - count, -1)]
+
 
 @mcp.tool()
-def earning_call_transcript(symbol: str, quarter: str):
+async def earning_call_transcript(symbol: str, quarter: str):
     """
     Earnings Call Transcript Trending
 
     This API returns the earnings call transcript for a given company in a specific quarter, covering over 15 years of history and enriched with LLM-based sentiment signals.
+    Transcripts are kept locally once fetched; use search_earnings_calls to get only the passages relevant to a question.
     :param symbol: The ticker symbol (e.g., 'IBM').
     :param quarter: Fiscal quarter in YYYYQM format (e.g., '2024Q1').
     :return: JSON response.
     """
-    params = {
-        "function": "EARNINGS_CALL_TRANSCRIPT",
+    return await _transcript(symbol.strip().upper(), quarter.strip().upper())
+
+
+@mcp.tool()
+async def search_earnings_calls(symbol: str, query: str, quarters: Optional[list[str]] = None, last: int = 8, top_k: int = 5):
+    """
+    Search a company's earnings call transcripts for the passages most relevant to a question (BM25 ranking).
+
+    Transcripts are fetched once per quarter, split into speaker passages and indexed
+    locally, so follow-up questions about the same calls do not refetch them.
+    :param symbol: The ticker symbol (e.g., 'IBM').
+    :param query: What to look for (e.g., 'gross margin outlook').
+    :param quarters: Quarters to search in YYYYQM format (optional, e.g. ['2024Q4', '2025Q1']).
+    :param last: Without `quarters`, search this many quarters back from the last completed one. Default is 8.
+    :param top_k: Number of passages to return. Default is 5.
+    :return: JSON with the quarters searched, quarters without a transcript, and the passages
+        (quarter, speaker, title, sentiment, text, score), best first.
+    """
+    symbol = symbol.strip().upper()
+    quarters = list(dict.fromkeys(quarter.strip().upper() for quarter in quarters)) if quarters else _recent_quarters(last)
+    invalid = [quarter for quarter in quarters if not re.fullmatch(r"\d{4}Q[1-4]", quarter)]
+    if invalid:
+        raise ValueError(f"Invalid quarter '{invalid[0]}', expected YYYYQM (e.g. 2024Q1)")
+    results = await asyncio.gather(*(_transcript(symbol, quarter) for quarter in quarters), return_exceptions=True)
+    for quarter, result in zip(quarters, results):
+        if isinstance(result, Exception):
+            logger.warning("Loading the %s %s transcript failed: %s", symbol, quarter, result)
+    found = [quarter for quarter in quarters if (symbol, quarter) in transcripts]
+    passages = await asyncio.to_thread(transcripts.search, query, [symbol], found, top_k) if found else []
+    return {
         "symbol": symbol,
-        "quarter": quarter
+        "quarters_searched": found,
+        "quarters_unavailable": [quarter for quarter in quarters if quarter not in found],
+        "passages": [{key: value for key, value in passage.items() if key != "symbol"} for passage in passages],
     }
-    return _make_request(params)
 
 @mcp.tool()
-def top_gainers_losers():
+async def top_gainers_losers():
     """
     Top Gainers, Losers, and Most Actively Traded Tickers (US Market)
 
@@ -196,10 +1142,50 @@ def top_gainers_losers():
     params = {
         "function": "TOP_GAINERS_LOSERS"
     }
-    return _make_request(params)
+    return await _make_request(params)
+
+# Bars per year for annualized analytics; intraday intervals count regular-session bars.
+_PERIODS_PER_YEAR = {"daily": 252, "weekly": 52, "monthly": 12, **{interval: 252 * 390 / int(interval.removesuffix("min")) for interval in INTRADAY_INTERVALS}}
+_RANGE_UNITS = {"day": np.timedelta64(1, "D"), "week": np.timedelta64(7, "D")}
+
+
+def _error_message(data, symbol: str) -> str:
+    """
+    The message of an exception or upstream error payload, for the "errors" of a multi-symbol tool.
+    """
+    if isinstance(data, Exception):
+        return str(data) or type(data).__name__
+    notes = [data[key] for key in ("Error Message", "Note", "Information") if key in data] if isinstance(data, dict) else []
+    return notes[0] if notes else f"No data found for '{symbol}'"
+
+
+def _analytics_window(bars: Bars, range1: str, range2: Optional[str] = None) -> Bars:
+    """
+    Select the bars an analytics RANGE refers to: two dates (or months) bound the window;
+    a single value is 'full', a trailing span such as '5day', '2week', '6month' or '1year',
+    or a start date.
+    """
+    if range2:
+        return bars.between(range1, range2)
+    span = range1.strip().lower()
+    if span == "full" or not len(bars):
+        return bars
+    match = re.fullmatch(r"(\d+)\s*(day|week|month|year)s?", span)
+    if not match:
+        return bars.between(range1)
+    count, unit = int(match.group(1)), match.group(2)
+    last = bars.dates[-1].astype("datetime64[D]")
+    if unit in _RANGE_UNITS:
+        start = last - count * _RANGE_UNITS[unit]
+    else:
+        months = count * (12 if unit == "year" else 1)
+        month = last.astype("datetime64[M]")
+        start = (month - months).astype("datetime64[D]") + (last - month.astype("datetime64[D]"))
+    return bars.between(start)
+
 
 @mcp.tool()
-def analytics_fixed_window(
+async def analytics_fixed_window(
     symbols: str,
     interval: str,
     calculations: str,
@@ -211,40 +1197,113 @@ def analytics_fixed_window(
     Advanced Analytics (Fixed Window)
 
     This endpoint returns a rich set of advanced analytics metrics (e.g., total return, variance, auto-correlation, etc.) for a given time series over a fixed temporal window.
+    Metrics are computed locally from the stored price series, so any number of symbols can be compared.
     :param symbols: Comma separated list of symbols (e.g., 'AAPL,MSFT,IBM').
     :param interval: Time interval between data points (e.g., 'DAILY', '1min').
-    :param calculations: Comma separated list of analytics metrics (e.g., 'MEAN,STDDEV,CORRELATION').
-    :param range1: Start date or range (e.g., '2023-07-01').
-    :param range2: End date or range (optional, e.g., '2023-08-31').
+    :param calculations: Comma separated list of analytics metrics (e.g., 'MEAN,STDDEV(annualized=True),CORRELATION(method=KENDALL)').
+        Supported: MIN, MAX, MEAN, MEDIAN, CUMULATIVE_RETURN, VARIANCE, STDDEV, MAX_DRAWDOWN, HISTOGRAM(bins=N), AUTOCORRELATION(lag=N), COVARIANCE, CORRELATION.
+    :param range1: Start date, or a whole range on its own: 'full', or a trailing span such as '1month' or '5day'.
+    :param range2: End date (optional, e.g., '2023-08-31').
     :param ohlc: OHLC field to use (default 'close').
-    :return: JSON response.
+    :return: JSON response, computed over the symbols whose prices loaded; 'errors' maps the others to their message.
+    """
+    names = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()))
+    interval = interval.lower()
+    if interval not in _PERIODS_PER_YEAR:
+        raise ValueError(f"Unsupported interval '{interval}'")
+    parsed = analytics.parse_calculations(calculations)
+    loaded = await asyncio.gather(*(_bars(symbol, interval) for symbol in names), return_exceptions=True)
+    series, errors = {}, {}
+    for symbol, bars in zip(names, loaded):
+        if not isinstance(bars, Bars):
+            errors[symbol] = _error_message(bars, symbol)
+            continue
+        window = _analytics_window(bars, range1, range2)
+        series[symbol] = (window.dates, np.asarray(window.column(ohlc.lower())))
+    if not series:
+        return {"Error Message": "No price data could be loaded for any of the symbols", "errors": errors}
+    payload = await asyncio.to_thread(analytics.fixed_window, series, parsed, _PERIODS_PER_YEAR[interval])
+    dates = np.concatenate([dates for dates, _ in series.values()])
+    return {
+        "meta_data": {
+            "symbols": ",".join(series),
+            "min_dt": _format_dates(dates.min(keepdims=True))[0] if len(dates) else None,
+            "max_dt": _format_dates(dates.max(keepdims=True))[0] if len(dates) else None,
+            "ohlc": ohlc.capitalize(),
+            "interval": interval.upper(),
+        },
+        "payload": {"RETURNS_CALCULATIONS": payload},
+        "errors": errors,
+    }
+
+@mcp.tool()
+async def analytics_sliding_window(
+    symbols: str,
+    interval: str,
+    window_size: int,
+    calculations: str,
+    range1: str,
+    range2: Optional[str] = None,
+    ohlc: str = "close",
+    benchmark: str = "SPY"
+):
     """
-    params = {
-        "function": "ANALYTICS_FIXED_WINDOW",
-        "SYMBOLS": symbols,
-        "INTERVAL": interval,
-        "CALCULATIONS": calculations,
-        "OHLC": ohlc
+    Advanced Analytics (Sliding Window)
+
+    This endpoint returns rolling analytics metrics (e.g., 30-day mean return, 90-day volatility, correlation, beta) for a given time series, one value per window.
+    Metrics are computed locally from the stored price series and updated incrementally from one window to the next.
+    :param symbols: Comma separated list of symbols (e.g., 'AAPL,MSFT,IBM').
+    :param interval: Time interval between data points (e.g., 'DAILY', '1min').
+    :param window_size: Number of returns in each window (e.g., 30).
+    :param calculations: Comma separated list of analytics metrics (e.g., 'MEAN,STDDEV(annualized=True),BETA').
+        Supported: MEAN, VARIANCE, STDDEV, CUMULATIVE_RETURN, DRAWDOWN (below the window's high), CORRELATION (between the symbols), BETA (against the benchmark).
+    :param range1: Start date, or a whole range on its own: 'full', or a trailing span such as '1year'.
+    :param range2: End date (optional, e.g., '2023-08-31').
+    :param ohlc: OHLC field to use (default 'close').
+    :param benchmark: Index symbol BETA is measured against (default 'SPY').
+    :return: JSON response, computed over the symbols whose prices loaded; 'errors' maps the others
+        (and the benchmark, whose failure leaves BETA out) to their message.
+    """
+    names = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()))
+    interval = interval.lower()
+    if interval not in _PERIODS_PER_YEAR:
+        raise ValueError(f"Unsupported interval '{interval}'")
+    parsed = analytics.parse_calculations(calculations, analytics.SLIDING_CALCULATIONS)
+    index = benchmark.strip().upper() if any(name == "BETA" for _, name, _ in parsed) else None
+    loaded = await asyncio.gather(*(_bars(symbol, interval) for symbol in names + ([index] if index else [])), return_exceptions=True)
+    windows, errors = [], {}
+    for symbol, bars in zip(names + ([index] if index else []), loaded):
+        if not isinstance(bars, Bars):
+            errors[symbol] = _error_message(bars, symbol)
+            windows.append(None)
+            continue
+        window = _analytics_window(bars, range1, range2)
+        windows.append((window.dates, np.asarray(window.column(ohlc.lower()))))
+    series = {symbol: window for symbol, window in zip(names, windows) if window is not None}
+    if not series:
+        return {"Error Message": "No price data could be loaded for any of the symbols", "errors": errors}
+    reference = (index, *windows[-1]) if index and windows[-1] is not None else None
+    if index and reference is None:
+        # Without the benchmark, BETA is left out and the other metrics are still computed.
+        parsed = [calculation for calculation in parsed if calculation[1] != "BETA"]
+        index = None
+    dates = np.concatenate([dates for dates, _ in series.values()])
+    meta_data = {
+        "symbols": ",".join(series),
+        "window_size": window_size,
+        "min_dt": _format_dates(dates.min(keepdims=True))[0] if len(dates) else None,
+        "max_dt": _format_dates(dates.max(keepdims=True))[0] if len(dates) else None,
+        "ohlc": ohlc.capitalize(),
+        "interval": interval.upper(),
     }
-    # Add RANGE parameters as separate entries if range2 is provided
-    if range2:
-        # requests will encode multiple identical keys as needed
-        params_list = [
-            ("function", "ANALYTICS_FIXED_WINDOW"),
-            ("SYMBOLS", symbols),
-            ("INTERVAL", interval),
-            ("CALCULATIONS", calculations),
-            ("OHLC", ohlc),
-            ("RANGE", range1),
-            ("RANGE", range2)
-        ]
-        return _make_request(dict(params_list))
-    else:
-        params["RANGE"] = range1
-        return _make_request(params)
+    if index:
+        meta_data["benchmark"] = index
+    payload = await asyncio.to_thread(analytics.sliding_window, series, parsed, window_size, _PERIODS_PER_YEAR[interval], reference)
+    return {"meta_data": meta_data, "payload": {"RETURNS_CALCULATIONS": payload}, "errors": errors}
+
 
 @mcp.tool()
-def company_overview(symbol: str):
+async def company_overview(symbol: str):
     """
     Company Overview
 
@@ -252,14 +1311,10 @@ def company_overview(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "OVERVIEW",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("OVERVIEW", symbol)
 
 @mcp.tool()
-def etf_profile(symbol: str):
+async def etf_profile(symbol: str):
     """
     ETF Profile & Holdings
 
@@ -267,14 +1322,10 @@ def etf_profile(symbol: str):
     :param symbol: The ticker symbol (e.g., 'QQQ').
     :return: JSON response.
     """
-    params = {
-        "function": "ETF_PROFILE",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("ETF_PROFILE", symbol)
 
 @mcp.tool()
-def dividends(symbol: str):
+async def dividends(symbol: str):
     """
     Corporate Action - Dividends Trending
 
@@ -282,14 +1333,10 @@ def dividends(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "DIVIDENDS",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("DIVIDENDS", symbol)
 
 @mcp.tool()
-def splits(symbol: str):
+async def splits(symbol: str):
     """
     Corporate Action - Splits
 
@@ -297,14 +1344,10 @@ def splits(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "SPLITS",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("SPLITS", symbol)
 
 @mcp.tool()
-def income_statement(symbol: str):
+async def income_statement(symbol: str):
     """
     Income Statement
 
@@ -312,14 +1355,10 @@ def income_statement(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "INCOME_STATEMENT",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("INCOME_STATEMENT", symbol)
 
 @mcp.tool()
-def balance_sheet(symbol: str):
+async def balance_sheet(symbol: str):
     """
     Balance Sheet
 
@@ -327,14 +1366,10 @@ def balance_sheet(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "BALANCE_SHEET",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("BALANCE_SHEET", symbol)
 
 @mcp.tool()
-def cash_flow(symbol: str):
+async def cash_flow(symbol: str):
     """
     Cash Flow
 
@@ -342,14 +1377,10 @@ def cash_flow(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "CASH_FLOW",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("CASH_FLOW", symbol)
 
 @mcp.tool()
-def earnings(symbol: str):
+async def earnings(symbol: str):
     """
     Earnings
 
@@ -357,54 +1388,187 @@ def earnings(symbol: str):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :return: JSON response.
     """
-    params = {
-        "function": "EARNINGS",
-        "symbol": symbol
-    }
-    return _make_request(params)
+    return await _fundamentals("EARNINGS", symbol)
+
+# Parsed fundamentals per (function, symbol), with the response they were parsed from.
+_fundamental_tables: dict[tuple[str, str], tuple[dict, fundamentals_table.FundamentalsTable]] = {}
+
+
+async def _fundamentals_table(function: str, symbol: str):
+    """
+    One stored fundamentals response as a FundamentalsTable, parsed again only when the response changed.
+    :return: FundamentalsTable, or the upstream payload when there is no usable response.
+    """
+    data = await _fundamentals(function, symbol)
+    if not _usable(data):
+        return data
+    cached = _fundamental_tables.get((function, symbol))
+    if cached is None or cached[0] != data:
+        parse = fundamentals_table.parse_overview if function == "OVERVIEW" else fundamentals_table.parse_statement
+        cached = _fundamental_tables[(function, symbol)] = (data, await asyncio.to_thread(parse, symbol, data))
+    return cached[1]
+
 
 @mcp.tool()
-def earnings_calendar(symbol: Optional[str] = None, horizon: str = "3month"):
+async def compare_fundamentals(
+    symbols: list[str],
+    metrics: list[str],
+    frequency: str = "annual",
+    periods: int = 1,
+    rank_by: Optional[str] = None,
+    ascending: bool = False
+):
+    """
+    Compare fundamentals, ratios and growth rates across many companies in one call, computed from locally stored statements.
+
+    Income statements, balance sheets, cash flows and overviews are stored per company and
+    kept as one numeric table keyed by (symbol, fiscal period, field), so comparing peers
+    does not need a call per company and statement.
+    :param symbols: Ticker symbols (e.g., ['AAPL', 'MSFT', 'GOOGL']).
+    :param metrics: What to compute (e.g., ['totalRevenue', 'gross_margin', 'growth(netIncome)']): statement fields
+        (e.g. 'totalRevenue', 'operatingCashflow'), overview fields (e.g. 'MarketCapitalization', 'PERatio'), arithmetic on
+        them ('grossProfit / totalRevenue'), growth(x) (vs the previous period), yoy(x) (vs a year earlier), or named ratios:
+        gross_margin, operating_margin, net_margin, ebitda_margin, roe, roa, current_ratio, debt_to_equity, free_cash_flow,
+        fcf_margin, revenue_growth, net_income_growth, price_to_sales.
+    :param frequency: 'annual' (default) or 'quarterly' statements.
+    :param periods: Number of most recent fiscal periods per company. Default is 1.
+    :param rank_by: Metric to rank companies by, on their latest period (optional, e.g. 'gross_margin').
+    :param ascending: Rank the smallest value first. Default is False (largest first).
+    :return: JSON with 'fields' (column names), 'rows' (one per company and period, ranked when rank_by is given) and
+        'errors' (symbol -> message for companies with missing data).
+    """
+    frequency = frequency.lower()
+    if frequency not in fundamentals_table.FREQUENCIES:
+        raise ValueError(f"Unsupported frequency '{frequency}'. Valid frequencies: {', '.join(fundamentals_table.FREQUENCIES)}")
+    if periods < 1:
+        raise ValueError("periods must be at least 1")
+    symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+    metrics = list(dict.fromkeys(metric.strip() for metric in metrics))
+    if rank_by and rank_by.strip() not in metrics:
+        metrics.append(rank_by.strip())
+    parsed = {metric: fundamentals_table.parse_metric(metric) for metric in metrics}
+    names = set().union(*(fundamentals_table.fields(tree) for tree in parsed.values()))
+    functions = fundamentals_table.statements(names)
+    pairs = [(function, symbol) for symbol in symbols for function in functions]
+    loaded = await asyncio.gather(*(_fundamentals_table(function, symbol) for function, symbol in pairs), return_exceptions=True)
+    parts, errors, reported = [], {}, set()
+    for (function, symbol), result in zip(pairs, loaded):
+        if isinstance(result, fundamentals_table.FundamentalsTable):
+            parts.append(result)
+            reported.add(function)
+        elif isinstance(result, Exception):
+            errors.setdefault(symbol, f"{function}: {result}")
+        else:
+            notes = [result[key] for key in ("Error Message", "Note", "Information") if key in result] if isinstance(result, dict) else []
+            errors.setdefault(symbol, f"{function}: {notes[0] if notes else 'no data'}")
+
+    table = fundamentals_table.FundamentalsTable.concat(parts)
+    # Only once every function loaded for some company is a field missing from all of them unknown.
+    unknown = fundamentals_table.unknown_fields(names, table) if reported == set(functions) else []
+    if unknown:
+        raise ValueError(f"Unknown field(s) {', '.join(unknown)}: not reported in {', '.join(functions)}")
+    dates, values = table.panel(symbols, frequency, sorted(names), periods + fundamentals_table.LOOKBACK)
+    year = 4 if frequency == "quarterly" else 1
+    results = {metric: fundamentals_table.evaluate(tree, values, year)[:, :periods] for metric, tree in parsed.items()}
+    order = np.arange(len(symbols))
+    if rank_by:
+        latest = results[rank_by.strip()][:, 0]
+        # Companies without a value rank last either way.
+        order = np.argsort(np.where(np.isnan(latest), np.inf, latest if ascending else -latest), kind="stable")
+    rows = []
+    for i in order.tolist():
+        for offset in range(periods):
+            row = [results[metric][i, offset] for metric in metrics]
+            if np.isnat(dates[i, offset]) and all(np.isnan(row)):
+                continue
+            period = None if np.isnat(dates[i, offset]) else str(dates[i, offset])
+            rows.append([symbols[i], period, *(round(float(value), 6) if np.isfinite(value) else None for value in row)])
+    return {"frequency": frequency, "fields": ["symbol", "fiscal_date_ending", *metrics], "rows": rows, "errors": errors}
+
+
+_earnings_calendars: dict[str, tuple[datetime.date, EarningsCalendar]] = {}
+
+
+async def _earnings_calendar(horizon: str):
+    """
+    The parsed calendar for a horizon, downloaded and parsed at most once a day.
+    :return: EarningsCalendar, or the upstream error payload.
+    """
+    today = datetime.datetime.now(EASTERN).date()
+    cached = _earnings_calendars.get(horizon)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+    csv_data = await _make_request({"function": "EARNINGS_CALENDAR", "horizon": horizon, "datatype": "csv"})
+    if isinstance(csv_data, dict):
+        return csv_data
+    calendar = await asyncio.to_thread(parse_earnings_calendar, csv_data)
+    _earnings_calendars[horizon] = (today, calendar)
+    return calendar
+
+
+def _market_cap(symbol: str) -> Optional[float]:
+    stored = _responses.get("OVERVIEW", symbol)
+    try:
+        return float(stored["payload"]["MarketCapitalization"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+@mcp.tool()
+async def earnings_calendar(
+    symbol: Optional[str] = None,
+    horizon: str = "3month",
+    symbols: Optional[list[str]] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    min_market_cap: Optional[float] = None,
+    limit: int = 100,
+    offset: int = 0,
+):
     """
     Earnings Calendar
 
-    This API returns a list of company earnings expected in the next 3, 6, or 12 months.
+    This API returns a list of company earnings expected in the next 3, 6, or 12 months,
+    filtered on the server and returned a page at a time, in report-date order.
     :param symbol: The ticker symbol (optional, e.g., 'IBM'). If not provided, returns all scheduled earnings.
     :param horizon: Time horizon ('3month', '6month', or '12month'). Defaults to '3month'.
-    :return: JSON response with earnings calendar data.
-    """
-    if not API_KEY:
-        raise ValueError("API key for Alpha Vantage is not set.")
-        
-    params = {
-        "function": "EARNINGS_CALENDAR",
-        "horizon": horizon,
-        "datatype": "csv",  # Request CSV format to get the structured data
-        "apikey": API_KEY
-    }
-    if symbol:
-        params["symbol"] = symbol
-    
-    # Make request and handle CSV response
-    response = requests.get(BASE_URL, params=params)
-    response.raise_for_status()
-    
-    # Parse CSV data and convert to JSON
-    csv_data = response.text
-    csv_reader = csv.DictReader(io.StringIO(csv_data))
-    
-    # Convert CSV rows to list of dictionaries
-    earnings_data = []
-    for row in csv_reader:
-        earnings_data.append(dict(row))
-    
+    :param symbols: Only these ticker symbols (optional, e.g., a watchlist ['IBM', 'AAPL']).
+    :param from_date: First report date to include, YYYY-MM-DD (optional).
+    :param to_date: Last report date to include, YYYY-MM-DD (optional).
+    :param min_market_cap: Minimum market capitalization in USD (optional). Only companies whose
+        overview has been fetched before (e.g., with company_overview) are known to qualify.
+    :param limit: Maximum number of entries to return. Defaults to 100.
+    :param offset: Number of matching entries to skip, for paging. Defaults to 0.
+    :return: JSON response with earnings calendar data, the total number of matches and the next page offset.
+    """
+    horizon = horizon.lower()
+    if horizon not in EARNINGS_HORIZONS:
+        return {"Error Message": f"Unsupported horizon '{horizon}'. Valid horizons: {', '.join(EARNINGS_HORIZONS)}"}
+    try:
+        start = np.datetime64(from_date, "D") if from_date else None
+        end = np.datetime64(to_date, "D") if to_date else None
+    except ValueError:
+        return {"Error Message": f"Dates must be YYYY-MM-DD (got from_date={from_date!r}, to_date={to_date!r})"}
+
+    calendar = await _earnings_calendar(horizon)
+    if isinstance(calendar, dict):
+        return calendar
+    wanted = [*(symbols or []), *([symbol] if symbol else [])]
+    rows = calendar.select(start, end, wanted)
+    if min_market_cap is not None:
+        caps = {name: _market_cap(name) for name in set(calendar.symbol[rows])}
+        rows = rows[np.array([(caps[name] or 0) >= min_market_cap for name in calendar.symbol[rows]], dtype=bool)]
+
+    offset, limit = max(offset, 0), max(limit, 0)
+    page = rows[offset:offset + limit]
     return {
-        "earnings_calendar": earnings_data,
-        "total_count": len(earnings_data)
+        "earnings_calendar": [calendar.record(i) for i in page],
+        "total_count": len(rows),
+        "next_offset": offset + len(page) if offset + len(page) < len(rows) else None,
     }
 
 @mcp.tool()
-def ipo_calendar():
+async def ipo_calendar():
     """
     IPO Calendar
 
@@ -414,11 +1578,141 @@ def ipo_calendar():
     params = {
         "function": "IPO_CALENDAR"
     }
-    return _make_request(params)
+    return await _make_request(params)
+
+# Per-symbol corporate actions: event type -> (fundamentals function, event extractor).
+_CORPORATE_ACTIONS = {"dividend": ("DIVIDENDS", dividend_events), "split": ("SPLITS", split_events)}
+# Events per source: (type, symbol) for corporate actions, (type, "*") for market-wide calendars.
+_event_sources: dict[tuple[str, str], list] = {}
+_event_index: Optional[EventIndex] = None
+_events_built_at = 0.0
+_events_refreshing: Optional[asyncio.Task] = None
+
+
+async def _market_events() -> None:
+    earnings, ipos = await asyncio.gather(
+        _earnings_calendar("12month"), _make_request({"function": "IPO_CALENDAR"}), return_exceptions=True
+    )
+    # A failed source keeps the events of its last successful load.
+    if isinstance(earnings, EarningsCalendar):
+        _event_sources[("earnings", "*")] = list(earnings_events(earnings))
+    else:
+        logger.warning("Earnings calendar refresh failed: %s", earnings)
+    if isinstance(ipos, str):
+        _event_sources[("ipo", "*")] = list(ipo_events(ipos))
+    else:
+        logger.warning("IPO calendar refresh failed: %s", ipos)
+
+
+async def _symbol_events(kind: str, symbol: str) -> None:
+    function, extract = _CORPORATE_ACTIONS[kind]
+    try:
+        data = await _fundamentals(function, symbol)
+    except Exception as e:
+        logger.warning("Loading %s for %s failed: %s", function, symbol, e)
+        return
+    _event_sources[(kind, symbol)] = list(extract(symbol, data)) if _usable(data) else []
+
+
+async def _rebuild_events() -> None:
+    global _event_index
+    _event_index = await asyncio.to_thread(EventIndex.build, itertools.chain.from_iterable(list(_event_sources.values())))
+
+
+async def _refresh_events() -> None:
+    """
+    Reload the market-wide calendars and every known symbol's corporate actions, then rebuild the index.
+    Corporate actions come from the response store, which revalidates them on its own schedule.
+    """
+    global _events_built_at
+    known = {(kind, symbol) for kind, (function, _) in _CORPORATE_ACTIONS.items() for symbol in _responses.symbols(function)}
+    known |= {key for key in _event_sources if key[1] != "*"}
+    await asyncio.gather(_market_events(), *(_symbol_events(kind, symbol) for kind, symbol in known))
+    await _rebuild_events()
+    _events_built_at = time.time()
+
+
+def _reload_events() -> asyncio.Task:
+    global _events_refreshing
+    if _events_refreshing is None or _events_refreshing.done() or _events_refreshing.get_loop() is not asyncio.get_running_loop():
+        _events_refreshing = asyncio.ensure_future(_refresh_events())
+        _events_refreshing.add_done_callback(_events_refreshed)
+    return _events_refreshing
+
+
+def _events_refreshed(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Corporate event refresh failed: %s", task.exception())
+
+
+@mcp.tool()
+async def corporate_events(
+    symbols: Optional[list[str]] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    types: Optional[list[str]] = None,
+    limit: int = 100,
+    offset: int = 0,
+):
+    """
+    Corporate Event Calendar
+
+    Earnings reports, IPOs, dividends (by ex-dividend date) and splits in one date-ordered list,
+    answered from a local index that is refreshed in the background.
+    :param symbols: Only these ticker symbols (optional, e.g., ['IBM', 'AAPL']). Dividends and splits are
+        only indexed for symbols that have been asked about before.
+    :param from_date: First event date to include, YYYY-MM-DD. Defaults to today.
+    :param to_date: Last event date to include, YYYY-MM-DD (optional).
+    :param types: Event types to include ('earnings', 'ipo', 'dividend', 'split'). Defaults to all.
+    :param limit: Maximum number of events to return. Defaults to 100.
+    :param offset: Number of matching events to skip, for paging. Defaults to 0.
+    :return: JSON response with the events, the total number of matches and the next page offset.
+    """
+    types = [kind.lower() for kind in types] if types else list(EVENT_TYPES)
+    unknown = [kind for kind in types if kind not in EVENT_TYPES]
+    if unknown:
+        return {"Error Message": f"Unknown event type '{unknown[0]}'. Valid types: {', '.join(EVENT_TYPES)}"}
+    try:
+        start = np.datetime64(from_date, "D") if from_date else np.datetime64(datetime.datetime.now(EASTERN).date(), "D")
+        end = np.datetime64(to_date, "D") if to_date else None
+    except ValueError:
+        return {"Error Message": f"Dates must be YYYY-MM-DD (got from_date={from_date!r}, to_date={to_date!r})"}
+
+    if _event_index is None:
+        await asyncio.shield(_reload_events())
+    elif time.time() - _events_built_at > EVENTS_MAX_AGE:
+        _reload_events()
+    symbols = [symbol.upper() for symbol in symbols or []]
+    missing = [(kind, symbol) for symbol in symbols for kind in _CORPORATE_ACTIONS if kind in types and (kind, symbol) not in _event_sources]
+    if missing:
+        # First question about these symbols: load their corporate actions once, later refreshes keep them current.
+        await asyncio.gather(*(_symbol_events(kind, symbol) for kind, symbol in missing))
+        await _rebuild_events()
+
+    rows = _event_index.select(start, end, symbols, types)
+    offset, limit = max(offset, 0), max(limit, 0)
+    page = rows[offset:offset + limit]
+    return {
+        "events": [_event_index.record(i) for i in page],
+        "total_count": len(rows),
+        "next_offset": offset + len(page) if offset + len(page) < len(rows) else None,
+    }
 
 # Technical Indicators - Moving Averages
 @mcp.tool()
-def sma(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def sma(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Simple Moving Average (SMA)
     
@@ -428,21 +1722,30 @@ def sma(symbol: str, interval: str, time_period: int, series_type: str, month: O
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['SMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "SMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("SMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def ema(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def ema(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Exponential Moving Average (EMA)
     
@@ -452,21 +1755,30 @@ def ema(symbol: str, interval: str, time_period: int, series_type: str, month: O
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['EMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "EMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("EMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def wma(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def wma(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Weighted Moving Average (WMA)
     
@@ -476,21 +1788,30 @@ def wma(symbol: str, interval: str, time_period: int, series_type: str, month: O
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['WMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "WMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("WMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def dema(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def dema(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Double Exponential Moving Average (DEMA)
     
@@ -500,21 +1821,30 @@ def dema(symbol: str, interval: str, time_period: int, series_type: str, month:
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :return: JSON response.
-    """
-    params = {
-        "function": "DEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['DEMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
+    :return: JSON response.
+    """
+    return await _technical_indicator("DEMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def tema(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def tema(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Triple Exponential Moving Average (TEMA)
     
@@ -524,21 +1854,30 @@ def tema(symbol: str, interval: str, time_period: int, series_type: str, month:
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['TEMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "TEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("TEMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def trima(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def trima(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Triangular Moving Average (TRIMA)
     
@@ -548,21 +1887,30 @@ def trima(symbol: str, interval: str, time_period: int, series_type: str, month:
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['TRIMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "TRIMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("TRIMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def kama(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def kama(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Kaufman Adaptive Moving Average (KAMA)
     
@@ -572,21 +1920,31 @@ def kama(symbol: str, interval: str, time_period: int, series_type: str, month:
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['KAMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "KAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("KAMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def mama(symbol: str, interval: str, series_type: str, fastlimit: float = 0.01, slowlimit: float = 0.01, month: Optional[str] = None):
+async def mama(
+    symbol: str,
+    interval: str,
+    series_type: str,
+    fastlimit: float = 0.01,
+    slowlimit: float = 0.01,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     MESA Adaptive Moving Average (MAMA)
     
@@ -597,22 +1955,31 @@ def mama(symbol: str, interval: str, series_type: str, fastlimit: float = 0.01,
     :param month: Optional month in YYYY-MM format for intraday intervals.
     :param fastlimit: Fast limit parameter. Default is 0.01.
     :param slowlimit: Slow limit parameter. Default is 0.01.
+    :param datatype: 'json' (default) or 'columnar' (a dates array plus one numeric array per output).
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['MAMA', 'FAMA'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "MAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastlimit": fastlimit,
-        "slowlimit": slowlimit
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _upstream_indicator(
+        "MAMA", symbol, interval, month, datatype, {"series_type": series_type, "fastlimit": fastlimit, "slowlimit": slowlimit},
+        SeriesView(start, end, fields, max_points, order),
+    )
 
 @mcp.tool()
-def vwap(symbol: str, interval: str, month: Optional[str] = None):
+async def vwap(
+    symbol: str,
+    interval: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Volume Weighted Average Price (VWAP) - Premium
 
@@ -620,19 +1987,30 @@ def vwap(symbol: str, interval: str, month: Optional[str] = None):
     :param symbol: The ticker symbol (e.g., 'IBM').
     :param interval: Intraday interval ('1min', '5min', '15min', '30min', '60min').
     :param month: Optional month in YYYY-MM format for specific month.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['VWAP']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "VWAP",
-        "symbol": symbol,
-        "interval": interval
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _vwap(symbol, interval, month, datatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def t3(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def t3(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Triple Exponential Moving Average (T3)
 
@@ -642,22 +2020,33 @@ def t3(symbol: str, interval: str, time_period: int, series_type: str, month: Op
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['T3']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "T3",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("T3", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 # Technical Indicators - Momentum & Oscillators
 @mcp.tool()
-def macd(symbol: str, interval: str, series_type: str, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9, month: Optional[str] = None):
+async def macd(
+    symbol: str,
+    interval: str,
+    series_type: str,
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    signalperiod: int = 9,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Moving Average Convergence / Divergence (MACD)
     
@@ -669,23 +2058,35 @@ def macd(symbol: str, interval: str, series_type: str, fastperiod: int = 12, slo
     :param slowperiod: Slow period (default 26).
     :param signalperiod: Signal period (default 9).
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['MACD', 'MACD_Signal', 'MACD_Hist'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "MACD",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("MACD", symbol, interval, month, datatype, series_type=series_type, fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def macdext(symbol: str, interval: str, series_type: str, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9, fastmatype: int = 0, slowmatype: int = 0, signalmatype: int = 0, month: Optional[str] = None):
+async def macdext(
+    symbol: str,
+    interval: str,
+    series_type: str,
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    signalperiod: int = 9,
+    fastmatype: int = 0,
+    slowmatype: int = 0,
+    signalmatype: int = 0,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     MACD with Controllable MA Type (MACDEXT)
 
@@ -700,26 +2101,33 @@ def macdext(symbol: str, interval: str, series_type: str, fastperiod: int = 12,
     :param fastmatype: Fast MA type (0=SMA, 1=EMA, 2=WMA, 3=DEMA, 4=TEMA, 5=TRIMA, 6=KAMA, 7=MAMA, 8=T3). Default is 0.
     :param slowmatype: Slow MA type. Default is 0.
     :param signalmatype: Signal MA type. Default is 0.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['MACD', 'MACD_Signal', 'MACD_Hist'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "MACDEXT",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "fastmatype": fastmatype,
-        "slowmatype": slowmatype,
-        "signalmatype": signalmatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("MACDEXT", symbol, interval, month, datatype, series_type=series_type, fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod, fastmatype=fastmatype, slowmatype=slowmatype, signalmatype=signalmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def stoch(symbol: str, interval: str, month: Optional[str] = None, fastkperiod: int = 5, slowkperiod: int = 3, slowdperiod: int = 3, slowkmatype: int = 0, slowdmatype: int = 0):
+async def stoch(
+    symbol: str,
+    interval: str,
+    month: Optional[str] = None,
+    fastkperiod: int = 5,
+    slowkperiod: int = 3,
+    slowdperiod: int = 3,
+    slowkmatype: int = 0,
+    slowdmatype: int = 0,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Stochastic Oscillator (STOCH)
 
@@ -732,24 +2140,31 @@ def stoch(symbol: str, interval: str, month: Optional[str] = None, fastkperiod:
     :param slowdperiod: Slow D period. Default is 3.
     :param slowkmatype: Slow K MA type (0=SMA, 1=EMA, 2=WMA, etc.). Default is 0.
     :param slowdmatype: Slow D MA type. Default is 0.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['SlowK', 'SlowD'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "STOCH",
-        "symbol": symbol,
-        "interval": interval,
-        "fastkperiod": fastkperiod,
-        "slowkperiod": slowkperiod,
-        "slowdperiod": slowdperiod,
-        "slowkmatype": slowkmatype,
-        "slowdmatype": slowdmatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("STOCH", symbol, interval, month, datatype, fastkperiod=fastkperiod, slowkperiod=slowkperiod, slowdperiod=slowdperiod, slowkmatype=slowkmatype, slowdmatype=slowdmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def stochf(symbol: str, interval: str, month: Optional[str] = None, fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0):
+async def stochf(
+    symbol: str,
+    interval: str,
+    month: Optional[str] = None,
+    fastkperiod: int = 5,
+    fastdperiod: int = 3,
+    fastdmatype: int = 0,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Stochastic Fast (STOCHF)
 
@@ -760,22 +2175,30 @@ def stochf(symbol: str, interval: str, month: Optional[str] = None, fastkperiod:
     :param fastkperiod: Fast K period. Default is 5.
     :param fastdperiod: Fast D period. Default is 3.
     :param fastdmatype: Fast D MA type (0=SMA, 1=EMA, 2=WMA, etc.). Default is 0.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['FastK', 'FastD'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "STOCHF",
-        "symbol": symbol,
-        "interval": interval,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "fastdmatype": fastdmatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("STOCHF", symbol, interval, month, datatype, fastkperiod=fastkperiod, fastdperiod=fastdperiod, fastdmatype=fastdmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def rsi(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None):
+async def rsi(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Relative Strength Index (RSI)
     
@@ -785,21 +2208,33 @@ def rsi(symbol: str, interval: str, time_period: int, series_type: str, month: O
     :param time_period: Number of data points used to calculate each RSI value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['RSI']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "RSI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("RSI", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def stochrsi(symbol: str, interval: str, time_period: int, series_type: str, month: Optional[str] = None, fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0):
+async def stochrsi(
+    symbol: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    month: Optional[str] = None,
+    fastkperiod: int = 5,
+    fastdperiod: int = 3,
+    fastdmatype: int = 0,
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
+):
     """
     Stochastic Relative Strength Index (STOCHRSI)
 
@@ -812,30 +2247,29 @@ def stochrsi(symbol: str, interval: str, time_period: int, series_type: str, mon
     :param fastkperiod: Fast K period. Default is 5.
     :param fastdperiod: Fast D period. Default is 3.
     :param fastdmatype: Fast D MA type (0=SMA, 1=EMA, 2=WMA, etc.). Default is 0.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['FastK', 'FastD'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "STOCHRSI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "fastdmatype": fastdmatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("STOCHRSI", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, fastkperiod=fastkperiod, fastdperiod=fastdperiod, fastdmatype=fastdmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_sma(
+async def get_sma(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Simple Moving Average (SMA)
@@ -846,29 +2280,29 @@ def get_sma(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['SMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "SMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("SMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ema(
+async def get_ema(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Exponential Moving Average (EMA)
@@ -879,29 +2313,29 @@ def get_ema(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['EMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "EMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("EMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_wma(
+async def get_wma(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Weighted Moving Average (WMA)
@@ -912,29 +2346,29 @@ def get_wma(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['WMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "WMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("WMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_dema(
+async def get_dema(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Double Exponential Moving Average (DEMA)
@@ -945,29 +2379,29 @@ def get_dema(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['DEMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "DEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("DEMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_tema(
+async def get_tema(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Triple Exponential Moving Average (TEMA)
@@ -978,29 +2412,29 @@ def get_tema(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['TEMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "TEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("TEMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_trima(
+async def get_trima(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Triangular Moving Average (TRIMA)
@@ -1011,29 +2445,29 @@ def get_trima(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['TRIMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "TRIMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("TRIMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_kama(
+async def get_kama(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Kaufman Adaptive Moving Average (KAMA)
@@ -1044,30 +2478,30 @@ def get_kama(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['KAMA']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "KAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("KAMA", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_mama(
+async def get_mama(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
     fastlimit: float = 0.01,
     slowlimit: float = 0.01,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     MESA Adaptive Moving Average (MAMA)
@@ -1079,28 +2513,30 @@ def get_mama(
     :param month: Optional month in YYYY-MM format for intraday intervals.
     :param fastlimit: Fast limit parameter. Default is 0.01.
     :param slowlimit: Slow limit parameter. Default is 0.01.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['MAMA', 'FAMA'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "MAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastlimit": fastlimit,
-        "slowlimit": slowlimit,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _upstream_indicator(
+        "MAMA", symbol, interval, month, datatype, {"series_type": series_type, "fastlimit": fastlimit, "slowlimit": slowlimit},
+        SeriesView(start, end, fields, max_points, order),
+    )
 
 @mcp.tool()
-def get_vwap(
+async def get_vwap(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Volume Weighted Average Price (VWAP) - Premium
@@ -1109,27 +2545,29 @@ def get_vwap(
     :param symbol: The ticker symbol (e.g., 'IBM').
     :param interval: Intraday interval ('1min', '5min', '15min', '30min', '60min').
     :param month: Optional month in YYYY-MM format for specific month.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['VWAP']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "VWAP",
-        "symbol": symbol,
-        "interval": interval,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _vwap(symbol, interval, month, datatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_t3(
+async def get_t3(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Triple Exponential Moving Average (T3)
@@ -1140,24 +2578,19 @@ def get_t3(
     :param time_period: Number of data points used to calculate each moving average value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['T3']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "T3",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("T3", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 # Technical Indicators - Momentum & Oscillators
 @mcp.tool()
-def get_macd(
+async def get_macd(
     symbol: str,
     interval: str,
     series_type: str,
@@ -1165,7 +2598,12 @@ def get_macd(
     fastperiod: int = 12,
     slowperiod: int = 26,
     signalperiod: int = 9,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Moving Average Convergence / Divergence (MACD)
@@ -1178,25 +2616,18 @@ def get_macd(
     :param slowperiod: Slow period (default 26).
     :param signalperiod: Signal period (default 9).
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['MACD', 'MACD_Signal', 'MACD_Hist'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "MACD",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("MACD", symbol, interval, month, datatype, series_type=series_type, fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_macdext(
+async def get_macdext(
     symbol: str,
     interval: str,
     series_type: str,
@@ -1207,7 +2638,12 @@ def get_macdext(
     fastmatype: int = 0,
     slowmatype: int = 0,
     signalmatype: int = 0,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     MACD with Controllable MA Type (MACDEXT)
@@ -1223,28 +2659,18 @@ def get_macdext(
     :param fastmatype: Fast MA type (0=SMA, 1=EMA, 2=WMA, 3=DEMA, 4=TEMA, 5=TRIMA, 6=KAMA, 7=MAMA, 8=T3). Default is 0.
     :param slowmatype: Slow MA type. Default is 0.
     :param signalmatype: Signal MA type. Default is 0.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['MACD', 'MACD_Signal', 'MACD_Hist'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "MACDEXT",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "fastmatype": fastmatype,
-        "slowmatype": slowmatype,
-        "signalmatype": signalmatype,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("MACDEXT", symbol, interval, month, datatype, series_type=series_type, fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod, fastmatype=fastmatype, slowmatype=slowmatype, signalmatype=signalmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_stoch(
+async def get_stoch(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
@@ -1253,7 +2679,12 @@ def get_stoch(
     slowdperiod: int = 3,
     slowkmatype: int = 0,
     slowdmatype: int = 0,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Stochastic Oscillator (STOCH)
@@ -1267,33 +2698,30 @@ def get_stoch(
     :param slowdperiod: Slow D period. Default is 3.
     :param slowkmatype: Slow K MA type (0=SMA, 1=EMA, 2=WMA, etc.). Default is 0.
     :param slowdmatype: Slow D MA type. Default is 0.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['SlowK', 'SlowD'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "STOCH",
-        "symbol": symbol,
-        "interval": interval,
-        "fastkperiod": fastkperiod,
-        "slowkperiod": slowkperiod,
-        "slowdperiod": slowdperiod,
-        "slowkmatype": slowkmatype,
-        "slowdmatype": slowdmatype,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("STOCH", symbol, interval, month, datatype, fastkperiod=fastkperiod, slowkperiod=slowkperiod, slowdperiod=slowdperiod, slowkmatype=slowkmatype, slowdmatype=slowdmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_stochf(
+async def get_stochf(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
     fastkperiod: int = 5,
     fastdperiod: int = 3,
     fastdmatype: int = 0,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Stochastic Fast (STOCHF)
@@ -1305,30 +2733,29 @@ def get_stochf(
     :param fastkperiod: Fast K period. Default is 5.
     :param fastdperiod: Fast D period. Default is 3.
     :param fastdmatype: Fast D MA type (0=SMA, 1=EMA, 2=WMA, etc.). Default is 0.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['FastK', 'FastD'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "STOCHF",
-        "symbol": symbol,
-        "interval": interval,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "fastdmatype": fastdmatype,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("STOCHF", symbol, interval, month, datatype, fastkperiod=fastkperiod, fastdperiod=fastdperiod, fastdmatype=fastdmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_rsi(
+async def get_rsi(
     symbol: str,
     interval: str,
     time_period: int,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Relative Strength Index (RSI)
@@ -1339,23 +2766,18 @@ def get_rsi(
     :param time_period: Number of data points used to calculate each RSI value.
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['RSI']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "RSI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("RSI", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_stochrsi(
+async def get_stochrsi(
     symbol: str,
     interval: str,
     time_period: int,
@@ -1364,7 +2786,12 @@ def get_stochrsi(
     fastkperiod: int = 5,
     fastdperiod: int = 3,
     fastdmatype: int = 0,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Stochastic Relative Strength Index (STOCHRSI)
@@ -1378,30 +2805,27 @@ def get_stochrsi(
     :param fastkperiod: Fast K period. Default is 5.
     :param fastdperiod: Fast D period. Default is 3.
     :param fastdmatype: Fast D MA type (0=SMA, 1=EMA, 2=WMA, etc.). Default is 0.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['FastK', 'FastD'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "STOCHRSI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "fastdmatype": fastdmatype,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("STOCHRSI", symbol, interval, month, datatype, series_type=series_type, time_period=time_period, fastkperiod=fastkperiod, fastdperiod=fastdperiod, fastdmatype=fastdmatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_trange(
+async def get_trange(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     True Range (TRANGE)
@@ -1410,26 +2834,28 @@ def get_trange(
     :param symbol: The ticker symbol (e.g., 'IBM').
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['TRANGE']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "TRANGE",
-        "symbol": symbol,
-        "interval": interval,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("TRANGE", symbol, interval, month, datatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_atr(
+async def get_atr(
     symbol: str,
     interval: str,
     time_period: int,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Average True Range (ATR)
@@ -1439,27 +2865,28 @@ def get_atr(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param time_period: Number of data points used to calculate each ATR value.
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['ATR']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "ATR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("ATR", symbol, interval, month, datatype, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_natr(
+async def get_natr(
     symbol: str,
     interval: str,
     time_period: int,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Normalized Average True Range (NATR)
@@ -1469,26 +2896,27 @@ def get_natr(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param time_period: Number of data points used to calculate each NATR value.
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['NATR']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "NATR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("NATR", symbol, interval, month, datatype, time_period=time_period, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ad(
+async def get_ad(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Chaikin A/D Line (AD)
@@ -1497,27 +2925,29 @@ def get_ad(
     :param symbol: The ticker symbol (e.g., 'IBM').
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['Chaikin A/D']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "AD",
-        "symbol": symbol,
-        "interval": interval,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("AD", symbol, interval, month, datatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_adosc(
+async def get_adosc(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
     fastperiod: int = 3,
     slowperiod: int = 10,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Chaikin A/D Oscillator (ADOSC)
@@ -1528,27 +2958,27 @@ def get_adosc(
     :param month: Optional month in YYYY-MM format for intraday intervals.
     :param fastperiod: Fast period parameter. Default is 3.
     :param slowperiod: Slow period parameter. Default is 10.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['ADOSC']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "ADOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("ADOSC", symbol, interval, month, datatype, fastperiod=fastperiod, slowperiod=slowperiod, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_obv(
+async def get_obv(
     symbol: str,
     interval: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     On Balance Volume (OBV)
@@ -1557,26 +2987,28 @@ def get_obv(
     :param symbol: The ticker symbol (e.g., 'IBM').
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['OBV']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "OBV",
-        "symbol": symbol,
-        "interval": interval,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("OBV", symbol, interval, month, datatype, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ht_trendline(
+async def get_ht_trendline(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Hilbert Transform - Instantaneous Trendline (HT_TRENDLINE)
@@ -1586,27 +3018,28 @@ def get_ht_trendline(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['HT_TRENDLINE']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "HT_TRENDLINE",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("HT_TRENDLINE", symbol, interval, month, datatype, series_type=series_type, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ht_sine(
+async def get_ht_sine(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Hilbert Transform - SineWave (HT_SINE)
@@ -1616,27 +3049,28 @@ def get_ht_sine(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['SINE', 'LEAD SINE'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "HT_SINE",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("HT_SINE", symbol, interval, month, datatype, series_type=series_type, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ht_trendmode(
+async def get_ht_trendmode(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Hilbert Transform - Trend vs Cycle Mode (HT_TRENDMODE)
@@ -1646,27 +3080,28 @@ def get_ht_trendmode(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['TRENDMODE']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "HT_TRENDMODE",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("HT_TRENDMODE", symbol, interval, month, datatype, series_type=series_type, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ht_dcperiod(
+async def get_ht_dcperiod(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Hilbert Transform - Dominant Cycle Period (HT_DCPERIOD)
@@ -1676,27 +3111,28 @@ def get_ht_dcperiod(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['DCPERIOD']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "HT_DCPERIOD",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("HT_DCPERIOD", symbol, interval, month, datatype, series_type=series_type, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ht_dcphase(
+async def get_ht_dcphase(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Hilbert Transform - Dominant Cycle Phase (HT_DCPHASE)
@@ -1706,27 +3142,28 @@ def get_ht_dcphase(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep (optional, e.g. ['HT_DCPHASE']).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "HT_DCPHASE",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "datatype": datatype
-    }
-    if month:
-        params["month"] = month
-    return _make_request(params)
+    return await _technical_indicator("HT_DCPHASE", symbol, interval, month, datatype, series_type=series_type, view=SeriesView(start, end, fields, max_points, order))
 
 @mcp.tool()
-def get_ht_phasor(
+async def get_ht_phasor(
     symbol: str,
     interval: str,
     series_type: str,
     month: Optional[str] = None,
-    datatype: str = "json"
+    datatype: str = "json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    max_points: Optional[int] = None,
+    order: str = "desc",
 ):
     """
     Hilbert Transform - Phasor Components (HT_PHASOR)
@@ -1736,17 +3173,116 @@ def get_ht_phasor(
     :param interval: Time interval ('1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly').
     :param series_type: The desired price type ('close', 'open', 'high', 'low').
     :param month: Optional month in YYYY-MM format for intraday intervals.
-    :param datatype: Output format ('json' or 'csv'). Default is 'json'.
+    :param datatype: Output format: 'json', 'csv', or 'columnar' (a dates array plus one numeric array per output). Default is 'json'.
+    :param start: First date or timestamp to return (optional, e.g. '2025-10-01'; '2025-10' for a whole month).
+    :param end: Last date or timestamp to return (optional, same formats).
+    :param fields: Output values to keep, any of ['PHASE', 'QUADRATURE'] (optional).
+    :param max_points: Downsample to at most this many points, keeping peaks and troughs (optional).
+    :param order: 'desc' (newest first, default) or 'asc'.
     :return: JSON response.
     """
-    params = {
-        "function": "HT_PHASOR",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "datatype": datatype
+    return await _technical_indicator("HT_PHASOR", symbol, interval, month, datatype, series_type=series_type, view=SeriesView(start, end, fields, max_points, order))
+
+
+@mcp.tool()
+async def get_technical_indicators_batch(symbols: list[str], indicators: list[dict], points: int = 1, datatype: str = "json"):
+    """
+    Compute several technical indicators for several symbols in one call.
+
+    Each symbol's price series is loaded once per interval and shared by every indicator
+    computed on it, and symbols are loaded concurrently, so screening a watchlist costs
+    one call instead of one per pair.
+    :param symbols: Ticker symbols (e.g., ['IBM', 'MSFT']).
+    :param indicators: Indicator specs, each a dict with 'name' (e.g. 'RSI', 'MACD', 'HT_SINE'),
+        optional 'interval' (default 'daily'), 'period' (the time period), 'series_type'
+        (default 'close') and 'month', plus any other Alpha Vantage parameter of that
+        indicator (e.g. 'fastperiod'). Example: [{'name': 'RSI', 'period': 14}, {'name': 'MACD'}].
+    :param points: Number of most recent values to return per indicator (0 for the full history). Default is 1.
+    :param datatype: 'json' (default, dates mapped to values) or 'columnar' (per indicator, a dates array plus
+        one numeric array per output, newest first).
+    :return: JSON keyed by symbol, then by indicator label (e.g. 'RSI(14, close) daily'), holding the values.
+        Invalid specs, and symbols whose data could not be loaded, get an "Error Message" instead.
+    """
+    if datatype not in ("json", "columnar"):
+        raise ValueError(f"Unsupported datatype '{datatype}'. Valid datatypes: json, columnar")
+    specs = [_batch_spec(spec) for spec in indicators]
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    results = await asyncio.gather(*(_batch_symbol(symbol, specs, points, datatype) for symbol in symbols), return_exceptions=True)
+    return {
+        symbol: {"Error Message": str(result) or type(result).__name__} if isinstance(result, Exception) else result
+        for symbol, result in zip(symbols, results)
     }
-    if month:
-        params["month"] = month
-    return _make_request(params)
 
+
+async def _batch_symbol(symbol: str, specs: list[dict], points: int, datatype: str = "json") -> dict:
+    """
+    Compute every batch spec for one symbol, loading each interval's bars once.
+    """
+    loaded, results = {}, {}
+    for spec in specs:
+        if "Error Message" in spec:
+            results[spec["label"]] = {"Error Message": spec["Error Message"]}
+            continue
+        try:
+            if _needs_upstream(spec["params"]):
+                payload = await _upstream_indicator(spec["name"], symbol, spec["interval"], spec["month"], datatype, spec["params"])
+            else:
+                key = (spec["interval"], spec["month"])
+                if key not in loaded:
+                    loaded[key] = await _bars(symbol, *key)
+                bars = loaded[key]
+                if not isinstance(bars, Bars):
+                    results[spec["label"]] = bars
+                    continue
+                payload = await _indicator_from_bars(spec["name"], symbol, spec["interval"], bars, spec["month"], datatype, **spec["params"])
+        except ValueError as e:
+            results[spec["label"]] = {"Error Message": str(e)}
+            continue
+        if "columns" in payload:
+            end = points if points > 0 else None
+            results[spec["label"]] = {"dates": payload["dates"][:end], "columns": {name: values[:end] for name, values in payload["columns"].items()}}
+            continue
+        series = next((value for name, value in payload.items() if name.startswith("Technical Analysis")), payload)
+        results[spec["label"]] = dict(list(series.items())[:points]) if points > 0 else series
+    return results
+
+
+def _batch_spec(spec: dict) -> dict:
+    """
+    Normalize one indicator spec of get_technical_indicators_batch.
+    :return: Dict with the result label and either the call arguments or an "Error Message".
+    """
+    if not isinstance(spec, dict):
+        return {"label": str(spec), "Error Message": "An indicator spec must be a dict with a 'name', e.g. {'name': 'RSI', 'period': 14}"}
+    name = str(spec.get("name") or spec.get("function") or "").upper()
+    interval = str(spec.get("interval") or "daily").lower()
+    params = {"time_period": spec["period"]} if "period" in spec else {}
+    params.update((key, value) for key, value in spec.items() if key not in ("name", "function", "interval", "month", "period"))
+    if name not in _INDICATORS:
+        return {"label": f"{name} {interval}", "Error Message": f"Unknown indicator '{name}'. Valid indicators: {', '.join(_INDICATORS)}"}
+    if interval not in ("daily", "weekly", "monthly", *INTRADAY_INTERVALS):
+        return {"label": f"{name} {interval}", "Error Message": f"Unsupported interval '{interval}'"}
+    accepted = inspect.signature(_INDICATORS[name][1]).parameters
+    # OBV and the other volume indicators have no series type.
+    if "series_type" in accepted:
+        params.setdefault("series_type", "close")
+    label = f"{name}({', '.join(str(value) for value in params.values())}) {interval}" if params else f"{name} {interval}"
+    unknown = [key for key in params if key not in accepted]
+    if unknown:
+        return {"label": label, "Error Message": f"{name} does not take {', '.join(unknown)}"}
+    missing = [key for key, param in accepted.items() if key != "bars" and param.default is param.empty and key not in params]
+    if missing:
+        return {"label": label, "Error Message": f"{name} requires {', '.join('period' if key == 'time_period' else key for key in missing)}"}
+    return {"label": label, "name": name, "interval": interval, "month": spec.get("month"), "params": params}
+
+
+@mcp.tool()
+async def get_cache_stats():
+    """
+    Alpha Vantage response cache statistics.
+
+    Responses are cached per function (quotes for seconds, daily data until the next
+    market close, fundamentals for days).
+    :return: JSON with hits, misses and hit rate overall and per function, plus size, evictions and expirations.
+    """
+    return alphavantage.cache.stats()
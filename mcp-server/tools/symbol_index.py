@@ -0,0 +1,223 @@
+import asyncio
+import csv
+import datetime
+import io
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Optional
+
+import numpy as np
+
+from . import alphavantage
+from .market_calendar import EASTERN, MARKET_CLOSE, MARKET_OPEN
+from .ohlcv_store import DATA_DIR
+
+# How long the downloaded listing is used before it is refreshed in the background.
+LISTING_MAX_AGE = int(os.getenv("LISTING_MAX_AGE", "86400"))
+# Matches scoring below this are not returned.
+MIN_MATCH_SCORE = 0.35
+# Fuzzy (trigram) matches score at most this, so they rank below most prefix matches.
+FUZZY_WEIGHT = 0.6
+MAX_MATCHES = 10
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+# Trailing words that do not tell companies apart ("Apple Inc", "Microsoft Corporation").
+_NAME_SUFFIXES = frozenset("inc incorporated corp corporation co company ltd limited plc llc lp sa nv ag se".split())
+
+
+def _core_name(name: str) -> str:
+    """
+    A normalized company name without its share class and legal-form suffixes.
+    """
+    words = _normalize(name).split(" class ")[0].split()
+    while len(words) > 1 and words[-1] in _NAME_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SymbolIndex:
+    """
+    Search index over the symbols and company names of a listing.
+
+    Prefix lookups binary-search a sorted array of keys (each symbol, and every
+    word-suffix of each name, so "bank" finds "Bank of America" and "america"
+    finds it too). Fuzzy lookups count, for every listing at once, how many of the
+    query's trigrams its symbol and name contain, from per-trigram posting arrays.
+    """
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        keys = []
+        postings = defaultdict(list)
+        for i, row in enumerate(rows):
+            symbol, name = row["symbol"].lower(), _normalize(row["name"])
+            keys.append((symbol, i))
+            words = name.split()
+            keys.extend((" ".join(words[start:]), i) for start in range(len(words)))
+            for gram in _trigrams(name) | _trigrams(symbol):
+                postings[gram].append(i)
+        keys.sort()
+        self._keys = [key for key, _ in keys]
+        self._key_rows = np.array([i for _, i in keys], dtype=np.int64)
+        self._postings = {gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()}
+        self._exact = {row["symbol"].lower() for row in rows} | {_core_name(row["name"]) for row in rows}
+
+    def resolves(self, keywords: str) -> bool:
+        """
+        Whether the keywords name a listing exactly: its symbol, or its company name
+        without legal-form suffixes ('microsoft' for 'Microsoft Corporation').
+        """
+        query = _normalize(keywords)
+        return query in self._exact or _core_name(query) in self._exact
+
+    def search(self, keywords: str, limit: int = MAX_MATCHES) -> list[tuple[dict, float]]:
+        """
+        Best matches for a keyword string.
+        :return: (row, score) pairs, best first, with scores between 0 and 1.
+        """
+        query = _normalize(keywords)
+        if not query:
+            return []
+        scores = np.zeros(len(self.rows))
+
+        lo = bisect_left(self._keys, query)
+        hi = bisect_left(self._keys, query + "\x7f")
+        for key, row in zip(self._keys[lo:hi], self._key_rows[lo:hi].tolist()):
+            # An exact symbol scores 1; longer keys score lower the less of them the query covers.
+            scores[row] = max(scores[row], 1.0 if key == query else 0.5 + 0.5 * len(query) / len(key))
+
+        grams = _trigrams(query)
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if hits:
+            shared = np.bincount(np.concatenate(hits), minlength=len(self.rows))
+            np.maximum(scores, FUZZY_WEIGHT * shared / len(grams), out=scores)
+
+        best = np.flatnonzero(scores >= MIN_MATCH_SCORE)
+        best = best[np.lexsort((np.array([len(self.rows[i]["symbol"]) for i in best]), -scores[best]))][:limit]
+        return [(self.rows[i], float(scores[i])) for i in best]
+
+
+def _parse_listing(text: str) -> list[dict]:
+    return [row for row in csv.DictReader(io.StringIO(text)) if row.get("symbol") and row.get("name")]
+
+
+class ListingSearch:
+    """
+    Symbol search over the Alpha Vantage LISTING_STATUS file.
+
+    The listing only covers US exchanges, so it answers on its own only when the
+    keywords name a listing exactly; otherwise its matches are merged with those of
+    SYMBOL_SEARCH, which also knows the home-exchange listings of foreign companies.
+    The listing is kept on disk so a restarted server can answer at once; it is
+    re-downloaded in the background when older than `max_age`.
+    """
+
+    def __init__(self, path: str, max_age: float):
+        self.path = path
+        self.max_age = max_age
+        self.index: Optional[SymbolIndex] = None
+        self.loaded_at = 0.0
+        self._loading: Optional[asyncio.Task] = None
+
+    async def _load(self) -> None:
+        if self.index is None and os.path.exists(self.path):
+            with open(self.path) as f:
+                text = f.read()
+            loaded_at = os.path.getmtime(self.path)
+        else:
+            text = await alphavantage.query({"function": "LISTING_STATUS"})
+            if not isinstance(text, str):
+                raise RuntimeError(f"LISTING_STATUS returned {text}")
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(f"{self.path}.tmp", "w") as f:
+                f.write(text)
+            os.replace(f"{self.path}.tmp", self.path)
+            loaded_at = time.time()
+        rows = _parse_listing(text)
+        if not rows:
+            raise RuntimeError("LISTING_STATUS returned no listings")
+        self.index = await asyncio.to_thread(SymbolIndex, rows)
+        self.loaded_at = loaded_at
+
+    def _reload(self) -> asyncio.Task:
+        if self._loading is None or self._loading.done() or self._loading.get_loop() is not asyncio.get_running_loop():
+            self._loading = asyncio.ensure_future(self._load())
+            self._loading.add_done_callback(_log_failure)
+        return self._loading
+
+    async def search(self, keywords: str) -> Optional[dict]:
+        """
+        Search the local listing, and SYMBOL_SEARCH unless the keywords resolve locally.
+        :return: {"bestMatches": [...]} in the SYMBOL_SEARCH shape, best first, the upstream
+            error payload when nothing matched, or None when no listing is available and
+            the caller should ask upstream.
+        """
+        if self.index is None:
+            try:
+                await asyncio.shield(self._reload())
+            except Exception:
+                return None
+        if time.time() - self.loaded_at > self.max_age:
+            self._reload()
+        offset = datetime.datetime.now(EASTERN).utcoffset() // datetime.timedelta(hours=1)
+        local = [
+            {
+                "1. symbol": row["symbol"],
+                "2. name": row["name"],
+                "3. type": "Equity" if row.get("assetType") == "Stock" else row.get("assetType", ""),
+                "4. region": "United States",
+                "5. marketOpen": MARKET_OPEN.strftime("%H:%M"),
+                "6. marketClose": MARKET_CLOSE.strftime("%H:%M"),
+                "7. timezone": f"UTC{offset:+03d}",
+                "8. currency": "USD",
+                "9. matchScore": f"{score:.4f}",
+            }
+            for row, score in self.index.search(keywords)
+        ]
+        if local and self.index.resolves(keywords):
+            return {"bestMatches": local}
+        try:
+            data = await alphavantage.query({"function": "SYMBOL_SEARCH", "keywords": keywords, "datatype": "json"})
+        except Exception as e:
+            logger.warning("SYMBOL_SEARCH for %r failed: %s", keywords, e)
+            data = None
+        remote = data.get("bestMatches") if isinstance(data, dict) else None
+        if remote is None:
+            if not local and data is not None:
+                return data
+            return {"bestMatches": local}
+        merged = {match["1. symbol"]: match for match in local}
+        # Upstream records win on overlap; they carry the listing's own region and currency.
+        merged.update((match["1. symbol"], match) for match in remote if match.get("1. symbol"))
+        ranked = sorted(merged.values(), key=lambda match: -_score(match))
+        return {"bestMatches": ranked[:MAX_MATCHES]}
+
+
+def _score(match: dict) -> float:
+    try:
+        return float(match.get("9. matchScore", 0))
+    except ValueError:
+        return 0.0
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Symbol listing refresh failed: %s", task.exception())
+
+
+listings = ListingSearch(os.path.join(DATA_DIR, "listing_status.csv"), LISTING_MAX_AGE)
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+
+from . import http_client
+
+SCAN_URL = "https://scanner.tradingview.com/america/scan"
+# How long the downloaded universe is served before it is refreshed in the background.
+UNIVERSE_MAX_AGE = int(os.getenv("UNIVERSE_MAX_AGE", "21600"))
+
+logger = logging.getLogger(__name__)
+
+
+class TickerUniverse:
+    """
+    In-memory list of US tickers partitioned by exchange.
+
+    The TradingView scan is downloaded once and split into one symbol tuple per
+    exchange, so a lookup is a union of precomputed partitions. Once the data is
+    older than `max_age` it keeps being served while one background task reloads it.
+    """
+
+    def __init__(self, url: str, max_age: float):
+        self.url = url
+        self.max_age = max_age
+        self.partitions: dict[str, tuple[str, ...]] = {}
+        self.loaded_at = 0.0
+        self._loading: asyncio.Task | None = None
+
+    async def _load(self) -> None:
+        response = await http_client.get(self.url)
+        response.raise_for_status()
+        partitions = defaultdict(list)
+        for row in response.json()["data"]:  # [{'s': 'NYSE:HKD', 'd': []}, ...]
+            exchange, _, symbol = row["s"].partition(":")
+            partitions[exchange].append(symbol)
+        self.partitions = {exchange: tuple(symbols) for exchange, symbols in partitions.items()}
+        self.loaded_at = time.time()
+
+    def _reload(self) -> asyncio.Task:
+        if self._loading is None or self._loading.done() or self._loading.get_loop() is not asyncio.get_running_loop():
+            self._loading = asyncio.ensure_future(self._load())
+            self._loading.add_done_callback(_log_failure)
+        return self._loading
+
+    async def symbols(self, exchanges) -> list[str]:
+        """
+        Symbols listed on any of the given exchanges.
+        :param exchanges: Exchange codes (e.g. {'NYSE', 'NASDAQ'}), case-insensitive.
+        :return: Symbols in exchange order, without duplicates.
+        """
+        if not self.partitions:
+            await asyncio.shield(self._reload())
+        elif time.time() - self.loaded_at > self.max_age:
+            self._reload()
+        symbols = {}
+        for exchange in dict.fromkeys(exchange.upper() for exchange in exchanges):
+            symbols.update(dict.fromkeys(self.partitions.get(exchange, ())))
+        return list(symbols)
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Ticker universe refresh failed: %s", task.exception())
+
+
+universe = TickerUniverse(SCAN_URL, UNIVERSE_MAX_AGE)
@@ -0,0 +1,145 @@
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Longer speaker turns are split at sentence boundaries into passages of about this many words.
+MAX_PASSAGE_WORDS = 150
+# BM25 term-frequency saturation and document-length normalization.
+BM25_K1 = 1.2
+BM25_B = 0.75
+_STOPWORDS = frozenset(
+    "a about all also an and are as at be been but by can could did do does for from had has have he her his i if in "
+    "into is it its just more most of on or our out over so some than that the their them then there these they this "
+    "those to up us was we were what when which while who will with would you your".split()
+)
+
+
+def tokens(text: str) -> list[str]:
+    """
+    Lower-cased words without stopwords, with plural endings stripped so 'margins' matches 'margin'.
+    """
+    out = []
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 4 and word.endswith("ies"):
+            word = word[:-3] + "y"
+        elif word.endswith(("sses", "xes", "ches", "shes")):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+            word = word[:-1]
+        out.append(word)
+    return out
+
+
+def passages(payload: dict) -> list[dict]:
+    """
+    Split an EARNINGS_CALL_TRANSCRIPT response into passages: one per speaker turn,
+    long turns cut at sentence boundaries into pieces of about MAX_PASSAGE_WORDS words.
+    """
+    out = []
+    for turn in payload.get("transcript", []):
+        content = (turn.get("content") or "").strip()
+        if not content:
+            continue
+        speaker = {"speaker": turn.get("speaker"), "title": turn.get("title"), "sentiment": turn.get("sentiment")}
+        piece, words = [], 0
+        for sentence in re.split(r"(?<=[.!?])\s+", content):
+            count = len(sentence.split())
+            if piece and words + count > MAX_PASSAGE_WORDS:
+                out.append({**speaker, "text": " ".join(piece)})
+                piece, words = [], 0
+            piece.append(sentence)
+            words += count
+        if piece:
+            out.append({**speaker, "text": " ".join(piece)})
+    return out
+
+
+class TranscriptIndex:
+    """
+    BM25 index over the passages of earnings call transcripts.
+
+    Each (symbol, quarter) is added once and its passages get a consecutive range of
+    ids; every term keeps a posting list of (passage id, term frequency). A search
+    scores only the passages that contain a query term, with NumPy over those posting
+    arrays, and restricts them to symbols and quarters by their id ranges.
+    """
+
+    def __init__(self):
+        self.passages: list[dict] = []
+        self._lengths: list[int] = []
+        self._postings: dict[str, tuple[list[int], list[int]]] = defaultdict(lambda: ([], []))
+        self._arrays: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._ranges: dict[tuple[str, str], tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._ranges
+
+    def add(self, symbol: str, quarter: str, payload: dict) -> int:
+        """
+        Index one transcript.
+        :return: Number of passages added (0 if the transcript was already indexed).
+        """
+        chunks = passages(payload)
+        counted = [Counter(tokens(chunk["text"])) for chunk in chunks]
+        with self._lock:
+            if (symbol, quarter) in self._ranges:
+                return 0
+            first = len(self.passages)
+            for chunk, terms in zip(chunks, counted):
+                passage = len(self.passages)
+                self.passages.append({"symbol": symbol, "quarter": quarter, **chunk})
+                self._lengths.append(sum(terms.values()))
+                for term, count in terms.items():
+                    ids, frequencies = self._postings[term]
+                    ids.append(passage)
+                    frequencies.append(count)
+                    self._arrays.pop(term, None)
+            self._ranges[(symbol, quarter)] = (first, len(self.passages))
+        return len(chunks)
+
+    def _posting(self, term: str) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        if term not in self._postings:
+            return None
+        if term not in self._arrays:
+            ids, frequencies = self._postings[term]
+            self._arrays[term] = (np.array(ids, dtype=np.int64), np.array(frequencies, dtype=np.float64))
+        return self._arrays[term]
+
+    def search(self, query: str, symbols: Optional[Sequence[str]] = None, quarters: Optional[Sequence[str]] = None, top_k: int = 5) -> list[dict]:
+        """
+        Passages best matching `query` by BM25, optionally only from some symbols and quarters.
+        :return: Passages (symbol, quarter, speaker, title, sentiment, text) with their score, best first.
+        """
+        with self._lock:
+            n = len(self.passages)
+            if not n:
+                return []
+            lengths = np.array(self._lengths, dtype=np.float64)
+            average = lengths.mean() or 1.0
+            scores = np.zeros(n)
+            for term in set(tokens(query)):
+                posting = self._posting(term)
+                if posting is None:
+                    continue
+                ids, frequencies = posting
+                idf = np.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[ids] / average)
+                scores[ids] += idf * frequencies * (BM25_K1 + 1) / (frequencies + norm)
+            if symbols or quarters:
+                wanted = np.zeros(n, dtype=bool)
+                for (symbol, quarter), (first, last) in self._ranges.items():
+                    if (not symbols or symbol in symbols) and (not quarters or quarter in quarters):
+                        wanted[first:last] = True
+                scores[~wanted] = 0
+            hits = np.flatnonzero(scores)
+            best = hits[np.argsort(-scores[hits], kind="stable")[:top_k]]
+            return [{**self.passages[i], "score": round(float(scores[i]), 3)} for i in best.tolist()]
+
+
+transcripts = TranscriptIndex()
@@ -0,0 +1,76 @@
+import time
+from collections import Counter, OrderedDict
+from typing import Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire at their own deadline.
+
+    The cache holds at most `maxsize` entries and, when `maxbytes` is set, entries
+    whose sizes (as given to `set`) add up to at most `maxbytes`; the least recently
+    used entries are evicted first. Hits and misses are counted overall and per label
+    (e.g. per Alpha Vantage function) so the hit rate of each kind of request can be inspected.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._data: OrderedDict[Hashable, tuple[float, object, int]] = OrderedDict()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, label: str = "", default=None):
+        entry = self._data.get(key)
+        if entry is not None and entry[0] <= time.time():
+            del self._data[key]
+            self.nbytes -= entry[2]
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses[label] += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits[label] += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value, ttl: float, size: int = 0) -> None:
+        """
+        Store a value for `ttl` seconds (values with a TTL of zero or less are not stored).
+        :param size: Approximate size of the value in bytes, counted against `maxbytes`.
+        """
+        if ttl <= 0 or self.maxsize <= 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        previous = self._data.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous[2]
+        self._data[key] = (time.time() + ttl, value, size)
+        self.nbytes += size
+        while len(self._data) > self.maxsize or (self.maxbytes is not None and self.nbytes > self.maxbytes):
+            self.nbytes -= self._data.popitem(last=False)[1][2]
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """
+        Hit/miss counters, overall and per label.
+        """
+        def summary(hits: int, misses: int) -> dict:
+            total = hits + misses
+            return {"hits": hits, "misses": misses, "hit_rate": round(hits / total, 4) if total else None}
+
+        return {
+            **summary(sum(self.hits.values()), sum(self.misses.values())),
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.nbytes,
+            "maxbytes": self.maxbytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "by_label": {name: summary(self.hits[name], self.misses[name]) for name in sorted(self.hits | self.misses)},
+        }
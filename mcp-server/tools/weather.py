@@ -1,13 +1,15 @@
-import requests
+import asyncio
 import datetime
 from zoneinfo import ZoneInfo
+import httpx
 from fastmcp import FastMCP
+from . import http_client
 
 mcp = FastMCP("weather")
 
 
 @mcp.tool()
-def get_current_weather(city: str) -> dict:
+async def get_current_weather(city: str) -> dict:
     """Retrieves the current weather report for a specified city.
 
     Args:
@@ -16,13 +18,13 @@ def get_current_weather(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    return __get_weather_forecast(
+    return await __get_weather_forecast(
         city, datetime.datetime.now(ZoneInfo("UTC")).strftime("%Y-%m-%d")
     )
 
 
 @mcp.tool()
-def get_weather_forecast(city: str, date: str) -> dict:
+async def get_weather_forecast(city: str, date: str) -> dict:
     """Retrieves the weather report for a specified city and specific day.
 
     Args:
@@ -32,17 +34,17 @@ def get_weather_forecast(city: str, date: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    return __get_weather_forecast(city, date)
+    return await __get_weather_forecast(city, date)
 
 
-def __get_weather_forecast(city: str, date: str) -> dict:
+async def __get_weather_forecast(city: str, date: str) -> dict:
     try:
         url = f"https://wttr.in/{city}@{date}?format=j1"
-        response = requests.get(url)
+        response = await http_client.get(url)
         response.raise_for_status()
         weather_data = response.json()
         return {"status": "success", "report": weather_data}
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         return {
             "status": "error",
             "error_message": f"Failed to fetch weather data: {e}",
@@ -52,7 +54,7 @@ def __get_weather_forecast(city: str, date: str) -> dict:
 
 
 @mcp.tool()
-def get_weather_alerts(city: str) -> dict:
+async def get_weather_alerts(city: str) -> dict:
     """Retrieves weather alerts and warnings for a specified city.
 
     Args:
@@ -63,12 +65,12 @@ def get_weather_alerts(city: str) -> dict:
     """
     try:
         url = f"https://wttr.in/{city}?format=j1"
-        response = requests.get(url)
+        response = await http_client.get(url)
         response.raise_for_status()
         weather_data = response.json()
         alerts = weather_data.get("alerts", [])
         return {"status": "success", "alerts": alerts}
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         return {
             "status": "error",
             "error_message": f"Failed to fetch weather alerts: {e}",
@@ -76,7 +78,7 @@ def get_weather_alerts(city: str) -> dict:
 
 
 @mcp.tool()
-def get_extended_forecast(city: str, days: int = 5) -> dict:
+async def get_extended_forecast(city: str, days: int = 5) -> dict:
     """Retrieves extended weather forecast for multiple days.
 
     Args:
@@ -89,12 +91,15 @@ def get_extended_forecast(city: str, days: int = 5) -> dict:
     try:
         forecasts = []
         base_date = datetime.datetime.now(ZoneInfo("UTC"))
-
-        for i in range(days):
-            forecast_date = (base_date + datetime.timedelta(days=i)).strftime(
-                "%Y-%m-%d"
-            )
-            result = __get_weather_forecast(city, forecast_date)
+        forecast_dates = [
+            (base_date + datetime.timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range(days)
+        ]
+        results = await asyncio.gather(
+            *(__get_weather_forecast(city, forecast_date) for forecast_date in forecast_dates)
+        )
+
+        for forecast_date, result in zip(forecast_dates, results):
             if result["status"] == "success":
                 forecasts.append({"date": forecast_date, "weather": result["report"]})
 
@@ -107,7 +112,7 @@ def get_extended_forecast(city: str, days: int = 5) -> dict:
 
 
 @mcp.tool()
-def compare_weather(city1: str, city2: str, date: str) -> dict:
+async def compare_weather(city1: str, city2: str, date: str) -> dict:
     """Compares weather between two cities on a specific date.
 
     Args:
@@ -118,8 +123,9 @@ def compare_weather(city1: str, city2: str, date: str) -> dict:
     Returns:
         dict: status and weather comparison or error msg.
     """
-    weather1 = __get_weather_forecast(city1, date)
-    weather2 = __get_weather_forecast(city2, date)
+    weather1, weather2 = await asyncio.gather(
+        __get_weather_forecast(city1, date), __get_weather_forecast(city2, date)
+    )
 
     if weather1["status"] == "error" or weather2["status"] == "error":
         return {
@@ -134,7 +140,7 @@ def compare_weather(city1: str, city2: str, date: str) -> dict:
 
 
 @mcp.tool()
-def get_weather_by_coordinates(lat: float, lon: float) -> dict:
+async def get_weather_by_coordinates(lat: float, lon: float) -> dict:
     """Retrieves current weather by geographic coordinates.
 
     Args:
@@ -146,11 +152,11 @@ def get_weather_by_coordinates(lat: float, lon: float) -> dict:
     """
     try:
         url = f"https://wttr.in/{lat},{lon}?format=j1"
-        response = requests.get(url)
+        response = await http_client.get(url)
         response.raise_for_status()
         weather_data = response.json()
         return {"status": "success", "report": weather_data}
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         return {
             "status": "error",
             "error_message": f"Failed to fetch weather data: {e}",